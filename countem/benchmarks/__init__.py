@@ -0,0 +1,11 @@
+'''
+    Benchmark suite for the countem package
+
+    Times construction, updates, subtract, the | and + operators, most_common, multi_mode,
+    get_by_path and find_most_repeated over uniform, Zipf and all-unique keys, each
+    against the equivalent with collections.Counter.
+
+    Run with: python -m countem.benchmarks --help
+'''
+from ._distributions import DISTRIBUTIONS
+from ._suite import CASES, run_suite, check_regressions
@@ -0,0 +1,79 @@
+'''
+    Command line for the benchmark suite, printing a table of results, writing them as
+    JSON and exiting with status 1 on a regression against a baseline.
+
+    e.g.    python -m countem.benchmarks --output results.json
+            python -m countem.benchmarks --save-baseline
+'''
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from . import CASES, DISTRIBUTIONS, run_suite, check_regressions
+
+DEFAULT_BASELINE = Path(__file__).with_name('baseline.json')
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    ''' return the parsed command line arguments '''
+    parser = argparse.ArgumentParser(prog='python -m countem.benchmarks', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--distributions', nargs='+', choices=DISTRIBUTIONS,
+                        default=list(DISTRIBUTIONS))
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=list(CASES))
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs, the best is kept')
+    parser.add_argument('--output', type=Path, help='write the results to this JSON file')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help='JSON results to check for regressions against')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='the fraction slower than the baseline which is a regression')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='write the results to the baseline rather than checking them')
+
+    return parser.parse_args(argv)
+
+
+def print_table(results: list) -> None:
+    ''' print a row for each result '''
+    print(f'{"case":<20} {"distribution":<12} {"size":>9} {"Countem":>11} '
+          f'{"Counter":>11} {"relative":>9}')
+
+    for result in results:
+        counter_seconds = result['counter_seconds']
+        counter = f'{counter_seconds * 1e3:9.3f}ms' if counter_seconds else f'{"-":>11}'
+        relative = f'{result["relative"]:8.2f}x' if result['relative'] else f'{"-":>9}'
+        print(f'{result["case"]:<20} {result["distribution"]:<12} {result["size"]:>9,} '
+              f'{result["seconds"] * 1e3:9.3f}ms {counter} {relative}')
+
+
+def main(argv: list) -> int:
+    ''' run the suite, returning the exit status '''
+    args = parse_args(argv)
+    results = run_suite(args.sizes, args.distributions, args.cases, args.repeat)
+    print_table(results)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2), encoding='utf-8')
+        print(f'saved the baseline to {args.baseline}')
+        return 0
+
+    if not args.baseline.exists():
+        print(f'no baseline at {args.baseline}, run with --save-baseline to create one')
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+    regressions = check_regressions(results, baseline, args.tolerance)
+
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
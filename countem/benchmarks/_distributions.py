@@ -0,0 +1,45 @@
+''' Internal module of the key distributions the benchmarks are run over '''
+
+import random
+from itertools import accumulate
+from typing import Callable, Dict, List
+
+__all__ = ['DISTRIBUTIONS', 'uniform', 'zipf', 'all_unique']
+
+# distinct keys as a fraction of the elements, for uniform and Zipf
+KEYS_PER_ELEMENT = 0.1
+
+# the exponent of the Zipf distribution, word frequencies in text are close to 1
+ZIPF_EXPONENT = 1.1
+
+
+def _keys(count: int) -> List[str]:
+    '''return count distinct string keys'''
+    return [f'key-{i}' for i in range(count)]
+
+
+def uniform(size: int, seed: int = 0) -> List[str]:
+    '''return size elements drawn uniformly from size * KEYS_PER_ELEMENT keys'''
+    keys = _keys(max(1, int(size * KEYS_PER_ELEMENT)))
+    return random.Random(seed).choices(keys, k=size)
+
+
+def zipf(size: int, seed: int = 0) -> List[str]:
+    '''return size elements with Zipf distributed frequencies, a few keys very common'''
+    keys = _keys(max(1, int(size * KEYS_PER_ELEMENT)))
+    cum_weights = list(accumulate(1 / rank ** ZIPF_EXPONENT for rank in range(1, len(keys) + 1)))
+    return random.Random(seed).choices(keys, cum_weights=cum_weights, k=size)
+
+
+def all_unique(size: int, seed: int = 0) -> List[str]:
+    '''return size distinct elements in a random order'''
+    keys = _keys(size)
+    random.Random(seed).shuffle(keys)
+    return keys
+
+
+DISTRIBUTIONS: Dict[str, Callable[[int, int], List[str]]] = {
+    'uniform': uniform,
+    'zipf': zipf,
+    'all_unique': all_unique,
+}
@@ -0,0 +1,207 @@
+''' Internal module of the benchmark cases and the functions to run and compare them '''
+# pylint: disable=missing-function-docstring
+
+from collections import Counter
+from timeit import Timer
+from typing import Callable, Dict, Iterable, List, Tuple
+from countem.src import Countem, get_by_path
+from countem.src.find_most_repeated import find_most_repeated
+from ._distributions import DISTRIBUTIONS
+
+__all__ = ['CASES', 'run_suite', 'check_regressions']
+
+# seconds each timed repeat should take, so that fast cases are run many times
+TARGET_SECONDS = 0.02
+
+
+def _counter_most_repeated(elems: List) -> Dict:
+    '''find_most_repeated written with collections.Counter, for reference'''
+    counts = Counter(elems)
+    maxcount = max(counts.values(), default=None)
+
+    if not maxcount or maxcount < 2:
+        return {'elements': [], 'repeats': None}
+
+    return {'elements': [k for k, v in counts.items() if v == maxcount], 'repeats': maxcount}
+
+
+def _counter_multi_mode(counts: Counter) -> Tuple:
+    '''the multi_mode of a collections.Counter, for reference'''
+    maxcount = max(counts.values())
+    return tuple(k for k, v in counts.items() if v == maxcount)
+
+
+def _halves(data: List) -> Tuple[List, List]:
+    '''return the two halves of data'''
+    middle = len(data) // 2
+    return data[:middle], data[middle:]
+
+
+# Each case takes the elements and returns (countem, reference) functions to time,
+# where the reference is the equivalent with collections.Counter, or None
+Case = Callable[[List], Tuple[Callable, Callable|None]]
+
+
+def _construct(data: List) -> Tuple:
+    return (lambda: Countem(data)), (lambda: Counter(data))
+
+
+def _update_iterable(data: List) -> Tuple:
+    first, second = _halves(data)
+    countem, counter = Countem(first), Counter(first)
+    return (lambda: countem.copy().update(second)), (lambda: counter.copy().update(second))
+
+
+def _update_mapping(data: List) -> Tuple:
+    first, second = _halves(data)
+    countem, counter = Countem(first), Counter(first)
+    other_countem, other_counter = Countem(second), Counter(second)
+    return (lambda: countem.copy().update(other_countem)), \
+        (lambda: counter.copy().update(other_counter))
+
+
+def _subtract(data: List) -> Tuple:
+    first, second = _halves(data)
+    countem, counter = Countem(first), Counter(first)
+    other_countem, other_counter = Countem(second), Counter(second)
+    return (lambda: countem.copy().subtract(other_countem)), \
+        (lambda: counter.copy().subtract(other_counter))
+
+
+def _union(data: List) -> Tuple:
+    first, second = _halves(data)
+    left, right = Countem(first), Countem(second)
+    left_counter, right_counter = Counter(first), Counter(second)
+    return (lambda: left | right), (lambda: left_counter | right_counter)
+
+
+def _addition(data: List) -> Tuple:
+    first, second = _halves(data)
+    left, right = Countem(first), Countem(second)
+    left_counter, right_counter = Counter(first), Counter(second)
+    return (lambda: left + right), (lambda: left_counter + right_counter)
+
+
+def _most_common_10(data: List) -> Tuple:
+    countem, counter = Countem(data), Counter(data)
+    return (lambda: countem.most_common(10)), (lambda: counter.most_common(10))
+
+
+def _most_common_all(data: List) -> Tuple:
+    countem, counter = Countem(data), Counter(data)
+    return countem.most_common, counter.most_common
+
+
+def _multi_mode(data: List) -> Tuple:
+    countem, counter = Countem(data), Counter(data)
+    return countem.multi_mode, (lambda: _counter_multi_mode(counter))
+
+
+def _get_by_path(data: List) -> Tuple:
+    records = [{'request': {'key': key}} for key in data]
+    accessor = get_by_path('request', 'key')
+    return (lambda: Countem(map(accessor, records))), \
+        (lambda: Counter(record['request']['key'] for record in records))
+
+
+def _count_by(data: List) -> Tuple:
+    records = [{'request': {'key': key}} for key in data]
+    return (lambda: Countem.count_by(records, 'request', 'key')), \
+        (lambda: Counter(record['request']['key'] for record in records))
+
+
+def _find_most_repeated(data: List) -> Tuple:
+    return (lambda: find_most_repeated(data)), (lambda: _counter_most_repeated(data))
+
+
+CASES: Dict[str, Case] = {
+    'construct': _construct,
+    'update_iterable': _update_iterable,
+    'update_mapping': _update_mapping,
+    'subtract': _subtract,
+    'union': _union,
+    'addition': _addition,
+    'most_common_10': _most_common_10,
+    'most_common_all': _most_common_all,
+    'multi_mode': _multi_mode,
+    'get_by_path': _get_by_path,
+    'count_by': _count_by,
+    'find_most_repeated': _find_most_repeated,
+}
+
+
+def _best_time(func: Callable, repeat: int) -> float:
+    '''return the best seconds per call of func over repeat timed runs'''
+    timer = Timer(func)
+    single = max(timer.timeit(1), 1e-7)
+    number = max(1, int(TARGET_SECONDS / single))
+
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run_suite(
+    sizes: Iterable[int],
+    distributions: Iterable[str] = tuple(DISTRIBUTIONS),
+    cases: Iterable[str] = tuple(CASES),
+    repeat: int = 5
+) -> List[Dict]:
+    '''
+    Time every case over every distribution and size
+
+    Returns: a list of results, each a dictionary of the case, distribution, size,
+    seconds per call, the seconds for collections.Counter and the ratio of the two
+    '''
+    results = []
+
+    for distribution in distributions:
+        for size in sizes:
+            data = DISTRIBUTIONS[distribution](size)
+
+            for case in cases:
+                countem_func, reference_func = CASES[case](data)
+                seconds = _best_time(countem_func, repeat)
+                counter_seconds = None if reference_func is None \
+                    else _best_time(reference_func, repeat)
+
+                results.append({
+                    'case': case,
+                    'distribution': distribution,
+                    'size': size,
+                    'seconds': seconds,
+                    'counter_seconds': counter_seconds,
+                    'relative': counter_seconds and seconds / counter_seconds,
+                })
+
+    return results
+
+
+def _result_key(result: Dict) -> Tuple:
+    '''return the key identifying a result across runs'''
+    return result['case'], result['distribution'], result['size']
+
+
+def check_regressions(results: List[Dict], baseline: List[Dict], tolerance: float) -> List[str]:
+    '''
+    Compare results against a baseline, returning a message for each regression
+
+    Results are compared on their time relative to collections.Counter where there is
+    one, which holds across machines far better than seconds, otherwise on seconds.
+    A result regresses when it is more than tolerance slower, 0.25 for 25%.
+    '''
+    baseline_results = {_result_key(result): result for result in baseline}
+    regressions = []
+
+    for result in results:
+        previous = baseline_results.get(_result_key(result))
+        if previous is None:
+            continue
+
+        metric = 'relative' if result['relative'] and previous['relative'] else 'seconds'
+        if result[metric] > previous[metric] * (1 + tolerance):
+            case, distribution, size = _result_key(result)
+            regressions.append(
+                f'{case} ({distribution}, {size:,}): {metric} {result[metric]:.4g} '
+                f'against a baseline of {previous[metric]:.4g}'
+            )
+
+    return regressions
@@ -1,3 +1,12 @@
 # pylint: disable=missing-module-docstring
 from .internals._countem import Countem
-from .internals._path_accessors import get_by_path
+from .internals._indexed_countem import IndexedCountem
+from .internals._approx_countem import ApproxCountem
+from .internals._dense_countem import DenseCountem
+from .internals._windowed_countem import WindowedCountem
+from .internals._decaying_countem import DecayingCountem
+from .internals._concurrent_countem import ConcurrentCountem
+from .internals._shared_countem import SharedCountem
+from .internals._snapshot import SnapshotCountem
+from .internals._path_accessors import get_by_path, extract_column
+from .internals._streaming import count_file
@@ -0,0 +1,61 @@
+'''
+    Throughput of many threads counting into one shared counter, ConcurrentCountem
+    against a Countem behind a single global lock, as the number of threads increases.
+
+    On a free-threaded build of Python threads run in parallel and, as each counts into
+    a buffer of its own, throughput scales with the threads. With the GIL the threads
+    take turns, so throughput stays flat for both.
+
+    Run with: python -m countem.src.examples_concurrent_countem [elements per thread]
+'''
+
+import sys
+import random
+from threading import Lock, Thread
+from timeit import default_timer as timer
+from . import ConcurrentCountem, Countem
+
+
+class LockedCountem:  # pylint: disable=too-few-public-methods
+    ''' a Countem behind one global lock, the approach ConcurrentCountem replaces '''
+    def __init__(self) -> None:
+        self.counts, self.lock = Countem(), Lock()
+
+    def update(self, iterable) -> None:
+        ''' update the Countem holding the global lock '''
+        with self.lock:
+            self.counts.update(iterable)
+
+
+def run_threads(counter, batches: list, num_threads: int) -> float:
+    ''' return the seconds for num_threads threads to each update counter with batches '''
+    def produce():
+        for batch in batches:
+            counter.update(batch)
+
+    threads = [Thread(target=produce) for _ in range(num_threads)]
+    start = timer()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return timer() - start
+
+
+if __name__ == '__main__':
+    per_thread = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    batch_size = 1000
+    keys = [f'key-{i}' for i in range(10_000)]
+    elements = random.choices(keys, k=per_thread)
+    thread_batches = [elements[i:i + batch_size] for i in range(0, per_thread, batch_size)]
+
+    # sys._is_gil_enabled is only defined from Python 3.13
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'GIL enabled: {is_gil_enabled}, {per_thread:,} elements a thread')
+
+    for count_threads in (1, 2, 4, 8):
+        total = per_thread * count_threads
+        for label, factory in (('global lock', LockedCountem), ('buffered', ConcurrentCountem)):
+            seconds = min(run_threads(factory(), thread_batches, count_threads) for _ in range(3))
+            print(f'  {count_threads} threads, {label:<12} {total / seconds / 1e6:.2f}M elements/s')
@@ -0,0 +1,45 @@
+'''
+    Memory and time comparison of DenseCountem against Countem for a counter keyed
+    by small integers, such as status codes or till numbers.
+
+    Run with: python -m countem.src.examples_dense_countem
+'''
+
+import random
+import tracemalloc
+from timeit import default_timer as timer
+from . import Countem, DenseCountem
+
+
+def measure(factory, *args) -> tuple:
+    ''' return the counter built by factory, the bytes it allocated and the seconds taken '''
+    tracemalloc.start()
+    start = timer()
+    counter = factory(*args)
+    seconds = timer() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return counter, allocated, seconds
+
+
+if __name__ == '__main__':
+    num_keys = 500_000
+    keys = list(range(num_keys)) + [random.randrange(num_keys) for _ in range(num_keys)]
+    random.shuffle(keys)
+    # keys parsed from text, as from a log, are new int objects kept alive by a dictionary
+    lines = list(map(str, keys))
+
+    countem, countem_bytes, _ = measure(lambda: Countem(map(int, lines)))
+    dense, dense_bytes, _ = measure(lambda: DenseCountem(map(int, lines)))
+
+    print(f'{num_keys:,} keys')
+    print(f'  Countem:      {countem_bytes / num_keys:.1f} bytes a key')
+    print(f'  DenseCountem: {dense_bytes / num_keys:.1f} bytes a key, '
+          f'{dense.nbytes / num_keys:.1f} in its array buffers')
+
+    for label, counted in (('Countem', countem), ('DenseCountem', dense)):
+        began = timer()
+        counted.max()
+        counted.multi_mode()
+        print(f'  {label} max and multi_mode: {timer() - began:.4f}s')
@@ -1,6 +1,21 @@
 ''' Examples of the find_most_repeated function utilising the Countem class '''
 
-from .find_most_repeated import find_most_repeated
+import random
+from timeit import timeit
+from . import Countem
+from .find_most_repeated import find_most_repeated, top_k_repeated
+
+
+def counted_most_repeated(elems) -> dict:
+    ''' the previous find_most_repeated, a full count followed by max and multi_mode '''
+    counts = Countem(elems)
+    maxcount = counts.max()
+
+    if not maxcount or maxcount < 2:
+        return { 'elements': [], 'repeats': None }
+
+    return { 'elements': list(counts.multi_mode()), 'repeats': maxcount }
+
 
 if __name__ == '__main__':
     # Examples
@@ -15,3 +30,25 @@ if __name__ == '__main__':
 
     print(find_most_repeated(['a', 'b', 'b', 3, 'c', 3, 'c', 3, 'b']))
     # {'elements': ['b', 3], 'repeats': 3}
+
+    print(find_most_repeated(x % 4 for x in range(10)))
+    # {'elements': [0, 1], 'repeats': 3}
+
+    print(find_most_repeated('aabbb', min_repeats=4))
+    # {'elements': [], 'repeats': None}
+
+    print(top_k_repeated(['a', 'b', 'b', 3, 'c', 3, 'c', 3, 'b'], 2))
+    # [('b', 3), (3, 3)]
+
+    # Timings against a full count, for a clear leader and for near uniform elements
+    size = 1_000_000
+    inputs = {
+        'clear leader': random.choices(range(1000), weights=[2000] + [1] * 999, k=size),
+        'near uniform': [random.randrange(100_000) for _ in range(size)]
+    }
+
+    for label, elements in inputs.items():
+        print(f'{label}, {size:,} elements')
+        for func in (counted_most_repeated, find_most_repeated):
+            seconds = min(timeit(lambda f=func, e=elements: f(e), number=1) for _ in range(3))
+            print(f'  {func.__name__:<24} {seconds:.4f}s')
@@ -0,0 +1,56 @@
+'''
+    Time comparison of polling max() and multi_mode() on a live counter, Countem
+    scanning every value against IndexedCountem reading its count index, and of
+    rank and quantile queries against sorting with most_common().
+
+    Run with: python -m countem.src.examples_indexed_countem
+'''
+
+import timeit
+import random
+from . import Countem, IndexedCountem
+
+
+def rank_by_sorting(counter, key) -> int:
+    ''' the rank of key by count from a full most_common() sort '''
+    count = counter[key]
+    return 1 + sum(1 for _, other in counter.most_common() if other > count)
+
+
+def quantile_by_sorting(counter, q: float) -> int:
+    ''' the count at quantile q by nearest rank from a full most_common() sort '''
+    ascending = [count for _, count in reversed(counter.most_common())]
+    return ascending[max(1, -(-int(q * 100) * len(ascending) // 100)) - 1]
+
+
+def poll(counter, events: list) -> None:
+    ''' apply each event to the counter, reading the current modes after each one '''
+    for event in events:
+        counter.update((event,))
+        counter.max()
+        counter.multi_mode()
+
+
+if __name__ == '__main__':
+    keys = [random.randint(1, 100_000) for _ in range(200_000)]
+    live_events = [random.randint(1, 100_000) for _ in range(1000)]
+
+    countem, indexed = Countem(keys), IndexedCountem(keys)
+    print(set(countem.multi_mode()) == set(indexed.multi_mode()))     # True
+
+    print('Countem:       ', timeit.timeit(lambda: poll(countem, live_events), number=1))
+    print('IndexedCountem:', timeit.timeit(lambda: poll(indexed, live_events), number=1))
+
+    print('build Countem:       ', timeit.timeit(lambda: Countem(keys), number=1))
+    print('build IndexedCountem:', timeit.timeit(lambda: IndexedCountem(keys), number=1))
+
+    probe = keys[0]
+    print(rank_by_sorting(countem, probe) == indexed.rank(probe))     # True
+    print(quantile_by_sorting(countem, 0.99) == indexed.quantile(0.99))  # True
+
+    print('rank and quantile by sorting:', timeit.timeit(
+        lambda: (rank_by_sorting(countem, probe), quantile_by_sorting(countem, 0.99)), number=10
+    ))
+    print('rank and quantile, indexed:  ', timeit.timeit(
+        lambda: (indexed.rank(probe), indexed.quantile(0.99)), number=10
+    ))
@@ -0,0 +1,52 @@
+'''
+    Time comparison of merging two 1M key counters with update, subtract, +, - and |,
+    and of merge_many, against collections.Counter.
+
+    Run with: python -m countem.src.examples_merge [number of keys]
+'''
+
+import sys
+import timeit
+import random
+from collections import Counter
+from functools import reduce
+from operator import add
+from . import Countem
+
+
+def time_call(func, *args, number: int=1) -> float:
+    ''' time number calls of func with the given arguments '''
+    return timeit.timeit(lambda: func(*args), number=number)
+
+
+def in_place(method: str):
+    ''' returns a function calling method on a copy of its first argument '''
+    return lambda counter, other: getattr(counter.copy(), method)(other)
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    # half of the keys overlap between the two counters
+    left = {key: random.randint(1, 100) for key in range(size)}
+    right = {key: random.randint(1, 100) for key in range(size // 2, size + size // 2)}
+
+    countems = Countem(left), Countem(right)
+    counters = Counter(left), Counter(right)
+
+    print(f'{size:,} keys per counter')
+
+    for label, operation in (
+        ('copy + update', in_place('update')),
+        ('copy + subtract', in_place('subtract')),
+        ('+', add),
+        ('-', lambda counter, other: counter - other),
+        ('|', lambda counter, other: counter | other)
+    ):
+        print(f'  {label}: Countem {time_call(operation, *countems):.3f}s, '
+              f'Counter {time_call(operation, *counters):.3f}s')
+
+    parts = [Countem(random.choices(range(size), k=size // 10)) for _ in range(10)]
+    counter_parts = [Counter(part) for part in parts]
+
+    print(f'  merge_many of 10: Countem {time_call(Countem.merge_many, parts):.3f}s, '
+          f'Counter sum {time_call(reduce, add, counter_parts):.3f}s')
@@ -0,0 +1,43 @@
+'''
+    Time comparison of Countem.most_common(n) against collections.Counter.most_common(n)
+    for counters of 10^4, 10^6 and 10^7 keys.
+
+    Run with: python -m countem.src.examples_most_common [max number of keys]
+'''
+
+import sys
+import timeit
+import random
+from collections import Counter
+from . import Countem
+
+SIZES = (10**4, 10**6, 10**7)
+
+
+def make_counts(num_keys: int) -> dict:
+    ''' returns a dictionary of num_keys keys with random counts '''
+    return {key: random.randint(1, 1000) for key in range(num_keys)}
+
+
+def time_call(func, *args, number: int=1) -> float:
+    ''' time number calls of func with the given arguments '''
+    return timeit.timeit(lambda: func(*args), number=number)
+
+
+if __name__ == '__main__':
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZES[-1]
+
+    for size in (size for size in SIZES if size <= max_size):
+        counts = make_counts(size)
+        countem, counter = Countem(counts), Counter(counts)
+        repeat = max(1, 10**6 // size)
+
+        print(f'\n{size:,} keys ({repeat} runs)')
+
+        for n in (10, size // 100, size // 10, None):
+            countem_time = time_call(countem.most_common, n, number=repeat)
+            counter_time = time_call(counter.most_common, n, number=repeat)
+            print(f'  most_common({n}): Countem {countem_time:.4f}s, Counter {counter_time:.4f}s')
+
+        repr_time = time_call(repr, countem, number=repeat)
+        print(f'  repr: Countem {repr_time:.4f}s')
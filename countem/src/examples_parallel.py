@@ -0,0 +1,44 @@
+'''
+    Scaling of Countem.from_parallel across processes, counting a list of tokens
+    and the lines of a file, against the serial Countem(iterable).
+
+    Run with: python -m countem.src.examples_parallel [number of tokens]
+'''
+
+import os
+import sys
+import random
+import tempfile
+from pathlib import Path
+from timeit import default_timer as timer
+from . import Countem
+
+
+def time_count(func, *args, **kwargs) -> float:
+    ''' return the seconds taken by a single call of func '''
+    start = timer()
+    func(*args, **kwargs)
+    return timer() - start
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    tokens = [f'token{random.randint(1, 100_000)}' for _ in range(size)]
+    worker_counts = [n for n in (1, 2, 4, 8, 16) if n <= (os.cpu_count() or 1)]
+
+    print(f'{size:,} tokens, {os.cpu_count()} cores')
+    print(f'serial Countem: {time_count(Countem, tokens):.2f}s')
+
+    for workers in worker_counts:
+        print(f'  list, {workers} workers: '
+              f'{time_count(Countem.from_parallel, tokens, workers=workers):.2f}s')
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'tokens.txt'
+        path.write_text('\n'.join(tokens), encoding='utf-8')
+
+        print(f'serial file: {time_count(lambda: Countem(path.read_text().splitlines())):.2f}s')
+
+        for workers in worker_counts:
+            print(f'  file, {workers} workers: '
+                  f'{time_count(Countem.from_parallel, path, workers=workers):.2f}s')
@@ -0,0 +1,58 @@
+'''
+    Timing comparison of counting a nested field of many records with the original
+    looping get_by_path closure, the compiled get_by_path, extract_column and
+    Countem.count_by.
+
+    Run with: python -m countem.src.examples_path_accessors [number of records]
+'''
+
+import sys
+import random
+from timeit import timeit
+from . import Countem, get_by_path, extract_column
+
+
+def looping_get_by_path(*path, default=None):
+    ''' the original get_by_path, a try/except for every key of the path '''
+    def get_by_path_from(obj):
+        value = obj
+        for key in path:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                return default
+        return value
+
+    return get_by_path_from
+
+
+def time_call(label: str, func, repeat: int = 5) -> None:
+    ''' print the best time of func over repeat runs '''
+    seconds = min(timeit(func, number=1) for _ in range(repeat))
+    print(f'  {label:<40} {seconds:.4f}s')
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    statuses = ['ok', 'error', 'timeout', 'retry']
+    records = [
+        {'request': {'response': {'status': random.choice(statuses)}}}
+        for _ in range(size)
+    ]
+    status_path = ('request', 'response', 'status')
+
+    print(f'{size:,} records, path of {len(status_path)} keys')
+    time_call('Countem(map(looping get_by_path))',
+              lambda: Countem(map(looping_get_by_path(*status_path), records)))
+    time_call('Countem(map(compiled get_by_path))',
+              lambda: Countem(map(get_by_path(*status_path), records)))
+    time_call('Countem(extract_column)', lambda: Countem(extract_column(records, *status_path)))
+    time_call('Countem.count_by', lambda: Countem.count_by(records, *status_path))
+
+    # one record in a thousand lacks the path, so every chunk falls back to get_by_path
+    for i in range(0, size, 1000):
+        records[i] = {}
+
+    print('with records missing the path:')
+    time_call('Countem.count_by, list', lambda: Countem.count_by(records, *status_path))
+    time_call('Countem.count_by, iterator', lambda: Countem.count_by(iter(records), *status_path))
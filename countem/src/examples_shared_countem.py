@@ -0,0 +1,59 @@
+'''
+    Time to aggregate the counts of worker processes, returning a Countem from each
+    worker to be pickled back and merged, against every worker updating one
+    SharedCountem in place.
+
+    Run with: python -m countem.src.examples_shared_countem [number of elements]
+'''
+
+import sys
+import random
+from concurrent.futures import ProcessPoolExecutor
+from timeit import default_timer as timer
+from . import Countem, SharedCountem
+
+
+def count_returned(words: list) -> Countem:
+    ''' count in the worker, returning the Countem to be pickled back '''
+    return Countem(words)
+
+
+# the SharedCountem each worker attaches to once, as a long-lived worker would
+worker_state = {}
+
+
+def attach_worker(name: str) -> None:
+    ''' attach the worker process to the shared counter '''
+    worker_state['shared'] = SharedCountem.attach(name)
+
+
+def count_shared(words: list) -> None:
+    ''' count in the worker, updating the shared counter in place '''
+    worker_state['shared'].update(words)
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    keys = [f'key-{i}' for i in range(50_000)]
+    elements = random.choices(keys, k=size)
+    chunks = [elements[i:i + 100_000] for i in range(0, size, 100_000)]
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        start = timer()
+        merged = Countem.merge_many(executor.map(count_returned, chunks))
+        print(f'returned and merged:   {timer() - start:.3f}s')
+
+    with SharedCountem(capacity=len(keys)) as shared:
+        with ProcessPoolExecutor(4, initializer=attach_worker, initargs=(shared.name,)) as pool:
+            # start the workers, so that attaching is not timed
+            list(pool.map(count_shared, [[]] * 4))
+            start = timer()
+            list(pool.map(count_shared, chunks))
+            print(f'updated in place:      {timer() - start:.3f}s')
+
+        start = timer()
+        shared.most_common(5)
+        print(f'shared most_common(5): {timer() - start:.4f}s')
+
+        assert shared == merged
+        shared.unlink()
@@ -0,0 +1,65 @@
+'''
+    Time and memory comparison of checkpointing a large Countem with pickle against
+    a binary snapshot opened with mmap.
+
+    Run with: python -m countem.src.examples_snapshot [number of keys]
+'''
+
+import os
+import sys
+import pickle
+import tempfile
+import tracemalloc
+from timeit import default_timer as timer
+from . import Countem
+
+
+def measure(func, *args) -> tuple:
+    ''' return the result of func, the peak bytes it allocated and the seconds taken '''
+    tracemalloc.start()
+    start = timer()
+    result = func(*args)
+    seconds = timer() - start
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, peak_bytes, seconds
+
+
+def load_pickle(pickle_file: str) -> Countem:
+    ''' return the Countem pickled in pickle_file '''
+    with open(pickle_file, 'rb') as file:
+        return pickle.load(file)
+
+
+if __name__ == '__main__':
+    num_keys = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    counted = Countem({f'user-{i}': i % 1000 + 1 for i in range(num_keys)})
+
+    with tempfile.TemporaryDirectory() as directory:
+        pickle_path = os.path.join(directory, 'counts.pickle')
+        snapshot_path = os.path.join(directory, 'counts.cntm')
+
+        with open(pickle_path, 'wb') as output:
+            pickle.dump(counted, output, protocol=pickle.HIGHEST_PROTOCOL)
+        counted.save(snapshot_path)
+
+        print(f'{num_keys:,} keys')
+        for label, path in (('pickle', pickle_path), ('snapshot', snapshot_path)):
+            print(f'  {label} file: {os.path.getsize(path) / 2**20:.1f}MB')
+
+        _, peak, elapsed = measure(load_pickle, pickle_path)
+        print(f'  pickle load: {elapsed:.3f}s, {peak / 2**20:.1f}MB peak')
+
+        for mmap in (False, True):
+            snapshot, peak, elapsed = measure(Countem.open, snapshot_path, mmap)
+            print(f'  snapshot open (mmap={mmap}): {elapsed:.3f}s, {peak / 2**20:.1f}MB peak')
+
+        began = timer()
+        for i in range(0, num_keys, 97):
+            _ = snapshot[f'user-{i}']
+        print(f'  {len(range(0, num_keys, 97)):,} mmap lookups: {timer() - began:.3f}s')
+
+        _, peak, elapsed = measure(snapshot.most_common, 10)
+        print(f'  mmap most_common(10): {elapsed:.3f}s, {peak / 2**20:.1f}MB peak')
+        snapshot.close()
@@ -0,0 +1,60 @@
+'''
+    Throughput of counting fields from a JSON lines file with count_file, streamed in
+    bounded chunks, against loading every record into a list before counting.
+
+    Run with: python -m countem.src.examples_streaming [number of records]
+'''
+
+import os
+import sys
+import json
+import random
+import tempfile
+from timeit import default_timer as timer
+from . import Countem, count_file
+
+
+def load_and_count(jsonl_path: str) -> tuple:
+    ''' the approach count_file replaces, every record held in a list '''
+    with open(jsonl_path, encoding='utf-8') as file:
+        records = [json.loads(line) for line in file]
+
+    return (Countem.count_by(records, 'response', 'status'),
+            Countem.count_by(records, 'host'))
+
+
+def report(label: str, size_bytes: int, func, *args) -> None:
+    ''' print the throughput of func in MB/s '''
+    start = timer()
+    func(*args)
+    seconds = timer() - start
+    print(f'  {label:<36} {seconds:.3f}s  {size_bytes / 2**20 / seconds:.1f}MB/s')
+
+
+if __name__ == '__main__':
+    num_records = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    hosts = [f'host-{i}.example.com' for i in range(50)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'access.jsonl')
+
+        with open(path, 'w', encoding='utf-8') as output:
+            for i in range(num_records):
+                record = {
+                    'host': random.choice(hosts),
+                    'path': f'/items/{random.randrange(10_000)}',
+                    'response': {'status': random.choice((200, 200, 200, 404, 500))}
+                }
+                output.write(json.dumps(record) + '\n')
+
+        size = os.path.getsize(path)
+        print(f'{num_records:,} records, {size / 2**20:.1f}MB')
+
+        report('load into a list, then count', size, load_and_count, path)
+        report('count_file, 1 process', size, count_file, path, ('response', 'status'), 'host')
+
+        workers = os.cpu_count() or 1
+        if workers > 1:
+            report(f'count_file, {workers} processes', size, lambda: count_file(
+                path, ('response', 'status'), 'host', workers=workers
+            ))
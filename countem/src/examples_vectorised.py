@@ -0,0 +1,42 @@
+'''
+    Time comparison of counting integer NumPy arrays with the vectorised path against
+    counting the array converted to a list of Python ints, up to 10^8 elements. Sparse
+    keys which are nearly all distinct are counted as a list by the vectorised path too.
+
+    Run with: python -m countem.src.examples_vectorised [max number of elements]
+'''
+
+import sys
+from timeit import default_timer as timer
+import numpy as np
+from . import Countem
+from .find_most_repeated import find_most_repeated
+
+SIZES = (10**6, 10**7, 10**8)
+
+# counting a list is only timed up to this size
+MAX_LIST_SIZE = 10**7
+
+
+def time_call(func, *args) -> float:
+    ''' return the seconds taken by a single call of func '''
+    start = timer()
+    func(*args)
+    return timer() - start
+
+
+if __name__ == '__main__':
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else SIZES[-1]
+    rng = np.random.default_rng(0)
+
+    for size in (size for size in SIZES if size <= max_size):
+        print(f'\n{size:,} elements')
+
+        for label, high in (('dense keys', 1000), ('sparse keys', 2**40)):
+            values = rng.integers(0, high, size=size, dtype=np.int64)
+            print(f'  {label} vectorised:          {time_call(Countem, values):.2f}s')
+            print(f'  {label} find_most_repeated:  {time_call(find_most_repeated, values):.2f}s')
+
+            if size <= MAX_LIST_SIZE:
+                as_list = time_call(lambda values=values: Countem(values.tolist()))
+                print(f'  {label} tolist:              {as_list:.2f}s')
@@ -1,29 +1,137 @@
 """
-Utilising a custom Countem class the find_most_repeated function finds the 
+Utilising a custom Countem class the find_most_repeated function finds the
 most repeated elements in a list and the number of times they repeat
 """
 
-from typing import List, Dict
-from . import Countem
+from typing import Dict, Iterable, List, Tuple
+from collections.abc import Sequence
+from heapq import nlargest
+from itertools import compress, islice
+from operator import countOf, itemgetter
+from .internals._counting import as_counts, count_elements
+from .internals._vectorised import as_numeric_array
 
-def find_most_repeated(elems: List) -> Dict:
+def _count_all(elems: Iterable) -> Dict:
+    '''return a dictionary of the counts of every element'''
+    if as_numeric_array(elems) is not None:
+        return as_counts(elems)
+
+    counts = {}
+    count_elements(counts, elems)
+    return counts
+
+
+def _count_from(elems: Sequence, value, start: int) -> int:
+    '''return the number of times value occurs in a sequence from index start on'''
+    if isinstance(elems, (str, bytes, bytearray)):
+        return elems.count(value, start)
+
+    # islice skips to start without copying the rest of the sequence, as a slice would
+    return countOf(islice(elems, start, None), value)
+
+
+def _count_until_decided(elems: Sequence, min_repeats: int) -> Tuple[Dict, Tuple|None]:
+    '''
+    count a sequence in chunks, stopping once the remaining elements can no longer
+    change the answer
+
+    Each chunk runs up to the first point at which the answer could be decided, so the
+    checks are logarithmic in the length of the sequence, the first falling halfway.
+
+    Returns: the counts so far and, if counting stopped early, the single most repeated
+    element and its final count, or (None, 0) when no element can reach min_repeats
+    '''
+    counts, size = {}, len(elems)
+    best = runner_up = stop = 0
+
+    while stop < size:
+        remaining = size - stop
+        # the gap to the runner up grows by at most one an element, as the remainder
+        # shrinks by one, and best + remaining can fall by at most one an element
+        step = min((remaining - best + runner_up) // 2, best + remaining - min_repeats) + 1
+        # a check scans the counts, so steps no shorter than the counts bound the checks
+        # to one more scan of the elements
+        start, stop = stop, min(stop + max(1, step, len(counts)), size)
+        chunk = elems[start:stop]
+        count_elements(counts, chunk)
+
+        values = counts.values()
+        best = max(values)
+        # the runner up ties with the leader or is the largest count below it
+        runner_up = best if countOf(values, best) > 1 else \
+            max(compress(values, map(best.__ne__, values)), default=0)
+        remaining = size - stop
+
+        if best + remaining < min_repeats:
+            return counts, (None, 0)
+
+        if best - runner_up > remaining:
+            # no other element can catch the leader, only its own repeats are left to count
+            leader = next(compress(counts, map(best.__eq__, values)))
+            return counts, (leader, best + _count_from(elems, leader, stop))
+
+    return counts, None
+
+
+def find_most_repeated(elems: Iterable, min_repeats: int = 2) -> Dict:
     """
     Return the most repeated elements in a list and the number of times they repeat
-    
+
+    Counts in a single pass, then finds the maximum and its tied elements together.
+    A sequence is counted in chunks, tracking the leading two elements, and counting
+    stops early once the rest of the sequence is too short for the leader to be caught
+    or for any element to reach min_repeats.
+
     Args:
-        elems (List): A list of elements to search for repeats
+        elems (Iterable): An iterable of elements to search for repeats, numeric NumPy
+            arrays and array.array are counted with vectorised NumPy operations
+        min_repeats (int): the fewest repeats to report, defaults to 2
     Returns:
-        Dict: A dictionary containing the elements that repeat the most and 
-        the number of times they repeat
+        Dict: A dictionary containing the elements that repeat the most and
+        the number of times they repeat, tied elements in the order first seen
 
         e.g.
         print(find_most_repeated(['a', 'b', 'b', 3, 'c', 3, 'c', 3, 'b']))
         {'elements': ['b', 3], 'repeats': 3}
     """
-    counts = Countem(elems)
-    maxcount = counts.max()
+    if isinstance(elems, Sequence) and as_numeric_array(elems) is None:
+        counts, decided = _count_until_decided(elems, min_repeats)
+
+        if decided is not None:
+            leader, repeats = decided
+            if repeats < min_repeats:
+                return { 'elements': [], 'repeats': None }
+
+            return { 'elements': [leader], 'repeats': repeats }
+    else:
+        counts = _count_all(elems)
 
-    if not maxcount or maxcount < 2:
+    maxcount = max(counts.values(), default=None)
+
+    if not maxcount or maxcount < min_repeats:
         return { 'elements': [], 'repeats': None }
 
-    return { 'elements': list(counts.multi_mode()), 'repeats': maxcount }
+    elements = list(compress(counts, map(maxcount.__eq__, counts.values())))
+    return { 'elements': elements, 'repeats': maxcount }
+
+
+def top_k_repeated(elems: Iterable, k: int, min_repeats: int = 2) -> List[Tuple]:
+    """
+    Return the k most repeated elements and the number of times they repeat
+
+    Args:
+        elems (Iterable): An iterable of elements to search for repeats
+        k (int): the number of elements to return
+        min_repeats (int): the fewest repeats to report, defaults to 2
+    Returns:
+        List[Tuple]: up to k (element, repeats) pairs in descending order of repeats,
+        tied elements in the order first seen
+
+        e.g.
+        print(top_k_repeated(['a', 'b', 'b', 3, 'c', 3, 'c', 3, 'b'], 2))
+        [('b', 3), (3, 3)]
+    """
+    counts = _count_all(elems)
+    repeated = compress(counts.items(), map(min_repeats.__le__, counts.values()))
+
+    return nlargest(k, repeated, key=itemgetter(1))
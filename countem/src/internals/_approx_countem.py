@@ -0,0 +1,279 @@
+''' Internal module for an approximate, fixed memory Countem '''
+# pylint: disable=too-many-instance-attributes
+# pylint: disable=protected-access
+
+from typing import Any, Dict, Iterable, List, Tuple
+from array import array
+from collections.abc import Mapping
+from heapq import heapify, heappush, heapreplace, nlargest
+from itertools import islice
+from math import ceil, e, log
+from operator import add, itemgetter
+from ._counting import count_elements
+from ._stable_hash import encode_key, stable_hash
+
+__all__ = ['ApproxCountem']
+
+# elements aggregated at a time by update, which bounds its memory for long iterables
+_BATCH_SIZE = 65_536
+
+
+class ApproxCountem(Mapping):
+    '''Creates an approximate count of elements in a fixed amount of memory
+
+        Counts are kept in a Count-Min Sketch, a depth x width table of counters where each
+        element adds to one counter per row. The heaviest elements are tracked in a
+        Space-Saving table of top_k elements, which is what most_common, max, multi_mode,
+        iteration, membership and indexing work from. estimate gives the count of any
+        element, tracked or not.
+
+        Error bounds, where N is the total of all counts added:
+        - a count is never underestimated
+        - a count is overestimated by at most epsilon * N, with probability 1 - delta
+        - any element with a count greater than N / top_k is tracked in the top table
+
+        Memory is fixed at 8 * width * depth bytes for the sketch, where
+        width = ceil(e / epsilon) and depth = ceil(ln(1 / delta)), plus top_k elements.
+
+        Sketches with the same epsilon, delta and seed can be merged, including across
+        processes, as keys are hashed with a stable hash rather than the built-in hash.
+
+        Note: counts can only be added, so negative counts and subtract are not supported.
+
+        Args:
+            iterable (Iterable): An iterable of elements, or a mapping of counts to add
+            epsilon (float): relative error of a count, as a fraction of N
+            delta (float): probability of a count exceeding the error bound
+            top_k (int): number of heavy hitters to track
+            seed (int): seed for the hash functions
+    '''
+    def __init__(
+        self,
+        iterable: Iterable=None,
+        epsilon: float = 0.001,
+        delta: float = 0.01,
+        top_k: int = 100,
+        seed: int = 0
+    ) -> None:
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError('epsilon and delta must be between 0 and 1')
+
+        if top_k < 1:
+            raise ValueError('top_k must be at least 1')
+
+        self.epsilon, self.delta, self.top_k, self.seed = epsilon, delta, top_k, seed
+        self.width = ceil(e / epsilon)
+        self.depth = ceil(log(1 / delta))
+        self.total = 0
+
+        self.__table = array('q', bytes(8 * self.width * self.depth))
+        # Space-Saving table of element -> [count, error]
+        self.__top: Dict[Any, List[int]] = {}
+        # lazy min-heap of [count, sequence, element] over the top table
+        self.__heap: List[List] = []
+        # breaks ties between equal counts in the heap, an int so that sketches pickle
+        self.__sequence = 0
+
+        if iterable is not None:
+            self.update(iterable)
+
+
+    @property
+    def nbytes(self) -> int:
+        '''The number of bytes used by the sketch table'''
+        return self.__table.itemsize * len(self.__table)
+
+
+    def update(self, iterable: Iterable) -> 'ApproxCountem':
+        '''Add counted elements from an iterable, a mapping or another ApproxCountem'''
+
+        if isinstance(iterable, ApproxCountem):
+            return self.__merge(iterable, add)
+
+        if isinstance(iterable, Mapping):
+            self.__add_counts(iterable)
+            return self
+
+        # aggregate in batches so each distinct element of a batch is hashed once
+        iterator = iter(iterable)
+        while batch := list(islice(iterator, _BATCH_SIZE)):
+            counts = {}
+            count_elements(counts, batch)
+            self.__add_counts(counts)
+
+        return self
+
+
+    def copy(self) -> 'ApproxCountem':
+        '''Return a copy of the ApproxCountem instance'''
+        return self.__empty_like().__merge(self, add)
+
+
+    def estimate(self, key) -> int:
+        '''Return the estimated count of any element, which is 0 if never added'''
+        table = self.__table
+        estimate = min(map(table.__getitem__, self.__cells(key)))
+        tracked = self.__top.get(key)
+
+        return estimate if tracked is None else min(estimate, tracked[0])
+
+
+    def error(self, key) -> int|None:
+        '''Return the maximum overestimate of a tracked element's count in the top table'''
+        tracked = self.__top.get(key)
+        return None if tracked is None else tracked[1]
+
+
+    def max(self) -> int|None:
+        '''Return the estimated maximum count of any element'''
+        return max((self.estimate(key) for key in self.__top), default=None)
+
+
+    def most_common(self, n: int = None) -> List[Tuple]:
+        '''Return a list of the n most common tracked elements in descending order'''
+        items = [(key, self.estimate(key)) for key in self.__top]
+
+        if n is None:
+            return sorted(items, reverse=True, key=itemgetter(1))
+
+        return nlargest(n, items, key=itemgetter(1))
+
+
+    def multi_mode(self) -> Tuple|None:
+        '''Return the tracked elements with the estimated maximum count'''
+        maximum = self.max()
+        return maximum and tuple(key for key in self.__top if self.estimate(key) == maximum)
+
+
+    def __repr__(self) -> str:
+        return f'ApproxCountem({dict(self.most_common())!r})'
+
+
+    def __len__(self) -> int:
+        return len(self.__top)
+
+
+    def __contains__(self, key) -> bool:
+        return key in self.__top
+
+
+    def __getitem__(self, key) -> int:
+        '''Return the estimated count of a tracked element, see estimate for any element'''
+        if key not in self.__top:
+            raise KeyError(key)
+
+        return self.estimate(key)
+
+
+    def __iter__(self) -> Iterable:
+        return iter(self.__top)
+
+
+    def __or__(self, other: 'ApproxCountem') -> 'ApproxCountem':
+        '''union of two sketches, estimating the larger of the two counts of an element'''
+        return self.copy().__merge(other, max)
+
+
+    def __add__(self, other: 'ApproxCountem') -> 'ApproxCountem':
+        '''sum of two sketches'''
+        return self.copy().__merge(other, add)
+
+
+    def __empty_like(self) -> 'ApproxCountem':
+        '''return an empty sketch with the same dimensions and seed'''
+        return ApproxCountem(
+            epsilon=self.epsilon, delta=self.delta, top_k=self.top_k, seed=self.seed
+        )
+
+
+    def __cells(self, key) -> List[int]:
+        '''return the index of the counter for key in each row of the table'''
+        h1, h2 = stable_hash(encode_key(key), self.seed)
+        width = self.width
+
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+
+    def __add_counts(self, counts: Mapping) -> None:
+        '''add a mapping of non-negative counts to the sketch'''
+        for key, value in counts.items():
+            if value < 0:
+                raise ValueError('ApproxCountem does not support negative counts')
+            if value:
+                self.__add(key, value)
+
+
+    def __add(self, key, value: int) -> None:
+        '''add value to the count of key in the sketch and the top table'''
+        table = self.__table
+
+        for cell in self.__cells(key):
+            table[cell] += value
+
+        self.total += value
+        top = self.__top
+        tracked = top.get(key)
+
+        if tracked is not None:
+            tracked[0] += value
+
+        elif len(top) < self.top_k:
+            top[key] = [value, 0]
+            heappush(self.__heap, [value, self.__next_sequence(), key])
+
+        else:
+            # Space-Saving, the new element takes over the slot of the smallest count
+            minimum, evicted = self.__minimum()
+            del top[evicted]
+            top[key] = [minimum + value, minimum]
+            heapreplace(self.__heap, [minimum + value, self.__next_sequence(), key])
+
+
+    def __next_sequence(self) -> int:
+        '''return the next number in the sequence of heap entries'''
+        self.__sequence += 1
+        return self.__sequence
+
+
+    def __minimum(self) -> Tuple[int, Any]:
+        '''return the smallest count in the top table and its element'''
+        heap, top = self.__heap, self.__top
+
+        # counts only grow, so stale heap entries are refreshed until the root is current
+        while (current := top[heap[0][2]][0]) != heap[0][0]:
+            heapreplace(heap, [current, self.__next_sequence(), heap[0][2]])
+
+        return current, heap[0][2]
+
+
+    def __merge(self, other: 'ApproxCountem', combine) -> 'ApproxCountem':
+        '''merge the table and top table of other into this sketch with combine (add or max)'''
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError('cannot merge sketches with different dimensions or seeds')
+
+        self.__table = array('q', map(combine, self.__table, other.__table))
+        self.total = combine(self.total, other.total)
+
+        # an element missing from a full top table has a count of at most its minimum
+        self_floor, other_floor = self.__floor(), other.__floor()
+        top, other_top = self.__top, other.__top
+        merged = {}
+
+        for key in top.keys() | other_top.keys():
+            count, error = top.get(key, (self_floor, self_floor))
+            other_count, other_error = other_top.get(key, (other_floor, other_floor))
+            merged[key] = [combine(count, other_count), combine(error, other_error)]
+
+        kept = nlargest(self.top_k, merged.items(), key=lambda item: item[1][0])
+        self.__top = dict(kept)
+        self.__heap = [[value[0], self.__next_sequence(), key] for key, value in kept]
+        heapify(self.__heap)
+
+        return self
+
+
+    def __floor(self) -> int:
+        '''return the smallest count in the top table when full, otherwise zero'''
+        if len(self.__top) < self.top_k:
+            return 0
+        return min(count for count, _ in self.__top.values())
@@ -0,0 +1,174 @@
+''' Internal module for a thread-safe Countem fed by per-thread buffers '''
+
+from typing import Dict, Iterable, Iterator, List, Tuple
+from collections.abc import Mapping
+from contextlib import ExitStack
+from threading import Lock, current_thread, local
+from ._countem import Countem
+from ._counting import count_elements
+from ._merge import added
+
+__all__ = ['ConcurrentCountem']
+
+# distinct keys a thread's buffer holds before it is flushed to the shared store
+DEFAULT_FLUSH_SIZE = 100_000
+
+
+class _Buffer:  # pylint: disable=too-few-public-methods
+    '''the counts of one thread not yet flushed, with a lock only contended by readers'''
+    __slots__ = ('counts', 'lock', 'thread')
+
+    def __init__(self) -> None:
+        self.counts: Dict = {}
+        self.lock = Lock()
+        self.thread = current_thread()
+
+
+class ConcurrentCountem(Mapping):
+    '''A thread-safe count of elements for many producer threads
+
+        Each thread counts into a buffer of its own, so producers never wait on each
+        other. A buffer is flushed into the shared store once it holds flush_size keys,
+        and every buffer is flushed before a read, merging each at C speed. The buffers
+        of threads which have finished are dropped once flushed.
+
+        Locks are always taken in the same order, the store then the buffers, and reads
+        hold them all while flushing, so snapshot, most_common, max and multi_mode see
+        the counts as at a single point between updates.
+
+        Args:
+            iterable (Iterable): An iterable of elements, or a mapping of counts, to count
+            flush_size (int): the number of keys a thread buffers before flushing them
+    '''
+    def __init__(self, iterable: Iterable=None, flush_size: int = DEFAULT_FLUSH_SIZE) -> None:
+        self.flush_size = flush_size
+        self.__store: Dict = {}
+        self.__lock = Lock()
+        self.__buffers: List[_Buffer] = []
+        self.__local = local()
+
+        if iterable is not None:
+            self.update(iterable)
+
+
+    def add(self, key, count: int = 1) -> 'ConcurrentCountem':
+        '''Add count to a single key in this thread's buffer'''
+        buffer = self.__buffer()
+
+        with buffer.lock:
+            counts = buffer.counts
+            counts[key] = counts.get(key, 0) + count
+
+        return self.__flush_if_full(buffer)
+
+
+    def update(self, iterable: Iterable) -> 'ConcurrentCountem':
+        '''Add counted elements from an iterable to this thread's buffer'''
+        buffer = self.__buffer()
+
+        with buffer.lock:
+            if isinstance(iterable, Mapping):
+                buffer.counts.update(added(buffer.counts.get, iterable))
+            else:
+                count_elements(buffer.counts, iterable)
+
+        return self.__flush_if_full(buffer)
+
+
+    def flush(self) -> 'ConcurrentCountem':
+        '''Merge the buffer of every thread into the shared store'''
+        with self.__lock, self.__locked_buffers():
+            self.__flush_buffers()
+
+        return self
+
+
+    def snapshot(self) -> Countem:
+        '''Return a Countem of the counts at a single point between updates'''
+        with self.__lock, self.__locked_buffers():
+            self.__flush_buffers()
+            return Countem(self.__store)
+
+
+    def max(self) -> int|None:
+        '''Return the maximum count of any element'''
+        with self.__lock, self.__locked_buffers():
+            self.__flush_buffers()
+            return max(self.__store.values(), default=None)
+
+
+    def most_common(self, n: int = None) -> List[Tuple]:
+        '''Return a list of the n most common elements in descending order'''
+        return self.snapshot().most_common(n)
+
+
+    def multi_mode(self) -> Tuple|None:
+        '''Return the elements with the maximum count of any element'''
+        return self.snapshot().multi_mode()
+
+
+    def __buffer(self) -> _Buffer:
+        '''return the calling thread's buffer, registering a new one on its first use'''
+        buffer = getattr(self.__local, 'buffer', None)
+
+        if buffer is None:
+            buffer = self.__local.buffer = _Buffer()
+            with self.__lock:
+                self.__buffers.append(buffer)
+
+        return buffer
+
+
+    def __flush_if_full(self, buffer: _Buffer) -> 'ConcurrentCountem':
+        '''flush a buffer holding flush_size keys, taking the locks in the usual order'''
+        if len(buffer.counts) >= self.flush_size:
+            with self.__lock, buffer.lock:
+                self.__flush_buffer(buffer)
+
+        return self
+
+
+    def __flush_buffer(self, buffer: _Buffer) -> None:
+        '''merge a buffer into the store, holding both locks'''
+        store = self.__store
+        store.update(added(store.get, buffer.counts))
+        buffer.counts.clear()
+
+
+    def __flush_buffers(self) -> None:
+        '''merge every buffer into the store, holding every lock, and drop the buffers of
+        threads which have finished, as they can never be added to again'''
+        for buffer in self.__buffers:
+            self.__flush_buffer(buffer)
+
+        self.__buffers = [buffer for buffer in self.__buffers if buffer.thread.is_alive()]
+
+
+    def __locked_buffers(self) -> ExitStack:
+        '''return a context holding the lock of every buffer, taken in registration order'''
+        stack = ExitStack()
+
+        for buffer in self.__buffers:
+            stack.enter_context(buffer.lock)
+
+        return stack
+
+
+    def __repr__(self) -> str:
+        return f'ConcurrentCountem({dict(self.most_common())!r})'
+
+
+    def __len__(self) -> int:
+        with self.__lock, self.__locked_buffers():
+            self.__flush_buffers()
+            return len(self.__store)
+
+
+    def __getitem__(self, key) -> int:
+        with self.__lock, self.__locked_buffers():
+            self.__flush_buffers()
+            return self.__store[key]
+
+
+    def __iter__(self) -> Iterator:
+        return iter(self.snapshot())
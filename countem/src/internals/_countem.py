@@ -17,12 +17,27 @@
     -   To grasp why recursion errors might occur, such as trying len(self), 
         iter(self) in dunder methods
 '''
-from typing import Dict, Iterable, List, Tuple, Any
+import os
+from typing import Iterable, List, Tuple, Any
 from operator import itemgetter
 from collections.abc import Mapping
+from heapq import nlargest
+from ._counting import as_counts, count_elements as _count_elements
+from ._merge import MergeFunction, added, maximised, subtracted
+from ._parallel import count_parallel
+from ._path_accessors import column_chunks
+from ._snapshot import SnapshotCountem, load_snapshot, save_snapshot
+from ._vectorised import as_numeric_array, worth_vectorising
 
 __all__ = ['Countem']
 
+# most_common(n) selects with a heap while n is below len(self) / ratio, beyond
+# that a full sort is quicker — the crossover measured at 10^4 to 10^6 keys
+_HEAP_SELECT_RATIO = 20
+
+# counters larger than this are truncated in repr rather than sorted in full
+_REPR_MAX_ITEMS = 1000
+
 
 def coalesce(*args: Any, check=None) -> Any:
     '''
@@ -34,17 +49,6 @@ def coalesce(*args: Any, check=None) -> Any:
     return next((x for x in args if x is not check), None)
 
 
-def _count_elements(dictionary: Dict, iterable: Iterable) -> None:
-    '''Update the dictionary with the counts of elements in the iterable'''
-    for item in iterable:
-        dictionary[item] = dictionary.get(item, 0) + 1
-
-# Override with C helper function if available
-try:
-    from collections import _count_elements
-except ImportError:
-    pass
-
 class Countem(Mapping):
     '''Creates a count of elements from an iterable
 
@@ -54,6 +58,11 @@ class Countem(Mapping):
         - multi_mode: Returns the elements with the maximum count
         - update: Adds the counts of an other iterable to an instance of Countem in-place
         - subtract: Subtracts the counts of an other iterable from an instance of Countem in-place
+        - from_parallel: Creates a Countem by counting an iterable across a pool of processes
+        - merge_many: Creates a Countem with the summed counts of many counters
+        - count_by: Creates a Countem of the values at a path in each record
+        - save: Saves the counts to a compact binary snapshot file
+        - open: Opens a snapshot file, memory-mapped or loaded into a Countem
 
         Args: iterable (Iterable): An iterable of elements to count
     '''
@@ -64,41 +73,145 @@ class Countem(Mapping):
             self.update(iterable)
 
 
+    @classmethod
+    def from_parallel(
+        cls,
+        source: Iterable,
+        workers: int = None,
+        chunk_size: int = None,
+        chunked: bool = False,
+        encoding: str = 'utf-8'
+    ) -> 'Countem':
+        '''Create a Countem by counting shards of source across a pool of processes
+
+            The shard counts are merged with a tree reduction, giving the same counts in the
+            same order as Countem(source).
+
+            Args:
+                source (Iterable): elements to count, an iterable of chunks when chunked,
+                    or a path (os.PathLike) to a file whose lines are counted
+                workers (int): number of processes, defaults to os.cpu_count()
+                chunk_size (int): elements, or bytes for a file, per shard
+                chunked (bool): source is an iterable of already split chunks
+                encoding (str): encoding of a file of lines
+        '''
+        return cls(count_parallel(source, workers, chunk_size, chunked, encoding))
+
+
+    @classmethod
+    def merge_many(cls, counters: Iterable[Iterable]) -> 'Countem':
+        '''Create a Countem with the summed counts of many counters, mappings or iterables
+
+            Each counter is merged in turn into one accumulating store at C speed, rather
+            than creating a new Countem for every pair as sum(counters, Countem()) would.
+        '''
+        merged = cls()
+
+        for counter in counters:
+            merged.update(counter)
+
+        return merged
+
+
+    @classmethod
+    def count_by(cls, records: Iterable, *path, default=None) -> 'Countem':
+        '''Create a Countem of the values found at a path in each record
+
+            e.g. Countem.count_by(students, 'grades', 'math')
+            equivalent to Countem(map(get_by_path('grades', 'math'), students))
+
+            The values are extracted a column at a time with chained itemgetters, so
+            no Python function is called per record unless a record lacks the path.
+
+            Args:
+                records (Iterable): lists or dictionaries to read the path from
+                path: a series of string keys or index values that make a path
+                default: counted for records where the path is not found
+        '''
+        counted = cls()
+
+        for column in column_chunks(records, *path, default=default):
+            counted.update(column)
+
+        return counted
+
+
+    @classmethod
+    def open(cls, path: os.PathLike, mmap: bool = True) -> 'Countem|SnapshotCountem':
+        '''Open a snapshot file written by save
+
+            With mmap the file is served read-only from a memory map, so even a very large
+            snapshot opens instantly and only the pages touched by a lookup are read.
+            Otherwise the counts, with any appended deltas added, are loaded into a Countem.
+
+            Args:
+                path (os.PathLike): the snapshot file
+                mmap (bool): return a SnapshotCountem over the file rather than a Countem
+        '''
+        if mmap:
+            return SnapshotCountem(path)
+
+        return cls(load_snapshot(path))
+
+
+    def save(self, path: os.PathLike, append: bool = False) -> None:
+        '''Save the counts to a snapshot file, keys sorted and counts packed as int64
+
+            Keys must all be ints, all strs or all bytes. With append, the counts are
+            written as a delta section at the end of the file and add to the counts
+            already saved, so a running total can be checkpointed without a rewrite.
+        '''
+        save_snapshot(self.__store, path, append)
+
+
     def update(self, iterable: Iterable) -> 'Countem':
         '''Add counted elements from an iterable to store'''
 
         if isinstance(iterable, Mapping):
-            if self.__store:
-                # optimize lookup for self.get
-                self_get = self.get
-
-                for k, v in iterable.items():
-                    self[k] = v + self_get(k, 0)
-            else:
-                self.__store = dict(iterable)
+            self._merge(as_counts(iterable), added)
+        elif (numeric := as_numeric_array(iterable)) is None:
+            self._count(iterable)
+        elif worth_vectorising(numeric):
+            self._merge(as_counts(numeric), added)
         else:
-            _count_elements(self, iterable)
+            # nearly all distinct, which counts faster as a list than through np.unique
+            self._count(numeric.tolist())
 
         return self
 
     # Note: should results be limited to positives?
     def subtract(self, iterable: Iterable) -> 'Countem':
         '''Subtract counted elements from an iterable to store'''
-        self_get = self.get
+        return self._merge(as_counts(iterable), subtracted)
 
-        if isinstance(iterable, Mapping):
-            for k, v in iterable.items():
-                self[k] = self_get(k, 0) - v
+
+    def _merge(self, other: Mapping, merged: MergeFunction) -> 'Countem':
+        '''
+        Merge a mapping of counts into the store with one of the merge functions of
+        internals._merge, which work directly on the underlying dictionaries.
+        Subclasses which need to see every assignment override this and _count.
+        '''
+        if isinstance(other, Countem):
+            other = other.__store  # pylint: disable=protected-access
+
+        store = self.__store
+
+        if merged is added and not store:
+            store.update(other)
         else:
-            for k in iterable:
-                self[k] = self_get(k, 0) - 1
+            store.update(merged(store.get, other))
 
         return self
 
 
+    def _count(self, iterable: Iterable) -> None:
+        '''Add the counts of the elements of an iterable to the store'''
+        _count_elements(self.__store, iterable)
+
+
     def copy(self):
         '''Return a shallow copy of Countem instance'''
-        return Countem(self.__store)
+        return self.__class__(self.__store)
 
 
     def max(self) -> int|None:
@@ -107,8 +220,16 @@ class Countem(Mapping):
 
 
     def most_common(self, n: int = None) -> List[Tuple]:
-        '''Return a list of the n most common elements in descending order'''
-        return sorted(self.items(), reverse=True, key=itemgetter(1))[:coalesce(n, len(self))]
+        '''Return a list of the n most common elements in descending order
+
+            For a small n the top elements are selected with a heap in O(len * log n),
+            otherwise all the elements are sorted. Equal counts keep insertion order.
+        '''
+        if n is not None and 0 <= n * _HEAP_SELECT_RATIO < len(self):
+            return nlargest(n, self.__store.items(), key=itemgetter(1))
+
+        common = sorted(self.__store.items(), reverse=True, key=itemgetter(1))
+        return common[:coalesce(n, len(self))]
 
 
     def multi_mode(self) -> Tuple|None:
@@ -118,8 +239,17 @@ class Countem(Mapping):
 
 
     def __repr__(self) -> str:
-        '''Return the string representation of the Countem instance in descending order'''
-        return f'Countem({dict(self.most_common())!r})'
+        '''Return the string representation of the Countem instance in descending order
+
+            Large counters only show the most common _REPR_MAX_ITEMS elements followed by '...'
+        '''
+        name = self.__class__.__name__
+
+        if len(self) <= _REPR_MAX_ITEMS:
+            return f'{name}({dict(self.most_common())!r})'
+
+        items = ', '.join(f'{k!r}: {v!r}' for k, v in self.most_common(_REPR_MAX_ITEMS))
+        return f'{name}({{{items}, ...}})'
 
 
     def __len__(self) -> int:
@@ -130,6 +260,16 @@ class Countem(Mapping):
         return self.__store[key]
 
 
+    def __delitem__(self, key) -> None:
+        del self.__store[key]
+
+
+    def get(self, key, default=None) -> Any:
+        '''Return the count for key if key is in the store, else default'''
+        # shadows Mapping.get, which goes through __getitem__ and a KeyError for a missing key
+        return self.__store.get(key, default)
+
+
     def __setitem__(self, key, value) -> None:
         self.__store[key] = value
 
@@ -145,15 +285,7 @@ class Countem(Mapping):
 
     def __ior__(self, other: 'Countem') -> 'Countem':
         '''in place union of counted elements from an iterable with store'''
-        self_get = self.get
-
-        for k, v in other.items():
-            curr_v = self_get(k, 0)
-
-            if v > curr_v:
-                self[k] = v
-
-        return self
+        return self._merge(as_counts(other), maximised)
 
 
     def __add__(self, other: Iterable) -> 'Countem':
@@ -0,0 +1,39 @@
+''' Internal module for the element counting helper shared by Countem and its workers '''
+
+from typing import Dict, Iterable
+from collections.abc import Mapping
+from ._vectorised import as_numeric_array, count_numeric, worth_vectorising
+
+__all__ = ['count_elements', 'as_counts']
+
+
+def count_elements(dictionary: Dict, iterable: Iterable) -> None:
+    '''Update the dictionary with the counts of elements in the iterable'''
+    for item in iterable:
+        dictionary[item] = dictionary.get(item, 0) + 1
+
+# Override with C helper function if available
+try:
+    from collections import _count_elements as count_elements
+except ImportError:
+    pass
+
+
+def as_counts(iterable: Iterable) -> Mapping:
+    '''Return a mapping as is, otherwise a dictionary of the counts of its elements'''
+    if isinstance(iterable, Mapping):
+        # counters which change as they are read, with time or other threads, are merged
+        # from a snapshot so that their keys and counts are read at the same point
+        snapshot = getattr(iterable, 'snapshot', None)
+        return iterable if snapshot is None else snapshot()
+
+    if (numeric := as_numeric_array(iterable)) is not None:
+        if worth_vectorising(numeric):
+            # count numeric arrays with NumPy and merge the counts in bulk
+            return dict(zip(*count_numeric(numeric)))
+
+        iterable = numeric.tolist()
+
+    counts = {}
+    count_elements(counts, iterable)
+    return counts
@@ -0,0 +1,219 @@
+''' Internal module for counting elements with exponentially decaying frequencies '''
+
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+from collections import OrderedDict
+from collections.abc import ItemsView, KeysView, Mapping, ValuesView
+from heapq import nlargest
+from operator import itemgetter
+
+__all__ = ['DecayingCountem']
+
+# weights are scaled up from a landmark time rather than every count being decayed
+# (forward decay), the landmark moves on once any read or event is this many half-lives
+# past it, so the scale never leaves the range of a float however long the counter idles
+_RESCALE_HALF_LIVES = 512
+
+
+class DecayingCountem(Mapping):
+    '''Counts elements with weights that halve every half_life seconds
+
+        Uses forward decay, an event at time t is stored with the weight
+        2 ** ((t - landmark) / half_life) and a count is read by scaling the stored weight
+        back to the current time. Stored weights never change as time passes, so their
+        order does not either, which keeps max and multi_mode O(1) and most_common(n) a
+        heap selection. The landmark moves forward once a read or event is 512 half-lives
+        past it, rescaling the weights in one pass, which amortises to O(1) per event.
+
+        Elements are kept in order of their last event and are expired from the front
+        while their count has decayed below min_count, so expiry is incremental.
+
+        Args:
+            iterable (Iterable): An iterable of events, or a mapping of element weights
+            half_life (float): the number of seconds for a count to halve
+            min_count (float): counts decayed below this are expired
+            clock (Callable): returns the current time in seconds, defaults to time.monotonic
+    '''
+    def __init__(
+        self,
+        iterable: Iterable=None,
+        half_life: float = 60.0,
+        min_count: float = 0.01,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if half_life <= 0:
+            raise ValueError('half_life must be positive')
+
+        self.half_life, self.min_count, self.clock = half_life, min_count, clock
+        self.__landmark = clock()
+        # element -> stored weight, in order of each element's last event
+        self.__weights: Dict = OrderedDict()
+        self.__max_weight = 0.0
+        # elements sharing the largest stored weight
+        self.__modes: Dict = {}
+
+        if iterable is not None:
+            self.update(iterable)
+
+
+    def add(self, key, weight: float = 1.0, timestamp: float = None) -> 'DecayingCountem':
+        '''Add a weighted event, at the current time unless a timestamp is given'''
+        if weight < 0:
+            raise ValueError('DecayingCountem does not support negative weights')
+
+        if timestamp is None:
+            timestamp = self.clock()
+
+        # scaled first, as it can rescale the stored weights
+        scaled = weight * self.__scale(timestamp)
+        weights = self.__weights
+        stored = weights.pop(key, 0.0) + scaled
+        weights[key] = stored
+
+        if stored > self.__max_weight:
+            self.__max_weight = stored
+            self.__modes = {key: None}
+        elif stored == self.__max_weight:
+            self.__modes[key] = None
+
+        return self.expire(timestamp)
+
+
+    def update(self, iterable: Iterable, timestamp: float = None) -> 'DecayingCountem':
+        '''Add the events of an iterable, or the weights of a mapping'''
+        if timestamp is None:
+            timestamp = self.clock()
+
+        if isinstance(iterable, Mapping):
+            for key, weight in iterable.items():
+                self.add(key, weight, timestamp)
+        else:
+            for key in iterable:
+                self.add(key, 1.0, timestamp)
+
+        return self
+
+
+    def expire(self, now: float = None) -> 'DecayingCountem':
+        '''Expire elements, least recently added first, while they have decayed below min_count'''
+        weights = self.__weights
+        threshold = self.min_count * self.__scale(self.clock() if now is None else now)
+
+        while weights:
+            key = next(iter(weights))
+            if weights[key] >= threshold:
+                break
+
+            del weights[key]
+            self.__modes.pop(key, None)
+
+        # a mode only expires once every count has decayed below min_count,
+        # so this scan is over elements about to expire themselves
+        if not self.__modes:
+            self.__max_weight = 0.0
+            self.__find_modes()
+
+        return self
+
+
+    def max(self) -> float|None:
+        '''Return the maximum decayed count of any element'''
+        self.expire()
+        return self.__decay(self.__max_weight) if self.__weights else None
+
+
+    def most_common(self, n: int = None) -> List[Tuple]:
+        '''Return a list of the n most common elements in descending order of decayed count'''
+        self.expire()
+        items = self.__weights.items()
+        common = sorted(items, reverse=True, key=itemgetter(1)) if n is None \
+            else nlargest(n, items, key=itemgetter(1))
+
+        scale = self.__scale(self.clock())
+        return [(key, weight / scale) for key, weight in common]
+
+
+    def multi_mode(self) -> Tuple|None:
+        '''Return the elements with the maximum decayed count'''
+        self.expire()
+        return tuple(self.__modes) if self.__weights else None
+
+
+    def snapshot(self) -> Dict:
+        '''Return a dictionary of the decayed counts at a single time, in order of each
+        element's last event'''
+        self.expire()
+        scale = self.__scale(self.clock())
+        return {key: weight / scale for key, weight in self.__weights.items()}
+
+
+    def __scale(self, timestamp: float) -> float:
+        '''return the factor an event at timestamp is stored with, moving the landmark
+        on first if timestamp is too far past it'''
+        if timestamp - self.__landmark > _RESCALE_HALF_LIVES * self.half_life:
+            self.__rescale(timestamp)
+
+        return 2.0 ** ((timestamp - self.__landmark) / self.half_life)
+
+
+    def __decay(self, weight: float) -> float:
+        '''return a stored weight decayed to the current time'''
+        return weight / self.__scale(self.clock())
+
+
+    def __rescale(self, timestamp: float) -> None:
+        '''move the landmark to timestamp, scaling the stored weights down to match'''
+        # scaling down by a negative power underflows to zero rather than overflowing,
+        # weights far enough in the past become zero and expire
+        factor = 2.0 ** ((self.__landmark - timestamp) / self.half_life)
+        weights = self.__weights
+
+        for key, weight in weights.items():
+            weights[key] = weight * factor
+
+        self.__max_weight *= factor
+        self.__landmark = timestamp
+
+
+    def __find_modes(self) -> None:
+        '''find the largest stored weight and its elements with a full scan'''
+        for key, weight in self.__weights.items():
+            if weight > self.__max_weight:
+                self.__max_weight, self.__modes = weight, {key: None}
+            elif weight == self.__max_weight:
+                self.__modes[key] = None
+
+
+    def __repr__(self) -> str:
+        return f'DecayingCountem({dict(self.most_common())!r})'
+
+
+    def __len__(self) -> int:
+        self.expire()
+        return len(self.__weights)
+
+
+    def __getitem__(self, key) -> float:
+        self.expire()
+        return self.__decay(self.__weights[key])
+
+
+    def __iter__(self) -> Iterable:
+        # a snapshot, as reading a count while iterating can expire elements
+        self.expire()
+        return iter(list(self.__weights))
+
+
+    def keys(self) -> KeysView:
+        '''Return a snapshot of the elements, see snapshot'''
+        return self.snapshot().keys()
+
+
+    def items(self) -> ItemsView:
+        '''Return a snapshot of the elements and their decayed counts, see snapshot'''
+        return self.snapshot().items()
+
+
+    def values(self) -> ValuesView:
+        '''Return a snapshot of the decayed counts, see snapshot'''
+        return self.snapshot().values()
@@ -0,0 +1,249 @@
+''' Internal module for a compact, array backed Countem for small integer keys '''
+
+from typing import Any, Dict, Iterable, List, Tuple
+from array import array
+from collections.abc import Mapping
+from heapq import nlargest
+from itertools import chain, compress
+from operator import and_, itemgetter
+from ._counting import as_counts
+from ._vectorised import np
+
+__all__ = ['DenseCountem']
+
+# the default limit on the keys held in the array, 9MB of buffers when fully grown
+DEFAULT_MAX_DENSE = 1 << 20
+
+
+class DenseCountem(Mapping):
+    '''Creates a count of elements, holding small non-negative integer keys in an array
+
+        Counts for the int keys 0 <= key < max_dense are stored at their index in a
+        growable array('q'), with a bytearray marking which keys are present, for 9 bytes
+        a key against roughly 100 for a dictionary. Any other keys, the outliers, fall back
+        to a dictionary. max and multi_mode are vectorised with NumPy where it is installed.
+
+        Provides the same methods as Countem: max, most_common, multi_mode, update, subtract
+        and the | + - operators. Counts must be integers which fit in 64 bits.
+
+        Note: keys are iterated in ascending order for the array, then insertion order for
+        the outliers. Keys equal to an int in the array, such as True or 1.0, are counted
+        in its slot and come back as the int.
+
+        Args:
+            iterable (Iterable): An iterable of elements, or a mapping of counts, to count
+            max_dense (int): keys below this are held in the array
+    '''
+    def __init__(self, iterable: Iterable=None, max_dense: int = DEFAULT_MAX_DENSE) -> None:
+        self.max_dense = max_dense
+        self.__counts = array('q')
+        self.__present = bytearray()
+        self.__dense_size = 0
+        self.__outliers: Dict = {}
+
+        if iterable is not None:
+            self.update(iterable)
+
+
+    @property
+    def nbytes(self) -> int:
+        '''The number of bytes used by the array buffers'''
+        return self.__counts.itemsize * len(self.__counts) + len(self.__present)
+
+
+    def update(self, iterable: Iterable) -> 'DenseCountem':
+        '''Add counted elements from an iterable to store'''
+        self_get = self.get
+
+        for k, v in as_counts(iterable).items():
+            self[k] = self_get(k, 0) + v
+
+        return self
+
+
+    def subtract(self, iterable: Iterable) -> 'DenseCountem':
+        '''Subtract counted elements from an iterable to store'''
+        self_get = self.get
+
+        for k, v in as_counts(iterable).items():
+            self[k] = self_get(k, 0) - v
+
+        return self
+
+
+    def copy(self) -> 'DenseCountem':
+        '''Return a copy of the DenseCountem instance, copying the array buffers in bulk'''
+        # pylint: disable=protected-access,unused-private-member
+        result = DenseCountem(max_dense=self.max_dense)
+        result.__counts = array('q', self.__counts)
+        result.__present = bytearray(self.__present)
+        result.__dense_size = self.__dense_size
+        result.__outliers = dict(self.__outliers)
+
+        return result
+
+
+    def max(self) -> int|None:
+        '''Return the maximum count of any element in the dictionary'''
+        maxima = []
+
+        if self.__dense_size:
+            if np is not None:
+                maxima.append(int(self.__dense_view().max()))
+            else:
+                maxima.append(max(compress(self.__counts, self.__present)))
+
+        if self.__outliers:
+            maxima.append(max(self.__outliers.values()))
+
+        return max(maxima, default=None)
+
+
+    def most_common(self, n: int = None) -> List[Tuple]:
+        '''Return a list of the n most common elements in descending order'''
+        if n is None:
+            return sorted(self.__items(), reverse=True, key=itemgetter(1))
+
+        return nlargest(n, self.__items(), key=itemgetter(1))
+
+
+    def multi_mode(self) -> Tuple|None:
+        '''Return the elements with the maximum count of any element in the dictionary'''
+        maximum = self.max()
+
+        if not maximum:
+            return maximum
+
+        if np is not None:
+            present = np.frombuffer(self.__present, dtype=np.bool_)
+            counts = np.frombuffer(self.__counts, dtype=np.int64)
+            dense_modes = np.flatnonzero((counts == maximum) & present).tolist()
+        else:
+            is_maximum = map(maximum.__eq__, self.__counts)
+            dense_modes = compress(range(len(self.__counts)), map(and_, self.__present, is_maximum))
+
+        outlier_modes = (k for k, v in self.__outliers.items() if v == maximum)
+        return tuple(chain(dense_modes, outlier_modes))
+
+
+    def get(self, key, default=None) -> Any:
+        '''Return the count for key if key is present, else default'''
+        index = self.__index(key)
+
+        if index is not None:
+            if index < len(self.__present) and self.__present[index]:
+                return self.__counts[index]
+            return default
+
+        return self.__outliers.get(key, default)
+
+
+    def __items(self) -> Iterable[Tuple]:
+        '''return an iterator of (key, count) pairs, reading the array in bulk'''
+        present = self.__present
+        dense_items = zip(compress(range(len(present)), present), compress(self.__counts, present))
+
+        return chain(dense_items, self.__outliers.items())
+
+
+    def __index(self, key) -> int|None:
+        '''return the index in the array of key, or None if key belongs in the outliers'''
+        # pylint: disable=unidiomatic-typecheck
+        if type(key) is int:
+            return key if 0 <= key < self.max_dense else None
+
+        # a key equal to an int in range, such as True, 1.0 or a NumPy int, shares its
+        # slot as it would share a dictionary entry, and equal keys have equal hashes,
+        # which for the ints in range are the ints themselves
+        index = hash(key)
+        if 0 <= index < self.max_dense and key == index:
+            return index
+
+        return None
+
+
+    def __dense_view(self) -> Any:
+        '''return a NumPy array of the present counts in the array'''
+        present = np.frombuffer(self.__present, dtype=np.bool_)
+        return np.frombuffer(self.__counts, dtype=np.int64)[present]
+
+
+    def __grow(self, key: int) -> None:
+        '''grow the array to hold key, at least doubling it to amortise the copies'''
+        size = len(self.__counts)
+        extra = min(self.max_dense, max(key + 1, size * 2)) - size
+
+        self.__counts.frombytes(bytes(self.__counts.itemsize * extra))
+        self.__present.extend(bytes(extra))
+
+
+    def __repr__(self) -> str:
+        return f'DenseCountem({dict(self.most_common())!r})'
+
+
+    def __len__(self) -> int:
+        return self.__dense_size + len(self.__outliers)
+
+
+    def __getitem__(self, key) -> int:
+        value = self.get(key, self)
+        if value is self:
+            raise KeyError(key)
+        return value
+
+
+    def __setitem__(self, key, value: int) -> None:
+        index = self.__index(key)
+
+        if index is None:
+            self.__outliers[key] = value
+            return
+
+        if index >= len(self.__counts):
+            self.__grow(index)
+
+        self.__counts[index] = value
+
+        if not self.__present[index]:
+            self.__present[index] = 1
+            self.__dense_size += 1
+
+
+    def __delitem__(self, key) -> None:
+        index = self.__index(key)
+
+        if index is None:
+            del self.__outliers[key]
+            return
+
+        if index >= len(self.__present) or not self.__present[index]:
+            raise KeyError(key)
+
+        self.__counts[index] = 0
+        self.__present[index] = 0
+        self.__dense_size -= 1
+
+
+    def __iter__(self) -> Iterable:
+        present = self.__present
+        return chain(compress(range(len(present)), present), self.__outliers)
+
+
+    def __or__(self, other: Iterable) -> 'DenseCountem':
+        '''union of counted elements from an iterable with store'''
+        result = self.copy()
+        result_get = result.get
+
+        for k, v in as_counts(other).items():
+            if v > result_get(k, 0):
+                result[k] = v
+
+        return result
+
+
+    def __add__(self, other: Iterable) -> 'DenseCountem':
+        return self.copy().update(other)
+
+
+    def __sub__(self, other: Iterable) -> 'DenseCountem':
+        return self.copy().subtract(other)
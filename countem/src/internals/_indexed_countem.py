@@ -0,0 +1,169 @@
+''' Internal module for a Countem with a maintained index of counts to elements '''
+
+from typing import Any, Dict, Iterable, List, Tuple
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate, chain, islice
+from math import ceil
+from collections.abc import Mapping
+from ._countem import Countem
+from ._counting import count_elements
+from ._merge import MergeFunction
+
+__all__ = ['IndexedCountem']
+
+_MISSING = object()
+
+
+class IndexedCountem(Countem):
+    '''A Countem which keeps an index of counts to elements up to date on every change
+
+        In the manner of an LFU cache, each element lives in a bucket for its current
+        count and is moved to another bucket whenever its count is set. A sorted list
+        of the distinct counts sits alongside the buckets, so that:
+        - max: is O(1)
+        - multi_mode: is O(number of modes)
+        - keys_with_count: is O(number of elements with that count)
+        - most_common(n): is O(n + distinct counts visited)
+
+        The cost is moved to updates, each one moves an element between buckets and a
+        count not seen before is inserted into the sorted list of counts.
+
+        Order statistics, rank, quantile and keys_with_count_between, binary search a
+        running total of the bucket sizes over the sorted counts. The totals are built in
+        O(distinct counts) on first use and cached until the next change.
+
+        Note: elements sharing a count are returned in the order they reached that count,
+        rather than insertion order as with Countem.
+
+        Args: iterable (Iterable): An iterable of elements to count
+    '''
+    def __init__(self, iterable: Iterable=None) -> None:
+        self.__buckets: Dict[Any, Dict] = {}
+        self.__counts: List = []
+        # the number of elements with a count up to each of the sorted counts
+        self.__cumulative: List|None = None
+        super().__init__(iterable)
+
+
+    def _merge(self, other: Mapping, merged: MergeFunction) -> 'IndexedCountem':
+        '''Merge a mapping of counts, assigning each change so the index follows it'''
+        for k, v in merged(self.get, other):
+            self[k] = v
+
+        return self
+
+
+    def _count(self, iterable: Iterable) -> None:
+        '''Add the counts of the elements of an iterable through __setitem__'''
+        count_elements(self, iterable)
+
+
+    def max(self) -> int|None:
+        '''Return the maximum count of any element in the dictionary'''
+        return self.__counts[-1] if self.__counts else None
+
+
+    def multi_mode(self) -> Tuple|None:
+        '''Return the elements with the maximum count of any element in the dictionary'''
+        maximum = self.max()
+        return maximum and tuple(self.__buckets[maximum])
+
+
+    def keys_with_count(self, count: int) -> Tuple:
+        '''Return the elements with the given count'''
+        return tuple(self.__buckets.get(count, ()))
+
+
+    def keys_with_count_between(self, low: int, high: int) -> Tuple:
+        '''Return the elements with a count from low to high inclusive, most common first'''
+        counts, buckets = self.__counts, self.__buckets
+        selected = counts[bisect_left(counts, low):bisect_right(counts, high)]
+
+        return tuple(chain.from_iterable(buckets[count] for count in reversed(selected)))
+
+
+    def count_histogram(self) -> Dict[int, int]:
+        '''Return the number of elements with each count, in ascending order of count'''
+        buckets = self.__buckets
+        return {count: len(buckets[count]) for count in self.__counts}
+
+
+    def rank(self, key) -> int:
+        '''Return the rank of key by count, 1 for the most common, with ties sharing a rank'''
+        position = bisect_left(self.__counts, self[key])
+        # one more than the number of elements with a greater count
+        return len(self) - self.__cumulative_counts()[position] + 1
+
+
+    def quantile(self, q: float) -> int|None:
+        '''Return the count at quantile q of the counts of the elements, by nearest rank
+
+            e.g. quantile(0.99) is the count which 99% of elements have no more than
+        '''
+        if not 0 <= q <= 1:
+            raise ValueError('quantile expected q between 0 and 1')
+
+        if not self.__counts:
+            return None
+
+        # the 1-based position of the element at quantile q in ascending order of count
+        position = max(1, ceil(q * len(self)))
+        return self.__counts[bisect_left(self.__cumulative_counts(), position)]
+
+
+    def most_common(self, n: int = None) -> List[Tuple]:
+        '''Return a list of the n most common elements in descending order'''
+        if n is not None and n < 0:
+            return super().most_common(n)
+
+        buckets = self.__buckets
+        ranked = ((k, count) for count in reversed(self.__counts) for k in buckets[count])
+
+        return list(islice(ranked, n))
+
+
+    def __setitem__(self, key, value) -> None:
+        current = self.get(key, _MISSING)
+
+        if current is not _MISSING:
+            self.__remove_from_bucket(key, current)
+
+        super().__setitem__(key, value)
+        self.__add_to_bucket(key, value)
+
+
+    def __delitem__(self, key) -> None:
+        self.__remove_from_bucket(key, self[key])
+        super().__delitem__(key)
+
+
+    def __cumulative_counts(self) -> List[int]:
+        '''return the running totals of the bucket sizes, building them after a change'''
+        if self.__cumulative is None:
+            buckets = self.__buckets
+            self.__cumulative = list(accumulate(len(buckets[count]) for count in self.__counts))
+
+        return self.__cumulative
+
+
+    def __add_to_bucket(self, key, count) -> None:
+        '''add key to the bucket for count, indexing the count if it is new'''
+        self.__cumulative = None
+        bucket = self.__buckets.get(count)
+
+        if bucket is None:
+            self.__buckets[count] = {key: None}
+            insort(self.__counts, count)
+        else:
+            bucket[key] = None
+
+
+    def __remove_from_bucket(self, key, count) -> None:
+        '''remove key from the bucket for count, dropping the count if the bucket empties'''
+        self.__cumulative = None
+        bucket = self.__buckets[count]
+        del bucket[key]
+
+        if not bucket:
+            del self.__buckets[count]
+            del self.__counts[bisect_left(self.__counts, count)]
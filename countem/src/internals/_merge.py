@@ -0,0 +1,32 @@
+''' Internal module for merging counts with the loops pushed down into C '''
+
+from typing import Callable, Iterator, Mapping, Tuple
+from itertools import compress, repeat
+from operator import add, gt, sub
+
+__all__ = ['added', 'subtracted', 'maximised']
+
+# Each function takes the get method of the store being merged into and a mapping of
+# counts, returning (key, new count) pairs for the keys that change. The pairs are
+# built with map, zip and compress over the builtin get, so that when they are fed to
+# dict.update no Python bytecode runs per key. Each get is made lazily, just before its
+# key is assigned, which is safe as a mapping's keys are unique.
+
+MergeFunction = Callable[[Callable, Mapping], Iterator[Tuple]]
+
+
+def added(get: Callable, other: Mapping) -> Iterator[Tuple]:
+    '''pairs of key and get(key, 0) + count for every count in other'''
+    keys = other.keys()
+    return zip(keys, map(add, map(get, keys, repeat(0)), other.values()))
+
+
+def subtracted(get: Callable, other: Mapping) -> Iterator[Tuple]:
+    '''pairs of key and get(key, 0) - count for every count in other'''
+    keys = other.keys()
+    return zip(keys, map(sub, map(get, keys, repeat(0)), other.values()))
+
+
+def maximised(get: Callable, other: Mapping) -> Iterator[Tuple]:
+    '''pairs of key and count for the counts in other greater than get(key, 0)'''
+    return compress(other.items(), map(gt, other.values(), map(get, other.keys(), repeat(0))))
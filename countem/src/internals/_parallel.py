@@ -0,0 +1,182 @@
+''' Internal module for counting elements in shards across a pool of processes '''
+
+import os
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from ._counting import count_elements
+from ._merge import added
+
+__all__ = ['count_parallel', 'merge_counts']
+
+# elements per shard when the length of the input is not known up front
+DEFAULT_CHUNK_SIZE = 100_000
+
+# smallest byte range handed to a worker when counting the lines of a file
+MIN_FILE_CHUNK_SIZE = 1 << 20
+
+# shards per worker, so that a slow shard does not leave the other workers idle
+SHARDS_PER_WORKER = 4
+
+
+def merge_counts(left: Dict, right: Dict) -> Dict:
+    '''Add the counts in right to left in place, keeping the key order of left then right'''
+    if not left:
+        return right
+
+    left.update(added(left.get, right))
+    return left
+
+
+def count_chunk(chunk: Iterable) -> Dict:
+    '''Return a dictionary of the counts of the elements in a chunk'''
+    counts = {}
+    count_elements(counts, chunk)
+    return counts
+
+
+def read_lines(path: os.PathLike, start: int, end: int, encoding: str) -> List[str]:
+    '''
+    Return the decoded lines starting within a byte range of a file — a line belongs
+    to the range it starts in, so adjoining ranges read each line exactly once
+    '''
+    with open(path, 'rb') as file:
+        if start:
+            # skip the line which started in the previous range
+            file.seek(start - 1)
+            file.readline()
+
+        position = file.tell()
+        if position >= end:
+            return []
+
+        data = file.read(end - position)
+        # finish the line which runs over into the next range
+        if not data.endswith(b'\n'):
+            data += file.readline()
+
+    # split on b'\n' alone, as the ranges are, rather than on every line boundary
+    # str.splitlines knows, such as U+2028, which can appear inside a line
+    text = data.decode(encoding)
+    lines = text.split('\n')
+    if not lines[-1]:
+        lines.pop()
+
+    if '\r' in text:
+        lines = [line.removesuffix('\r') for line in lines]
+
+    return lines
+
+
+def count_lines(task: Tuple) -> Dict:
+    '''
+    Return a dictionary of the counts of the lines starting within a byte range of a file
+
+    Params:
+        task: (path, start, end, encoding) — a line belongs to the range it starts in
+    '''
+    counts = {}
+    count_elements(counts, read_lines(*task))
+    return counts
+
+
+def _chunks(source: Iterable, chunk_size: int) -> Iterator:
+    '''yield successive chunks of chunk_size elements from the source'''
+    if isinstance(source, Sequence):
+        for i in range(0, len(source), chunk_size):
+            yield source[i:i + chunk_size]
+    else:
+        iterator = iter(source)
+        while chunk := list(islice(iterator, chunk_size)):
+            yield chunk
+
+
+def _line_ranges(
+    path: os.PathLike, chunk_size: int, encoding: str, offset: int = 0
+) -> Iterator[Tuple]:
+    '''yield (path, start, end, encoding) byte ranges covering the file from offset'''
+    size = os.path.getsize(path)
+
+    for start in range(offset, size, chunk_size):
+        yield path, start, min(start + chunk_size, size), encoding
+
+
+def _ordered_map(executor: Executor, func: Callable, tasks: Iterable, max_pending: int):
+    '''yield func(task) for each task in order, with no more than max_pending in flight'''
+    pending = deque()
+
+    for task in tasks:
+        pending.append(executor.submit(func, task))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def _tree_reduce(results: Iterable[Dict]) -> Dict:
+    '''
+    Merge shard counts pairwise as they arrive, as in a binary counter, so that
+    shards are merged with others of a similar size and shard order is preserved
+    '''
+    stack: List[Tuple[int, Dict]] = []
+
+    for counts in results:
+        level = 0
+        while stack and stack[-1][0] == level:
+            counts = merge_counts(stack.pop()[1], counts)
+            level += 1
+        stack.append((level, counts))
+
+    merged = {}
+    for _, counts in stack:
+        merged = merge_counts(merged, counts)
+
+    return merged
+
+
+def count_parallel(
+    source: Iterable,
+    workers: int = None,
+    chunk_size: int = None,
+    chunked: bool = False,
+    encoding: str = 'utf-8'
+) -> Dict:
+    '''
+    Count the elements of source in shards across a pool of processes
+
+    Params:
+        source: the elements to count, an iterable of chunks if chunked is True,
+                or a path (os.PathLike) to a file of lines
+        workers: the number of processes — defaults to os.cpu_count()
+        chunk_size: elements (or bytes for a file) per shard
+        chunked: the source is already split into chunks
+        encoding: the encoding of a file of lines
+
+    Returns: a dictionary of counts, equal and in the same key order as a serial count
+    '''
+    workers = workers or os.cpu_count() or 1
+
+    if isinstance(source, os.PathLike):
+        if chunk_size is None:
+            size = os.path.getsize(source)
+            chunk_size = max(MIN_FILE_CHUNK_SIZE, -(-size // (workers * SHARDS_PER_WORKER)))
+        func, tasks = count_lines, _line_ranges(source, chunk_size, encoding)
+
+    elif chunked:
+        func, tasks = count_chunk, source
+
+    else:
+        if chunk_size is None:
+            chunk_size = DEFAULT_CHUNK_SIZE
+            if isinstance(source, Sequence):
+                chunk_size = max(1, -(-len(source) // (workers * SHARDS_PER_WORKER)))
+        func, tasks = count_chunk, _chunks(source, chunk_size)
+
+    if workers == 1:
+        return _tree_reduce(map(func, tasks))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _tree_reduce(_ordered_map(executor, func, tasks, workers * 2))
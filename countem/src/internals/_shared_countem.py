@@ -0,0 +1,388 @@
+''' Internal module for a Countem held in shared memory and updated in place by many processes '''
+# pylint: disable=too-many-instance-attributes
+
+import os
+import sys
+import struct
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from collections.abc import Mapping
+from heapq import nlargest
+from itertools import compress
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from operator import itemgetter
+from threading import Lock
+from ._counting import as_counts
+from ._stable_hash import decode_key, encode_key, stable_hash
+from ._vectorised import np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+__all__ = ['SharedCountem']
+
+# The block is a header then four arrays of slots and a blob of keys:
+#   header:  magic, version, then slots, capacity, key bytes, used slots, used key bytes
+#   hashes array('Q') — 0 marks an empty slot, counts array('q'),
+#   offsets array('Q') and lengths array('Q') of each key in the blob
+_MAGIC = struct.Struct('<4sI')
+_META_FIELDS = 5
+_HEADER_SIZE = _MAGIC.size + 8 * _META_FIELDS
+_MAGIC_VALUE, _VERSION = b'SCNT', 1
+_SLOTS, _CAPACITY, _KEY_BYTES, _USED, _KEYS_USED = range(_META_FIELDS)
+
+# encoded bytes allowed per key when key_bytes is not given
+DEFAULT_KEY_BYTES_PER_KEY = 32
+
+
+# from Python 3.13 a block can be opened without the resource tracker, before that every
+# process which opens a block registers it to be unlinked when that process exits
+_CAN_UNTRACK = sys.version_info >= (3, 13)
+
+
+def _open_shared(name: str = None, create: bool = False, size: int = 0) -> SharedMemory:
+    '''open a block which is only unlinked explicitly, not when any process exits'''
+    if _CAN_UNTRACK:
+        return SharedMemory(name, create, size, track=False)  # pylint: disable=unexpected-keyword-arg
+
+    shared = SharedMemory(name, create, size)
+    resource_tracker.unregister(shared._name, 'shared_memory')  # pylint: disable=protected-access
+    return shared
+
+
+def _unlink_shared(shared: SharedMemory) -> None:
+    '''unlink a block opened by _open_shared'''
+    if not _CAN_UNTRACK:
+        # unlink unregisters the block, so register it again to keep the tracker balanced
+        resource_tracker.register(shared._name, 'shared_memory')  # pylint: disable=protected-access
+
+    shared.unlink()
+
+
+class _FileLock:
+    '''A lock across processes by name, an flock of a file, and across this process's threads'''
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.__thread_lock = Lock()
+        self.__file = None
+
+    def __enter__(self) -> '_FileLock':
+        self.__thread_lock.acquire()
+
+        if fcntl is not None:
+            if self.__file is None:
+                self.__file = open(self.path, 'a+b')  # pylint: disable=consider-using-with
+            fcntl.flock(self.__file, fcntl.LOCK_EX)
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if fcntl is not None:
+            fcntl.flock(self.__file, fcntl.LOCK_UN)
+
+        self.__thread_lock.release()
+
+    def close(self) -> None:
+        '''close the lock file'''
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+
+class SharedCountem(Mapping):
+    '''A count of elements in a block of shared memory, updated in place by many processes
+
+        The block holds a fixed-capacity open-addressing hash table, linear probing on a
+        stable hash of each key, with the counts packed in an int64 array and the
+        encoded keys in a side table. Any process on the host can attach by name, or
+        unpickle the counter, and update it or read it with no copies between processes.
+
+        Updates are counted locally first, then applied under a lock, an flock of a file
+        named after the block, so each batch is applied atomically. Reads take no lock
+        and may see a batch part way through.
+
+        The process that creates the counter should unlink it once every process is done.
+
+        Note: booleans and integral floats are returned as ints, keys are iterated in
+        slot order and, as on Windows there is no flock, updates there are only safe
+        between the threads of one process.
+
+        Args:
+            iterable (Iterable): An iterable of elements, or a mapping of counts, to count
+            capacity (int): the number of distinct keys the counter can hold
+            key_bytes (int): the bytes for encoded keys, 32 a key by default
+            name (str): the name of the shared memory block, generated by default
+    '''
+    def __init__(
+        self,
+        iterable: Iterable=None,
+        capacity: int = 1 << 16,
+        key_bytes: int = None,
+        name: str = None,
+        _shared: SharedMemory = None
+    ) -> None:
+        if _shared is None:
+            if capacity < 1:
+                raise ValueError('capacity must be positive')
+
+            # at least twice the slots as keys keeps probe sequences short
+            slots = 1 << (2 * capacity - 1).bit_length()
+            key_bytes = capacity * DEFAULT_KEY_BYTES_PER_KEY if key_bytes is None else key_bytes
+            size = _HEADER_SIZE + 32 * slots + key_bytes
+
+            _shared = _open_shared(name, create=True, size=size)
+            _MAGIC.pack_into(_shared.buf, 0, _MAGIC_VALUE, _VERSION)
+            struct.pack_into(f'<{_META_FIELDS}Q', _shared.buf, _MAGIC.size,
+                             slots, capacity, key_bytes, 0, 0)
+
+        elif _MAGIC.unpack_from(_shared.buf) != (_MAGIC_VALUE, _VERSION):
+            _shared.close()
+            raise ValueError('not a SharedCountem block, or an unsupported version')
+
+        self.__shared = _shared
+        self.__lock = _FileLock(os.path.join(tempfile.gettempdir(), f'{_shared.name}.lock'))
+        self.__views: List[memoryview] = []
+        # slots never move, so each process can remember the slot of every key it has seen
+        self.__slot_cache: Dict = {}
+
+        buffer = _shared.buf
+        self.__meta = self.__view(buffer[_MAGIC.size:_HEADER_SIZE], 'Q')
+        slots = self.__meta[_SLOTS]
+        arrays = [
+            self.__view(buffer[_HEADER_SIZE + 8 * slots * i:_HEADER_SIZE + 8 * slots * (i + 1)],
+                        'Q' if i != 1 else 'q')
+            for i in range(4)
+        ]
+        self.__hashes, self.__counts, self.__offsets, self.__lengths = arrays
+        self.__blob = self.__view(buffer[_HEADER_SIZE + 32 * slots:], 'B')
+
+        if iterable is not None:
+            self.update(iterable)
+
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedCountem':
+        '''Attach to a SharedCountem created by another process, by name'''
+        return cls(_shared=_open_shared(name))
+
+
+    @property
+    def name(self) -> str:
+        '''The name of the shared memory block'''
+        return self.__shared.name
+
+
+    @property
+    def capacity(self) -> int:
+        '''The number of distinct keys the counter can hold'''
+        return self.__meta[_CAPACITY]
+
+
+    def update(self, iterable: Iterable) -> 'SharedCountem':
+        '''Add counted elements from an iterable, applying the batch under the lock
+
+            Raises a ValueError at the first new key which does not fit, once the keys
+            before it in the batch have been applied.
+        '''
+        batch = as_counts(iterable)
+        counts, cached_slot = self.__counts, self.__slot_cache.get
+
+        with self.__lock:
+            for key, count in batch.items():
+                slot = cached_slot(key)
+                if slot is None:
+                    slot = self.__find(key, insert=True)
+                counts[slot] += count
+
+        return self
+
+
+    def add(self, key, count: int = 1) -> 'SharedCountem':
+        '''Add count to a single key'''
+        return self.update({key: count})
+
+
+    def max(self) -> int|None:
+        '''Return the maximum count of any element'''
+        if not self:
+            return None
+
+        if np is not None:
+            return int(self.__occupied_counts().max())
+
+        return max(compress(self.__counts, self.__hashes))
+
+
+    def most_common(self, n: int = None) -> List[Tuple]:
+        '''Return a list of the n most common elements in descending order'''
+        if n is not None and n <= 0:
+            return []
+
+        if n is None or n >= len(self) or np is None:
+            items = zip(compress(range(len(self.__hashes)), self.__hashes),
+                        compress(self.__counts, self.__hashes))
+            top = sorted(items, reverse=True, key=itemgetter(1)) if n is None \
+                else nlargest(n, items, key=itemgetter(1))
+        else:
+            occupied = np.flatnonzero(self.__hashes_array())
+            counts = self.__occupied_counts(occupied)
+            selected = occupied[np.argpartition(counts, len(counts) - n)[len(counts) - n:]]
+            top = sorted(zip(selected.tolist(), self.__counts_array()[selected].tolist()),
+                         reverse=True, key=itemgetter(1))
+
+        return [(self.__key(slot), count) for slot, count in top]
+
+
+    def multi_mode(self) -> Tuple|None:
+        '''Return the elements with the maximum count of any element'''
+        maximum = self.max()
+
+        if not maximum:
+            return maximum
+
+        counts = self.__counts
+        return tuple(self.__key(slot) for slot in compress(range(len(counts)), self.__hashes)
+                     if counts[slot] == maximum)
+
+
+    def close(self) -> None:
+        '''Detach this process from the shared memory'''
+        if not self.__views:
+            return
+
+        for view in reversed(self.__views):
+            view.release()
+
+        self.__views.clear()
+        self.__lock.close()
+        self.__shared.close()
+
+
+    def unlink(self) -> None:
+        '''Destroy the shared memory, once every process has closed it'''
+        _unlink_shared(self.__shared)
+
+        if os.path.exists(self.__lock.path):
+            os.remove(self.__lock.path)
+
+
+    def __enter__(self) -> 'SharedCountem':
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+    def __del__(self) -> None:
+        # release the views before the block is closed, which fails while they exist
+        if hasattr(self, '_SharedCountem__views'):
+            self.close()
+
+
+    def __reduce__(self) -> Tuple:
+        # processes share the block by name rather than copying the counts
+        return SharedCountem.attach, (self.name,)
+
+
+    def __view(self, view: memoryview, typecode: str) -> memoryview:
+        '''cast a view of the block, keeping it to release on close'''
+        cast = view.cast(typecode)
+        view.release()
+        self.__views.append(cast)
+        return cast
+
+
+    def __find(self, key, insert: bool = False) -> int:
+        '''return the slot of key, inserting it if asked, else -1 if it is not present'''
+        slot = self.__slot_cache.get(key)
+        if slot is not None:
+            return slot
+
+        encoded = encode_key(key)
+        key_hash = stable_hash(encoded)[0] or 1
+        hashes, mask = self.__hashes, len(self.__hashes) - 1
+        slot = key_hash & mask
+
+        while hashes[slot]:
+            if hashes[slot] == key_hash and self.__encoded_key(slot) == encoded:
+                self.__slot_cache[key] = slot
+                return slot
+            slot = (slot + 1) & mask
+
+        if not insert:
+            return -1
+
+        self.__slot_cache[key] = self.__insert(slot, key_hash, encoded)
+        return slot
+
+
+    def __insert(self, slot: int, key_hash: int, encoded: bytes) -> int:
+        '''write a new key to an empty slot, publishing its hash last'''
+        meta = self.__meta
+        offset = meta[_KEYS_USED]
+
+        if meta[_USED] >= meta[_CAPACITY] or offset + len(encoded) > meta[_KEY_BYTES]:
+            raise ValueError('SharedCountem is full, create it with a larger capacity')
+
+        self.__blob[offset:offset + len(encoded)] = encoded
+        self.__offsets[slot], self.__lengths[slot] = offset, len(encoded)
+        self.__counts[slot] = 0
+        self.__hashes[slot] = key_hash
+        meta[_KEYS_USED] = offset + len(encoded)
+        meta[_USED] += 1
+
+        return slot
+
+
+    def __encoded_key(self, slot: int) -> bytes:
+        '''return the encoded key in a slot'''
+        offset = self.__offsets[slot]
+        return bytes(self.__blob[offset:offset + self.__lengths[slot]])
+
+
+    def __key(self, slot: int) -> Any:
+        '''return the key in a slot'''
+        return decode_key(self.__encoded_key(slot))
+
+
+    def __hashes_array(self) -> Any:
+        '''return a NumPy array over the hashes in the block'''
+        return np.frombuffer(self.__hashes, dtype=np.uint64)
+
+
+    def __counts_array(self) -> Any:
+        '''return a NumPy array over the counts in the block'''
+        return np.frombuffer(self.__counts, dtype=np.int64)
+
+
+    def __occupied_counts(self, occupied: Any = None) -> Any:
+        '''return a NumPy array of the counts of the occupied slots'''
+        if occupied is None:
+            occupied = np.flatnonzero(self.__hashes_array())
+        return self.__counts_array()[occupied]
+
+
+    def __repr__(self) -> str:
+        return f'SharedCountem({dict(self.most_common())!r})'
+
+
+    def __len__(self) -> int:
+        return self.__meta[_USED]
+
+
+    def __getitem__(self, key) -> int:
+        slot = self.__find(key)
+
+        if slot < 0:
+            raise KeyError(key)
+
+        return self.__counts[slot]
+
+
+    def __iter__(self) -> Iterator:
+        return map(self.__key, compress(range(len(self.__hashes)), self.__hashes))
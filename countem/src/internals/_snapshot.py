@@ -0,0 +1,345 @@
+''' Internal module for saving a Countem to a compact binary file and serving it from mmap '''
+
+import os
+import mmap
+import struct
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping as MappingABC
+from heapq import nlargest
+from itertools import chain
+from operator import itemgetter
+from ._merge import added
+from ._vectorised import np
+
+__all__ = ['save_snapshot', 'load_snapshot', 'SnapshotCountem']
+
+# A snapshot file is a base section followed by any number of appended delta sections,
+# whose counts add to those before them. Each section is 8 byte aligned and made up of:
+#   header:  magic, version, key kind, padding, number of keys, section size in bytes
+#   int keys:        keys array('q') in ascending order, then counts array('q')
+#   str/bytes keys:  offsets array('Q') of n + 1 into the blob, counts array('q'), then
+#                    the blob of encoded keys concatenated in ascending byte order
+# Arrays are written in the native byte order, so files are portable between
+# little-endian hosts.
+_HEADER = struct.Struct('<4sBBxxQQ')
+_MAGIC = b'CNTM'
+_VERSION = 1
+_INT, _STR, _BYTES = 0, 1, 2
+_KINDS = {int: _INT, str: _STR, bytes: _BYTES}
+
+
+def _padding(size: int) -> bytes:
+    '''return the zero bytes needed to align size to 8 bytes'''
+    return bytes(-size % 8)
+
+
+def _encode_section(counts: Mapping) -> bytes:
+    '''return a section holding the counts, with its keys sorted'''
+    key_types = set(map(type, counts))
+
+    if len(key_types) > 1 or not key_types <= _KINDS.keys():
+        raise TypeError('a snapshot holds keys of a single type: int, str or bytes')
+
+    kind = _KINDS[key_types.pop()] if key_types else _INT
+
+    if kind == _INT:
+        keys = sorted(counts)
+        body = array('q', keys).tobytes() + array('q', map(counts.__getitem__, keys)).tobytes()
+    else:
+        encoded = {key.encode('utf-8') if kind == _STR else key: key for key in counts}
+        keys = sorted(encoded)
+        offsets = array('Q', [0])
+
+        for key in keys:
+            offsets.append(offsets[-1] + len(key))
+
+        values = array('q', (counts[encoded[key]] for key in keys))
+        blob = b''.join(keys)
+        body = offsets.tobytes() + values.tobytes() + blob + _padding(len(blob))
+
+    return _HEADER.pack(_MAGIC, _VERSION, kind, len(keys), _HEADER.size + len(body)) + body
+
+
+def save_snapshot(counts: Mapping, path: os.PathLike, append: bool = False) -> None:
+    '''
+    Save counts to a snapshot file, replacing it, or appending the counts as a delta
+    which adds to the counts already in the file
+    '''
+    section = _encode_section(counts)
+
+    if append and os.path.exists(path):
+        with open(path, 'ab') as file:
+            file.write(section)
+        return
+
+    # write to a temporary file first, so a failed save does not leave half a snapshot
+    temporary = f'{os.fspath(path)}.tmp'
+    with open(temporary, 'wb') as file:
+        file.write(section)
+    os.replace(temporary, path)
+
+
+class _Section:  # pylint: disable=too-many-instance-attributes
+    '''A read-only view of one section of a snapshot, looking keys up by binary search'''
+
+    def __init__(self, buffer: memoryview, offset: int) -> None:
+        magic, version, kind, size, self.nbytes = _HEADER.unpack_from(buffer, offset)
+
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('not a Countem snapshot, or an unsupported version')
+
+        self.kind, self.size = kind, size
+        start = offset + _HEADER.size
+
+        if kind == _INT:
+            self.keys = buffer[start:start + 8 * size].cast('q')
+            self.counts_offset = start + 8 * size
+        else:
+            self.offsets = buffer[start:start + 8 * (size + 1)].cast('Q')
+            self.counts_offset = start + 8 * (size + 1)
+            blob_start = self.counts_offset + 8 * size
+            self.blob = buffer[blob_start:blob_start + self.offsets[size]]
+            self.keys = _KeyTable(self)
+
+        self.counts = buffer[self.counts_offset:self.counts_offset + 8 * size].cast('q')
+
+    def key(self, index: int) -> Any:
+        '''return the key at index'''
+        if self.kind == _INT:
+            return self.keys[index]
+
+        encoded = self.keys[index]
+        return encoded.decode('utf-8') if self.kind == _STR else encoded
+
+    def all_keys(self) -> List:
+        '''return a list of every key in order, decoding them in bulk'''
+        if self.kind == _INT:
+            return self.keys.tolist()
+
+        offsets, blob = self.offsets, bytes(self.blob)
+        bounds = map(slice, offsets[:-1], offsets[1:])
+
+        if self.kind == _STR:
+            text = blob.decode('utf-8')
+            # byte offsets only index the decoded text when every character is one byte
+            if len(text) == len(blob):
+                return list(map(text.__getitem__, bounds))
+            return [blob[bound].decode('utf-8') for bound in bounds]
+
+        return list(map(blob.__getitem__, bounds))
+
+    def find(self, key) -> int:
+        '''return the index of key, or -1 if it is not in the section'''
+        if _KINDS.get(type(key)) != self.kind:
+            return -1
+
+        if self.kind == _STR:
+            key = key.encode('utf-8')
+
+        index = bisect_left(self.keys, key)
+        return index if index < self.size and self.keys[index] == key else -1
+
+    def release(self) -> None:
+        '''release the views of the buffer so that it can be closed'''
+        for view in (self.counts, getattr(self, 'offsets', None), getattr(self, 'blob', None)):
+            if view is not None:
+                view.release()
+
+        if self.kind == _INT:
+            self.keys.release()
+
+
+class _KeyTable:
+    '''A sequence of the encoded keys of a section, for bisect'''
+
+    def __init__(self, section: _Section) -> None:
+        self.offsets, self.blob, self.size = section.offsets, section.blob, section.size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> bytes:
+        return bytes(self.blob[self.offsets[index]:self.offsets[index + 1]])
+
+
+def _read_sections(buffer: memoryview) -> List[_Section]:
+    '''return the base section and delta sections of a snapshot buffer'''
+    sections, offset = [], 0
+
+    while offset < len(buffer):
+        section = _Section(buffer, offset)
+        sections.append(section)
+        offset += section.nbytes
+
+    return sections
+
+
+def load_snapshot(path: os.PathLike) -> Dict:
+    '''return a dictionary of the counts in a snapshot file, with any deltas added'''
+    with open(path, 'rb') as file:
+        buffer = memoryview(file.read())
+
+    base, *deltas = _read_sections(buffer)
+    counts = dict(zip(base.all_keys(), base.counts.tolist()))
+
+    for section in deltas:
+        counts.update(added(counts.get, dict(zip(section.all_keys(), section.counts.tolist()))))
+
+    return counts
+
+
+class SnapshotCountem(MappingABC):
+    '''A read-only Countem served from a memory-mapped snapshot file
+
+        Lookups are a binary search of the sorted keys in the file and most_common reads
+        the packed counts directly, so no dictionary of the base counts is ever built.
+        Appended deltas are expected to be small and are merged into a dictionary on open.
+
+        Use as a context manager, or call close, to release the file.
+
+        Args: path (os.PathLike): the snapshot file to open
+    '''
+    def __init__(self, path: os.PathLike) -> None:
+        with open(path, 'rb') as file:
+            self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.__buffer = memoryview(self.__mmap)
+        sections = _read_sections(self.__buffer)
+        self.__base = sections[0]
+        self.__delta: Dict = {}
+
+        for section in sections[1:]:
+            delta = dict(zip(section.all_keys(), section.counts.tolist()))
+            self.__delta.update(added(self.__delta.get, delta))
+            section.release()
+
+        # delta keys which are also in the base, by their index in the base
+        self.__overlap = {
+            index: key for key in self.__delta if (index := self.__base.find(key)) >= 0
+        }
+
+
+    def close(self) -> None:
+        '''Release the memory-mapped file'''
+        if self.__mmap.closed:
+            return
+
+        self.__base.release()
+        self.__buffer.release()
+
+        try:
+            self.__mmap.close()
+        except BufferError:
+            # a NumPy array over the counts is still alive, perhaps held by a traceback,
+            # and the file is unmapped once it and this counter are collected
+            pass
+
+
+    def __enter__(self) -> 'SnapshotCountem':
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+    def max(self) -> int|None:
+        '''Return the maximum count of any element'''
+        top = self.most_common(1)
+        return top[0][1] if top else None
+
+
+    def most_common(self, n: int = None) -> List[Tuple]:
+        '''Return a list of the n most common elements in descending order'''
+        if n is not None and n <= 0:
+            return []
+
+        base, overlap = self.__base, self.__overlap
+
+        # the base keys touched by a delta are replaced by their combined counts
+        take = None if n is None else n + len(overlap)
+        base_items = (
+            (base.key(index), base.counts[index])
+            for index in self.__top_indexes(take) if index not in overlap
+        )
+        delta_items = ((key, self[key]) for key in self.__delta)
+
+        if n is None:
+            return sorted(chain(base_items, delta_items), reverse=True, key=itemgetter(1))
+
+        return nlargest(n, chain(base_items, delta_items), key=itemgetter(1))
+
+
+    def multi_mode(self) -> Tuple|None:
+        '''Return the elements with the maximum count of any element'''
+        maximum = self.max()
+
+        if not maximum:
+            return maximum
+
+        base, overlap = self.__base, self.__overlap
+        counts = base.counts
+
+        if np is not None:
+            indexes = np.flatnonzero(self.__counts_array() == maximum).tolist()
+        else:
+            indexes = (index for index in range(base.size) if counts[index] == maximum)
+
+        base_modes = (base.key(index) for index in indexes if index not in overlap)
+        delta_modes = (key for key in self.__delta if self[key] == maximum)
+
+        return tuple(chain(base_modes, delta_modes))
+
+
+    def __top_indexes(self, n: int = None) -> Iterable[int]:
+        '''return the indexes of the n largest counts in the base, or all of them'''
+        size = self.__base.size
+
+        if n is None or n >= size:
+            return range(size)
+
+        if np is not None:
+            counts = self.__counts_array()
+            # ties at the n-th largest count go to the lowest indexes, as in nlargest,
+            # rather than wherever argpartition leaves them
+            threshold = np.partition(counts, size - n)[size - n]
+            above = np.flatnonzero(counts > threshold)
+            tied = np.flatnonzero(counts == threshold)[:n - above.size]
+            return np.sort(np.concatenate((above, tied))).tolist()
+
+        return nlargest(n, range(size), key=self.__base.counts.__getitem__)
+
+
+    def __counts_array(self) -> Any:
+        '''return a NumPy array over the packed counts of the base'''
+        base = self.__base
+        return np.frombuffer(self.__mmap, dtype=np.int64, count=base.size,
+                             offset=base.counts_offset)
+
+
+    def __repr__(self) -> str:
+        return f'SnapshotCountem({dict(self.most_common())!r})'
+
+
+    def __len__(self) -> int:
+        return self.__base.size + len(self.__delta) - len(self.__overlap)
+
+
+    def __getitem__(self, key) -> int:
+        index = self.__base.find(key)
+        delta = self.__delta.get(key)
+
+        if index < 0 and delta is None:
+            raise KeyError(key)
+
+        return (self.__base.counts[index] if index >= 0 else 0) + (delta or 0)
+
+
+    def __iter__(self) -> Iterator:
+        base = self.__base
+        base_keys = map(base.key, range(base.size))
+        new_keys = (key for key in self.__delta if base.find(key) < 0)
+
+        return chain(base_keys, new_keys)
@@ -0,0 +1,62 @@
+''' Internal module for hashing keys the same way in every process '''
+
+import pickle
+from hashlib import blake2b
+
+__all__ = ['encode_key', 'decode_key', 'stable_hash']
+
+# the built-in hash of str and bytes is salted per process (PYTHONHASHSEED), so
+# sketches built in different workers would not line up if it were used
+_MASK_64 = (1 << 64) - 1
+
+
+def encode_key(key) -> bytes:
+    '''
+    Encode a key as bytes, tagged by type, so that equal keys encode equally
+
+    Booleans and integral floats are encoded as ints, as they are equal in a dictionary.
+    Other types are pickled, so must pickle deterministically e.g. tuples of strings.
+    '''
+    key_type = type(key)
+
+    if key_type is str:
+        return b's' + key.encode('utf-8', 'surrogatepass')
+
+    if key_type is bytes:
+        return b'b' + key
+
+    if key_type is float and key.is_integer():
+        key, key_type = int(key), int
+
+    if key_type is int or key_type is bool:
+        return b'i' + str(int(key)).encode('ascii')
+
+    return b'p' + pickle.dumps(key, protocol=4)
+
+
+def decode_key(data: bytes):
+    '''Decode a key encoded by encode_key, booleans and integral floats decoding as ints'''
+    tag, body = data[:1], data[1:]
+
+    if tag == b's':
+        return body.decode('utf-8', 'surrogatepass')
+
+    if tag == b'b':
+        return body
+
+    if tag == b'i':
+        return int(body)
+
+    return pickle.loads(body)
+
+
+def stable_hash(data: bytes, seed: int = 0) -> tuple[int, int]:
+    '''
+    Return a pair of 64 bit hashes for data, identical across processes and runs
+
+    The pair is intended for double hashing, h1 + i * h2, the second hash being odd.
+    '''
+    salt = seed.to_bytes(16, 'little')
+    digest = int.from_bytes(blake2b(data, digest_size=16, salt=salt).digest(), 'little')
+
+    return digest & _MASK_64, (digest >> 64) | 1
@@ -0,0 +1,123 @@
+''' Internal module for counting the fields of JSON lines and CSV files in one streaming pass '''
+
+import os
+import csv
+import json
+from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from ._counting import count_elements
+from ._countem import Countem
+from ._parallel import _line_ranges, _ordered_map, read_lines
+from ._path_accessors import extract_column
+
+__all__ = ['count_file']
+
+# bytes of the file read and decoded at a time, which bounds the memory used per worker
+STREAM_CHUNK_SIZE = 1 << 22
+
+FORMATS = ('jsonl', 'csv')
+
+
+def count_records_chunk(task: Tuple) -> Tuple[Dict, ...]:
+    '''
+    Return a dictionary of counts for each path, over the records starting within a
+    byte range of a file
+
+    Params:
+        task: (path, start, end, encoding, fmt, paths)
+    '''
+    *line_range, fmt, paths = task
+    lines = read_lines(*line_range)
+
+    records = list(csv.reader(lines)) if fmt == 'csv' else _parse_json_lines(lines)
+
+    counts = tuple({} for _ in paths)
+    for path_counts, path in zip(counts, paths):
+        count_elements(path_counts, extract_column(records, *path))
+
+    return counts
+
+
+def _parse_json_lines(lines: List[str]) -> List:
+    '''return the records of the non-blank lines, each line parsed as one JSON value'''
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def _column_path(header: List[str], path: Tuple) -> Tuple:
+    '''return the path with a leading column name replaced by its index in the header'''
+    column, *rest = path
+
+    if isinstance(column, str):
+        try:
+            column = header.index(column)
+        except ValueError:
+            raise KeyError(f'no column {column!r} in the CSV header') from None
+
+    return (column, *rest)
+
+
+def count_file(
+    path: os.PathLike,
+    *paths,
+    fmt: str = None,
+    workers: int = 1,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    encoding: str = 'utf-8'
+) -> Tuple[Countem, ...]:
+    '''
+    Count the values at one or more paths in each record of a JSON lines or CSV file
+
+    The file is read in byte ranges of chunk_size aligned to whole lines, each decoded
+    and parsed only when it is counted, so memory is bounded by the chunks in flight
+    and the counters, however large the file.
+
+    e.g.    statuses, hosts = count_file('access.jsonl', ('response', 'status'), 'host')
+
+    Params:
+        path: the file to count, a record per line
+        paths: a key, or a tuple of keys, for each value to count — a leading key of
+               a CSV path is a column name from its header, or a column index
+        fmt: 'jsonl' or 'csv' — defaults to csv for a .csv file, else jsonl
+        workers: processes to parse and count chunks in — 1 counts in this process
+        chunk_size: bytes of the file per chunk
+        encoding: the encoding of the file
+
+    Returns: a tuple of Countem, one for each path in order
+
+    Note: CSV fields must not contain newlines, as chunks are split on lines
+    '''
+    if fmt is None:
+        fmt = 'csv' if os.fspath(path).endswith('.csv') else 'jsonl'
+
+    if fmt not in FORMATS:
+        raise ValueError(f'fmt must be one of {FORMATS}')
+
+    paths = tuple(key if isinstance(key, tuple) else (key,) for key in paths)
+    offset = 0
+
+    if fmt == 'csv':
+        with open(path, 'rb') as file:
+            header_line = file.readline()
+
+        offset = len(header_line)
+        header = next(csv.reader([header_line.decode(encoding)]), [])
+        paths = tuple(_column_path(header, path) for path in paths)
+
+    tasks = (
+        (*line_range, fmt, paths)
+        for line_range in _line_ranges(path, chunk_size, encoding, offset)
+    )
+    counters = tuple(Countem() for _ in paths)
+
+    def merge(results):
+        for counts in results:
+            for counter, path_counts in zip(counters, counts):
+                counter.update(path_counts)
+
+    if workers == 1:
+        merge(map(count_records_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            merge(_ordered_map(executor, count_records_chunk, tasks, workers * 2))
+
+    return counters
@@ -0,0 +1,98 @@
+''' Internal module for counting numeric arrays with vectorised NumPy operations '''
+
+from typing import Any, List, Tuple
+from array import array
+
+# NumPy is optional, without it numeric arrays are counted element by element
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = ['as_numeric_array', 'count_numeric', 'worth_vectorising']
+
+# array.array typecodes holding numbers, which NumPy shares as dtype codes
+_NUMERIC_TYPECODES = frozenset('bBhHiIlLqQfd')
+
+# bool, signed int, unsigned int and float
+_NUMERIC_KINDS = frozenset('biuf')
+
+# integers are counted with bincount while their range is no more than this multiple
+# of the array's length, beyond that np.unique's sort is cheaper than the bins
+_BINCOUNT_RANGE_RATIO = 4
+
+# beyond the bincount range np.unique sorts, which for integers that are nearly all
+# distinct costs more than counting them as Python ints, so the share of distinct values
+# is estimated from an evenly spaced sample of _SAMPLE_SIZE of them
+_SAMPLE_SIZE = 4096
+_DISTINCT_RATIO = 0.9
+
+
+def as_numeric_array(iterable: Any) -> Any:
+    '''
+    Return iterable as a one dimensional numeric NumPy array sharing its buffer, or None
+    if it is not a numeric NumPy array or array.array, or NumPy is not installed
+    '''
+    if np is None:
+        return None
+
+    if isinstance(iterable, np.ndarray):
+        if iterable.ndim == 1 and iterable.dtype.kind in _NUMERIC_KINDS:
+            return iterable
+        return None
+
+    if isinstance(iterable, array) and iterable.typecode in _NUMERIC_TYPECODES:
+        return np.frombuffer(iterable, dtype=iterable.typecode)
+
+    return None
+
+
+def worth_vectorising(values: Any) -> bool:
+    '''
+    Return False for a numeric NumPy array of integers too sparse for bincount which
+    look nearly all distinct, where counting values.tolist() is faster than count_numeric
+    '''
+    size = values.size
+
+    if values.dtype.kind not in 'iu' or size <= _SAMPLE_SIZE:
+        return True
+
+    if int(values.max()) - int(values.min()) <= _BINCOUNT_RANGE_RATIO * size:
+        return True
+
+    sample = values[::size // _SAMPLE_SIZE]
+    duplicates = sample.size - np.unique(sample).size
+
+    # a sample of m values from u distinct values holds about m * m / 2u repeats
+    return 2 * duplicates * _DISTINCT_RATIO * size >= sample.size ** 2
+
+
+def count_numeric(values: Any) -> Tuple[List, List[int]]:
+    '''
+    Count a numeric NumPy array, returning the distinct values, as Python numbers, and
+    their counts. Values are returned in ascending order, not order of first appearance.
+
+    Note: NaNs are counted together under one key, rather than one key per NaN.
+    '''
+    if not values.size:
+        return [], []
+
+    if values.dtype.kind in 'iu':
+        low, high = values.min(), values.max()
+
+        if int(high) - int(low) <= _BINCOUNT_RANGE_RATIO * values.size:
+            if values.dtype.kind == 'i':
+                # offsets from low are taken in int64, as they overflow a narrower type
+                offsets, base = values.astype(np.int64) - int(low), int(low)
+            else:
+                # unsigned values are never below low, so their offsets always fit
+                offsets, base = values - low, low
+
+            counts = np.bincount(offsets.astype(np.intp))
+            present = np.flatnonzero(counts)
+            keys = present + base if values.dtype.kind == 'i' \
+                else present.astype(values.dtype) + base
+            return keys.tolist(), counts[present].tolist()
+
+    keys, counts = np.unique(values, return_counts=True)
+    return keys.tolist(), counts.tolist()
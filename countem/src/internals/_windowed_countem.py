@@ -0,0 +1,166 @@
+''' Internal module for counting elements over a sliding window of events '''
+
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+from collections import deque
+from collections.abc import ItemsView, KeysView, Mapping, ValuesView
+from itertools import chain, repeat
+from ._indexed_countem import IndexedCountem
+
+__all__ = ['WindowedCountem']
+
+
+class WindowedCountem(Mapping):
+    '''Counts the elements of the last maxlen events and/or the events of the last window seconds
+
+        Events are kept in arrival order and expire from the front one at a time as new
+        events arrive, or as time passes for a time window, so each event costs amortised
+        O(1) to add and to expire. Counts are held in an IndexedCountem, which keeps max,
+        multi_mode and most_common(n) cheap however far the window slides.
+
+        Elements whose events have all expired are removed from the counter.
+
+        Args:
+            iterable (Iterable): An iterable of events, or a mapping of element counts
+            maxlen (int): the number of most recent events to count
+            window (float): the number of seconds of events to count
+            clock (Callable): returns the current time in seconds, defaults to time.monotonic
+    '''
+    def __init__(
+        self,
+        iterable: Iterable=None,
+        maxlen: int = None,
+        window: float = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if maxlen is None and window is None:
+            raise ValueError('WindowedCountem expected a maxlen or a window')
+
+        if (maxlen is not None and maxlen < 1) or (window is not None and window <= 0):
+            raise ValueError('maxlen and window must be positive')
+
+        self.maxlen, self.window, self.clock = maxlen, window, clock
+        self.__counts = IndexedCountem()
+        # (timestamp, element) for each event in the window, oldest first
+        self.__events: deque = deque()
+
+        if iterable is not None:
+            self.update(iterable)
+
+
+    def add(self, key, timestamp: float = None) -> 'WindowedCountem':
+        '''Add a single event, at the current time unless a timestamp is given'''
+        if timestamp is None:
+            timestamp = self.clock()
+
+        counts, events = self.__counts, self.__events
+        counts[key] = counts.get(key, 0) + 1
+        events.append((timestamp, key))
+
+        if self.maxlen is not None and len(events) > self.maxlen:
+            self.__expire_oldest()
+
+        return self.expire(timestamp)
+
+
+    def update(self, iterable: Iterable, timestamp: float = None) -> 'WindowedCountem':
+        '''Add the events of an iterable, or count times each element of a mapping'''
+        if timestamp is None:
+            timestamp = self.clock()
+
+        if isinstance(iterable, Mapping):
+            iterable = chain.from_iterable(map(repeat, iterable.keys(), iterable.values()))
+
+        for key in iterable:
+            self.add(key, timestamp)
+
+        return self
+
+
+    def expire(self, now: float = None) -> 'WindowedCountem':
+        '''Expire the events which have fallen out of a time window'''
+        if self.window is not None:
+            horizon = (self.clock() if now is None else now) - self.window
+            events = self.__events
+
+            while events and events[0][0] <= horizon:
+                self.__expire_oldest()
+
+        return self
+
+
+    def max(self) -> int|None:
+        '''Return the maximum count of any element in the window'''
+        self.expire()
+        return self.__counts.max()
+
+
+    def most_common(self, n: int = None) -> List[Tuple]:
+        '''Return a list of the n most common elements in the window in descending order'''
+        self.expire()
+        return self.__counts.most_common(n)
+
+
+    def multi_mode(self) -> Tuple|None:
+        '''Return the elements with the maximum count in the window'''
+        self.expire()
+        return self.__counts.multi_mode()
+
+
+    def snapshot(self) -> Dict:
+        '''Return a dictionary of the counts in the window at a single time'''
+        self.expire()
+        return dict(self.__counts.items())
+
+
+    def keys_with_count(self, count: int) -> Tuple:
+        '''Return the elements with the given count in the window'''
+        self.expire()
+        return self.__counts.keys_with_count(count)
+
+
+    def __expire_oldest(self) -> None:
+        '''remove the oldest event, dropping its element when it has no events left'''
+        _, key = self.__events.popleft()
+        counts = self.__counts
+        count = counts[key] - 1
+
+        if count:
+            counts[key] = count
+        else:
+            del counts[key]
+
+
+    def __repr__(self) -> str:
+        return f'WindowedCountem({dict(self.most_common())!r})'
+
+
+    def __len__(self) -> int:
+        self.expire()
+        return len(self.__counts)
+
+
+    def __getitem__(self, key) -> int:
+        self.expire()
+        return self.__counts[key]
+
+
+    def __iter__(self) -> Iterable:
+        # a snapshot, as reading a count while iterating can expire elements
+        self.expire()
+        return iter(list(self.__counts))
+
+
+    def keys(self) -> KeysView:
+        '''Return a snapshot of the elements in the window, see snapshot'''
+        return self.snapshot().keys()
+
+
+    def items(self) -> ItemsView:
+        '''Return a snapshot of the elements in the window and their counts, see snapshot'''
+        return self.snapshot().items()
+
+
+    def values(self) -> ValuesView:
+        '''Return a snapshot of the counts in the window, see snapshot'''
+        return self.snapshot().values()
@@ -0,0 +1,25 @@
+''' Fixtures shared by the countem test suites '''
+
+from pytest import fixture, skip
+
+
+@fixture(params=['numpy', 'pure python'])
+def vectorised(request, monkeypatch):
+    '''
+    Run a test with and without NumPy in the module named by the VECTORISED_MODULE
+    of its test module, skipping the NumPy run where NumPy is not installed
+
+    e.g.    VECTORISED_MODULE = _dense_countem
+
+            @mark.usefixtures('vectorised')
+            def test_max(self): ...
+    '''
+    module = request.module.VECTORISED_MODULE
+
+    if request.param == 'numpy' and module.np is None:
+        skip('NumPy is not installed')
+
+    if request.param == 'pure python':
+        monkeypatch.setattr(module, 'np', None)
+
+    return request.param
@@ -0,0 +1,117 @@
+''' Test suite for the ApproxCountem module '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import pickle
+import warnings
+from random import Random
+from pytest import mark, raises
+from countem.src import ApproxCountem, Countem
+from countem.src.internals._approx_countem import _BATCH_SIZE
+
+
+def skewed_stream(size: int, seed: int = 1) -> list:
+    rand = Random(seed)
+    return [int(rand.paretovariate(1.1)) for _ in range(size)]
+
+
+@mark.describe('Tests for ApproxCountem class')
+class TestApproxCountem:
+
+    @mark.it('gives exact counts when the elements fit in the top table')
+    def test_exact_for_few_elements(self):
+        approx = ApproxCountem('abracadabra')
+
+        assert approx == Countem('abracadabra')
+        assert approx.most_common(2) == [('a', 5), ('b', 2)]
+        assert approx.max() == 5
+        assert approx.multi_mode() == ('a',)
+        assert approx.total == 11
+
+
+    @mark.it('never underestimates and stays within the error bound')
+    def test_error_bounds(self):
+        stream = skewed_stream(20000)
+        exact = Countem(stream)
+        approx = ApproxCountem(stream, epsilon=0.01, delta=0.01, top_k=10)
+
+        bound = approx.epsilon * approx.total
+        for key, count in exact.items():
+            assert count <= approx.estimate(key) <= count + bound
+
+        assert approx.nbytes == 8 * approx.width * approx.depth
+        assert len(approx) == 10
+
+
+    @mark.it('tracks the heaviest elements in the top table')
+    def test_heavy_hitters(self):
+        stream = skewed_stream(20000)
+        exact = Countem(stream)
+        approx = ApproxCountem(stream, top_k=20)
+
+        heavy = [key for key, count in exact.items() if count > approx.total / approx.top_k]
+        assert all(key in approx for key in heavy)
+        assert [key for key, _ in approx.most_common(3)] == [1, 2, 3]
+
+
+    @mark.it('merges sketches with + and | including across pickling')
+    def test_merge(self):
+        stream = skewed_stream(10000)
+        left, right = stream[:6000], stream[6000:]
+
+        whole = ApproxCountem(stream, top_k=20)
+        merged = pickle.loads(pickle.dumps(ApproxCountem(left, top_k=20))) \
+            + ApproxCountem(right, top_k=20)
+
+        assert merged.total == whole.total
+        assert merged.most_common(5) == whole.most_common(5)
+
+        with warnings.catch_warnings():
+            # pickling an itertools.count is deprecated from Python 3.12
+            warnings.simplefilter('error')
+            restored = pickle.loads(pickle.dumps(whole))
+        assert restored.update('x').total == whole.total + 1
+
+        union = ApproxCountem('aaab') | ApproxCountem('abbbbc')
+        assert union == {'a': 3, 'b': 4, 'c': 1}
+
+
+    @mark.it('adds a long iterable in batches rather than counting it all up front')
+    def test_update_in_batches(self):
+        approx = ApproxCountem()
+        totals = []
+
+        def stream():
+            yield from range(_BATCH_SIZE)
+            totals.append(approx.total)
+            yield 'x'
+
+        approx.update(stream())
+
+        assert totals == [_BATCH_SIZE]
+        assert approx.total == _BATCH_SIZE + 1
+
+
+    @mark.it('indexes tracked elements only, agreeing with in, and estimates any element')
+    def test_mapping(self):
+        approx = ApproxCountem('baaa', top_k=1)
+
+        assert 'a' in approx and 'b' not in approx
+        assert approx['a'] == approx.get('a') == 3
+        assert approx.get('b') is None and approx.get('b', 0) == 0
+        assert approx.estimate('b') >= 1
+
+        with raises(KeyError):
+            _ = approx['b']
+
+
+    @mark.it('raises a ValueError for mismatched sketches, negative counts or bad dimensions')
+    def test_errors(self):
+        with raises(ValueError):
+            ApproxCountem('abc') + ApproxCountem('abc', epsilon=0.01)
+        with raises(ValueError):
+            ApproxCountem({'a': -1})
+        with raises(ValueError):
+            ApproxCountem(epsilon=0)
+        with raises(ValueError):
+            ApproxCountem(top_k=0)
@@ -0,0 +1,43 @@
+''' Test suite for the countem benchmark suite '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from pytest import mark
+from countem.benchmarks import CASES, DISTRIBUTIONS, run_suite, check_regressions
+
+
+@mark.describe('Tests for the benchmark distributions')
+class TestDistributions:
+
+    @mark.it('returns size elements, reproducibly, with the expected spread of keys')
+    def test_distributions(self):
+        for make in DISTRIBUTIONS.values():
+            assert len(make(1000)) == 1000
+            assert make(1000) == make(1000)
+
+        assert len(set(DISTRIBUTIONS['all_unique'](1000))) == 1000
+        assert len(set(DISTRIBUTIONS['uniform'](1000))) <= 100
+
+
+@mark.describe('Tests for run_suite and check_regressions')
+class TestSuite:
+
+    @mark.it('times every case against collections.Counter')
+    def test_run_suite(self):
+        results = run_suite([200], ['zipf'], repeat=1)
+
+        assert [result['case'] for result in results] == list(CASES)
+        for result in results:
+            assert result['seconds'] > 0
+            assert result['relative'] == result['seconds'] / result['counter_seconds']
+
+
+    @mark.it('reports results slower than the baseline by more than the tolerance')
+    def test_check_regressions(self):
+        baseline = run_suite([200], ['uniform'], ['construct', 'multi_mode'], repeat=1)
+        slower = [dict(result, relative=result['relative'] * 2) for result in baseline]
+        slower[1]['relative'] = baseline[1]['relative']
+
+        assert not check_regressions(baseline, baseline, 0.25)
+        regressions = check_regressions(slower, baseline, 0.25)
+        assert len(regressions) == 1 and 'construct' in regressions[0]
@@ -0,0 +1,76 @@
+''' Test suite for the ConcurrentCountem module '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from threading import Thread
+from pytest import mark, raises
+from countem.src import ConcurrentCountem, Countem
+
+
+@mark.describe('Tests for ConcurrentCountem class')
+class TestConcurrentCountem:
+
+    @mark.it('counts iterables and mappings like Countem')
+    @mark.parametrize('flush_size', [1, 3, 100])
+    def test_counts_match_countem(self, flush_size):
+        counted = ConcurrentCountem('abracadabra', flush_size=flush_size)
+        counted.update({'a': 2, 'z': 1}).add('b').add('q', 3)
+        expected = Countem('abracadabra') + {'a': 2, 'z': 1, 'b': 1, 'q': 3}
+
+        assert counted == expected
+        assert len(counted) == len(expected)
+        assert counted['a'] == 7
+        assert counted.max() == 7
+        assert counted.multi_mode() == ('a',)
+        assert counted.most_common(2) == [('a', 7), ('b', 3)]
+        assert counted.snapshot() == expected
+
+
+    @mark.it('loses no counts when many threads update and read at once')
+    @mark.parametrize('flush_size', [10, 100_000])
+    def test_threads(self, flush_size):
+        counted = ConcurrentCountem(flush_size=flush_size)
+        words = [f'word{i % 50}' for i in range(1000)]
+
+        def produce():
+            for start in range(0, len(words), 100):
+                counted.update(words[start:start + 100])
+            for word in words[:10]:
+                counted.add(word)
+                assert counted.max() >= 1
+
+        threads = [Thread(target=produce) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expected = Countem(words * 8 + words[:10] * 8)
+        assert counted.snapshot() == expected
+
+
+    @mark.it('drops the buffers of finished threads once they are flushed')
+    def test_finished_threads(self):
+        counted = ConcurrentCountem()
+        counted.add('main')
+
+        for _ in range(20):
+            thread = Thread(target=counted.update, args=('abc',))
+            thread.start()
+            thread.join()
+
+        assert counted.snapshot() == Countem('abc' * 20) + {'main': 1}
+        assert len(counted._ConcurrentCountem__buffers) == 1  # pylint: disable=protected-access
+
+        counted.add('main')
+        assert counted['main'] == 2
+
+
+    @mark.it('returns None for max and multi_mode when empty')
+    def test_empty(self):
+        assert ConcurrentCountem().max() is None
+        assert ConcurrentCountem().multi_mode() is None
+        assert not ConcurrentCountem()
+
+        with raises(KeyError):
+            _ = ConcurrentCountem()['a']
@@ -102,3 +102,73 @@ class TestCountem:
         # subtract inplace
         counted.subtract(other)
         assert counted == expected
+
+
+@mark.describe('Tests for Countem.most_common and repr')
+class TestCountemMostCommon:
+
+    @mark.it('returns the same n most common elements whether selected by heap or sort')
+    def test_most_common_selection_matches_sort(self):
+        counted = Countem(i % 97 for i in range(5000) if i % 3)
+        expected = sorted(counted.items(), reverse=True, key=lambda item: item[1])
+
+        for n in (0, 1, 3, 10, 50, 97, 200):
+            assert counted.most_common(n) == expected[:n]
+
+        assert counted.most_common() == expected
+
+
+    @mark.it('keeps elements with equal counts in insertion order')
+    def test_most_common_ties_in_insertion_order(self):
+        counted = Countem('zyx' * 10 + 'abcdefghijklmnopqrstuvw' * 3)
+        assert counted.most_common(3) == [('z', 10), ('y', 10), ('x', 10)]
+
+
+    @mark.it('truncates the repr of a large counter to the most common elements')
+    def test_repr_of_large_counter_is_truncated(self):
+        counted = Countem(range(5000))
+        counted.update([4999])
+
+        result = repr(counted)
+        assert result.startswith('Countem({4999: 2, 0: 1, 1: 1')
+        assert result.endswith(', ...})')
+        assert result.count(':') == 1000
+
+
+@mark.describe('Tests for merging Countem instances')
+class TestCountemMerge:
+
+    @mark.it('returns the union of counts with | and |= keeping the larger count')
+    def test_union(self):
+        counted = Countem('aaabc')
+        assert counted | Countem('abbcc') == {'a': 3, 'b': 2, 'c': 2}
+        assert counted | {'d': 0, 'e': 2, 'a': -1} == {'a': 3, 'b': 1, 'c': 1, 'e': 2}
+
+        counted |= 'bbbb'
+        assert counted == {'a': 3, 'b': 4, 'c': 1}
+
+
+    @mark.it('leaves the operands of +, - and | unchanged')
+    def test_operands_unchanged(self):
+        left, right = Countem('aab'), Countem('abc')
+        assert left + right == {'a': 3, 'b': 2, 'c': 1}
+        assert left - right == {'a': 1, 'b': 0, 'c': -1}
+        assert left | right == {'a': 2, 'b': 1, 'c': 1}
+        assert left == {'a': 2, 'b': 1}
+        assert right == {'a': 1, 'b': 1, 'c': 1}
+
+
+    @mark.it('sums many counters, mappings and iterables with merge_many')
+    def test_merge_many(self):
+        result = Countem.merge_many([Countem('ab'), {'b': 2, 'c': 1}, 'cd', Countem()])
+        assert result == {'a': 1, 'b': 3, 'c': 2, 'd': 1}
+        assert list(result) == ['a', 'b', 'c', 'd']
+        assert not Countem.merge_many([])
+
+
+    @mark.it('counts the values at a path in each record with count_by')
+    def test_count_by(self):
+        records = [{'pet': {'kind': 'cat'}}, {'pet': {'kind': 'dog'}}, {'pet': {'kind': 'cat'}}, {}]
+        assert Countem.count_by(records, 'pet', 'kind') == {'cat': 2, 'dog': 1, None: 1}
+        assert Countem.count_by(iter(records), 'pet', 'kind', default='none') == \
+            {'cat': 2, 'dog': 1, 'none': 1}
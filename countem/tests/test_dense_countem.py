@@ -0,0 +1,83 @@
+''' Test suite for the DenseCountem module '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from array import array
+from pytest import mark, raises
+from countem.src import Countem, DenseCountem
+from countem.src.internals import _dense_countem
+
+
+VECTORISED_MODULE = _dense_countem
+
+
+@mark.describe('Tests for DenseCountem class')
+class TestDenseCountem:
+
+    @mark.it('counts small ints in the array and other keys as outliers')
+    def test_counts_match_countem(self):
+        elements = [3, 1, 3, -2, 'a', 3, 10**9, True, 1, 'a']
+        counted = DenseCountem(elements, max_dense=64)
+
+        assert counted == Countem(elements)
+        assert len(counted) == 5
+        assert list(counted) == [1, 3, -2, 'a', 10**9]
+        assert 0 not in counted and 2 not in counted
+        assert counted.nbytes == 9 * 4
+
+
+    @mark.it('counts keys equal to an int in the array, such as True and 1.0, in its slot')
+    def test_equal_keys(self):
+        counted = DenseCountem([True], max_dense=64).update([1]).update({1.0: 2})
+        counted.update(array('q', [1] * 300)).update([2.5, -1.0])
+
+        assert len(counted) == 3
+        assert counted[1] == counted[True] == 304
+        assert counted.most_common() == [(1, 304), (2.5, 1), (-1.0, 1)]
+        assert counted == Countem([True, 1, 1.0, 1.0] + [1] * 300 + [2.5, -1.0])
+
+        del counted[True]
+        assert 1 not in counted and len(counted) == 2
+
+
+    @mark.it('returns the maximum count and modes across the array and outliers')
+    @mark.usefixtures('vectorised')
+    def test_max_and_multi_mode(self):
+        counted = DenseCountem([5, 5, 'x', 'x', 2])
+        assert counted.max() == 2
+        assert counted.multi_mode() == (5, 'x')
+
+        counted.subtract([5, 5, 5, 2, 2, 2])
+        assert counted.max() == 2
+        assert counted.multi_mode() == ('x',)
+
+        assert DenseCountem().max() is None
+        assert DenseCountem().multi_mode() is None
+        assert DenseCountem({7: -3, 9: -1}).max() == -1
+
+
+    @mark.it('updates, subtracts and merges with the same results as Countem')
+    def test_arithmetic(self):
+        left, right = [1, 2, 2, 300, 'b'], array('i', [2, 3, 3, 300])
+
+        assert DenseCountem(left) + right == Countem(left) + list(right)
+        assert DenseCountem(left) - right == Countem(left) - list(right)
+        assert DenseCountem(left) | DenseCountem(right) == Countem(left) | Countem(list(right))
+        assert DenseCountem(left).most_common(2) == [(2, 2), (1, 1)]
+
+
+    @mark.it('copies independently and supports deleting keys')
+    def test_copy_and_delete(self):
+        counted = DenseCountem([1, 1, 'a'])
+        copied = counted.copy()
+        copied.update([1, 4])
+
+        del counted[1]
+        del counted['a']
+        assert not counted
+        assert copied == {1: 3, 'a': 1, 4: 1}
+
+        with raises(KeyError):
+            del counted[1]
+        with raises(KeyError):
+            _ = counted[4]
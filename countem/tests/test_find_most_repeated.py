@@ -2,8 +2,10 @@
 # pylint: disable=missing-function-docstring
 # pylint: disable=missing-class-docstring
 
+import random
 from pytest import mark
-from countem.src.find_most_repeated import find_most_repeated
+from countem.src import Countem
+from countem.src.find_most_repeated import find_most_repeated, top_k_repeated
 
 
 @mark.describe('Tests for find most repeated function')
@@ -40,3 +42,44 @@ class TestFindMostRepeated:
     def test_with_multiple_repetitions(self):
         elements = ['a', 'b', 'b', 3, 'c', 3, 'c', 3, 'b']
         assert find_most_repeated(elements) == {'elements': ['b', 3], 'repeats': 3}
+
+
+    @mark.it('accepts generators and other iterables')
+    def test_with_generators(self):
+        elements = ['a', 'b', 'b', 3, 'c', 3, 'c', 3, 'b']
+        assert find_most_repeated(iter(elements)) == {'elements': ['b', 3], 'repeats': 3}
+        assert find_most_repeated(x for x in 'abcabca') == {'elements': ['a'], 'repeats': 3}
+
+
+    @mark.it('returns the default dictionary when nothing repeats min_repeats times')
+    def test_with_min_repeats(self):
+        assert find_most_repeated('aabbb', min_repeats=4) == {'elements': [], 'repeats': None}
+        assert find_most_repeated('aabbb', min_repeats=3) == {'elements': ['b'], 'repeats': 3}
+
+
+    @mark.it('stops counting early with the same answer as a full count')
+    def test_early_exit(self):
+        randoms = random.Random(12)
+
+        for _ in range(200):
+            elements = randoms.choices('abcd', weights=(8, 2, 1, 1), k=randoms.randrange(30))
+            counts = Countem(elements)
+            maxcount = counts.max()
+            expected = {'elements': list(counts.multi_mode()), 'repeats': maxcount} \
+                if maxcount and maxcount >= 2 else {'elements': [], 'repeats': None}
+
+            assert find_most_repeated(elements) == expected
+            assert find_most_repeated(tuple(elements)) == expected
+            assert find_most_repeated(''.join(elements)) == expected
+
+
+@mark.describe('Tests for top k repeated function')
+class TestTopKRepeated:
+
+    @mark.it('returns the k most repeated elements, ties in the order first seen')
+    def test_top_k(self):
+        elements = ['a', 'b', 'b', 3, 'c', 3, 'c', 3, 'b']
+        assert top_k_repeated(elements, 2) == [('b', 3), (3, 3)]
+        assert top_k_repeated(elements, 5) == [('b', 3), (3, 3), ('c', 2)]
+        assert top_k_repeated(iter(elements), 5, min_repeats=3) == [('b', 3), (3, 3)]
+        assert not top_k_repeated('abc', 2)
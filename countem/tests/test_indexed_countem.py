@@ -0,0 +1,98 @@
+''' Test suite for the IndexedCountem module '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from pytest import mark, raises
+from countem.src import Countem, IndexedCountem
+
+
+@mark.describe('Tests for IndexedCountem class')
+class TestIndexedCountem:
+
+    @mark.it('counts iterables and mappings the same as Countem')
+    def test_counts_match_countem(self):
+        assert IndexedCountem('abracadabra') == Countem('abracadabra')
+        assert IndexedCountem({'a': 2, 'b': 5}) == {'a': 2, 'b': 5}
+        assert isinstance(IndexedCountem('abc').copy(), IndexedCountem)
+
+
+    @mark.it('returns the maximum count and modes, or None when empty')
+    def test_max_and_multi_mode(self):
+        counted = IndexedCountem()
+        assert counted.max() is None
+        assert counted.multi_mode() is None
+
+        counted.update('abcab')
+        assert counted.max() == 2
+        assert counted.multi_mode() == ('a', 'b')
+
+
+    @mark.it('keeps the index up to date through update, subtract, setitem and operators')
+    def test_index_follows_mutations(self):
+        counted = IndexedCountem('aaabbc')
+        counted.subtract('aa')
+        assert counted.max() == 2
+        assert counted.multi_mode() == ('b',)
+        assert counted.keys_with_count(1) == ('c', 'a')
+
+        counted['c'] = 7
+        assert counted.multi_mode() == ('c',)
+        assert counted.keys_with_count(1) == ('a',)
+
+        counted.update({'a': 6, 'd': 7})
+        assert counted.multi_mode() == ('c', 'a', 'd')
+        assert counted.keys_with_count(2) == ('b',)
+
+        merged = counted | IndexedCountem('bbbbbbbbb')
+        assert merged.multi_mode() == ('b',)
+        assert counted.multi_mode() == ('c', 'a', 'd')
+
+        assert (counted - {'c': 7}).keys_with_count(0) == ('c',)
+
+
+    @mark.it('returns the most common elements in descending order of count')
+    def test_most_common(self):
+        counted = IndexedCountem('aaaabbbccd')
+        assert counted.most_common() == [('a', 4), ('b', 3), ('c', 2), ('d', 1)]
+        assert counted.most_common(2) == [('a', 4), ('b', 3)]
+        assert counted.most_common(0) == []
+        assert repr(counted) == "IndexedCountem({'a': 4, 'b': 3, 'c': 2, 'd': 1})"
+
+
+    @mark.it('ranks elements by count with ties sharing a rank')
+    def test_rank(self):
+        counted = IndexedCountem('aaaabbbccdde')
+        assert [counted.rank(key) for key in 'abcde'] == [1, 2, 3, 3, 5]
+
+        counted.update('ee')
+        assert counted.rank('e') == 2 and counted.rank('b') == 2 and counted.rank('c') == 4
+
+        with raises(KeyError):
+            counted.rank('z')
+
+
+    @mark.it('returns the count at a quantile of the counts, by nearest rank')
+    def test_quantile(self):
+        counted = IndexedCountem({f'k{i}': i for i in range(1, 101)})
+        assert counted.quantile(0) == 1
+        assert counted.quantile(0.5) == 50
+        assert counted.quantile(0.99) == 99
+        assert counted.quantile(1) == 100
+
+        counted.subtract({'k100': 50})
+        assert counted.quantile(1) == 99
+        assert IndexedCountem().quantile(0.5) is None
+
+        with raises(ValueError):
+            counted.quantile(1.5)
+
+
+    @mark.it('returns elements within a range of counts and a histogram of counts')
+    def test_ranges_and_histogram(self):
+        counted = IndexedCountem('aaaabbbccdde')
+        assert counted.keys_with_count_between(2, 3) == ('b', 'c', 'd')
+        assert counted.keys_with_count_between(5, 9) == ()
+        assert counted.count_histogram() == {1: 1, 2: 2, 3: 1, 4: 1}
+
+        del counted['a']
+        assert counted.count_histogram() == {1: 1, 2: 2, 3: 1}
@@ -0,0 +1,65 @@
+''' Test suite for counting elements across a pool of processes '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from pathlib import Path
+from pytest import mark
+from countem.src import Countem
+
+WORDS = [f'word{i % 37}' for i in range(2000)] + ['unique']
+
+
+@mark.describe('Tests for Countem.from_parallel')
+class TestFromParallel:
+
+    @mark.it('returns the same counts, in the same order, as counting serially')
+    @mark.parametrize('workers, chunk_size', [(1, None), (1, 7), (2, 150), (3, None)])
+    def test_matches_serial_count(self, workers, chunk_size):
+        result = Countem.from_parallel(WORDS, workers=workers, chunk_size=chunk_size)
+        expected = Countem(WORDS)
+
+        assert result == expected
+        assert list(result) == list(expected)
+
+
+    @mark.it('counts an iterator of unknown length and an iterable of chunks')
+    def test_iterators_and_chunks(self):
+        assert Countem.from_parallel(iter(WORDS), workers=2, chunk_size=300) == Countem(WORDS)
+
+        chunks = [WORDS[:500], WORDS[500:501], WORDS[501:]]
+        assert Countem.from_parallel(chunks, workers=2, chunked=True) == Countem(WORDS)
+
+
+    @mark.it('counts the lines of a file split into byte ranges')
+    @mark.parametrize('chunk_size', [1, 5, 64, None])
+    def test_file_of_lines(self, tmp_path: Path, chunk_size):
+        path = tmp_path / 'words.txt'
+        path.write_text('\n'.join(WORDS) + '\n', encoding='utf-8')
+
+        result = Countem.from_parallel(path, workers=2, chunk_size=chunk_size)
+        assert result == Countem(WORDS)
+        assert list(result) == list(Countem(WORDS))
+
+
+    @mark.it('splits a file only on newlines, as a serial read of its lines does')
+    @mark.parametrize('chunk_size', [1, 7, None])
+    def test_line_separators(self, tmp_path: Path, chunk_size):
+        path = tmp_path / 'separators.txt'
+        lines = ['a\u2028b', 'c\x85d', 'e\x0cf', 'a\u2028b', 'g\r', 'g', '', 'h']
+        path.write_bytes('\n'.join(lines).encode('utf-8'))
+
+        with open(path, encoding='utf-8', newline='') as file:
+            expected = Countem(line.removesuffix('\n').removesuffix('\r') for line in file)
+
+        result = Countem.from_parallel(path, workers=2, chunk_size=chunk_size)
+        assert result == expected
+        assert result['a\u2028b'] == 2 and result['g'] == 2 and len(result) == 6
+
+
+    @mark.it('returns an empty counter for empty input')
+    def test_empty_input(self, tmp_path: Path):
+        path = tmp_path / 'empty.txt'
+        path.touch()
+
+        assert not Countem.from_parallel([], workers=2)
+        assert not Countem.from_parallel(path, workers=2)
@@ -4,7 +4,8 @@
 
 import re
 from pytest import mark
-from countem.src import get_by_path
+from countem.src import get_by_path, extract_column
+from countem.src.internals import _path_accessors
 
 # Test cases for get_by_path
 test_cases_get_by_path = [
@@ -45,3 +46,42 @@ class TestFindMostRepeated:
     )
     def test_returns_the_correct_property(self, path, obj, expected):
         assert get_by_path(*path)(obj) == expected
+
+
+    @mark.it('given a path of any length, matches looking up each key in turn')
+    def test_compiled_lengths(self):
+        nested = {'a': [{'b': {'c': {'d': {'e': 5}}}}]}
+        path = ('a', 0, 'b', 'c', 'd', 'e')
+
+        for length in range(len(path) + 1):
+            expected = nested
+            for key in path[:length]:
+                expected = expected[key]
+            assert get_by_path(*path[:length])(nested) == expected
+
+        assert get_by_path(*path, 'f', default=-1)(nested) == -1
+
+
+@mark.describe('Tests for extract_column')
+class TestExtractColumn:
+
+    @mark.it('returns the value at a path from every record')
+    def test_extracts_column(self):
+        records = [{'a': {'b': i}} for i in range(5)]
+        assert extract_column(records, 'a', 'b') == [0, 1, 2, 3, 4]
+        assert extract_column(iter(records), 'a') == [{'b': i} for i in range(5)]
+
+
+    @mark.it('returns the default for records missing the path')
+    def test_falls_back_to_default(self):
+        records = [{'a': [1, 2]}, {'a': [3]}, {'b': 4}, 'a', None]
+        assert extract_column(records, 'a', 1) == [2, None, None, None, None]
+        assert extract_column(records, 'a', 0, default=0) == [1, 3, 0, 0, 0]
+
+
+    @mark.it('extracts records from lists and iterators in chunks')
+    def test_chunks(self, monkeypatch):
+        monkeypatch.setattr(_path_accessors, 'COLUMN_CHUNK_SIZE', 2)
+        records = ({'a': i} if i % 3 else {} for i in range(7))
+        assert extract_column(records, 'a', default='-') == ['-', 1, 2, '-', 4, 5, '-']
+        assert extract_column([{}, {'a': 1}, {'a': 2}], 'a') == [None, 1, 2]
@@ -0,0 +1,98 @@
+''' Test suite for the SharedCountem module '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pytest import fixture, mark, raises
+from countem.src import Countem, SharedCountem
+from countem.src.internals import _shared_countem
+
+
+@fixture(name='shared')
+def fixture_shared():
+    counted = SharedCountem(capacity=64)
+    yield counted
+    counted.close()
+    counted.unlink()
+
+
+VECTORISED_MODULE = _shared_countem
+
+
+def count_words(task):
+    counted, words = task
+    counted.update(words)
+    return len(words)
+
+
+@mark.describe('Tests for SharedCountem class')
+class TestSharedCountem:
+
+    @mark.it('counts iterables and mappings of keys of any type like Countem')
+    @mark.usefixtures('vectorised')
+    def test_counts_match_countem(self, shared):
+        elements = list('abracadabra') + [1, 1, b'x', (1, 'a'), 2.0, True]
+        shared.update(elements).add('z', 3)
+        expected = Countem(elements) + {'z': 3}
+
+        assert shared == expected
+        assert len(shared) == len(expected)
+        assert shared['a'] == 5 and shared[1] == 3 and shared[(1, 'a')] == 1
+        assert 'q' not in shared
+        assert shared.max() == 5
+        assert shared.multi_mode() == ('a',)
+        top = shared.most_common(3)
+        assert dict(top) == {'a': 5, 1: 3, 'z': 3}
+        assert [count for _, count in top] == [5, 3, 3]
+        assert shared.most_common() == sorted(shared.items(), key=lambda item: -item[1])
+
+
+    @mark.it('returns no elements for most_common(0) or a negative n')
+    @mark.usefixtures('vectorised')
+    def test_most_common_none(self, shared):
+        shared.update('abracadabra')
+
+        assert shared.most_common(0) == []
+        assert shared.most_common(-1) == []
+
+
+    @mark.it('shares counts with counters attached by name or unpickled')
+    def test_attach(self, shared):
+        shared.update('aab')
+
+        with SharedCountem.attach(shared.name) as attached:
+            attached.update('bc')
+            assert attached == {'a': 2, 'b': 2, 'c': 1}
+
+        unpickled = pickle.loads(pickle.dumps(shared))
+        unpickled.update('c')
+        unpickled.close()
+        assert shared == {'a': 2, 'b': 2, 'c': 2}
+
+
+    @mark.it('is updated in place by worker processes')
+    def test_processes(self, shared):
+        words = [f'word{i % 20}' for i in range(400)]
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            tasks = [(shared, words[i:i + 50]) for i in range(0, len(words), 50)]
+            assert sum(executor.map(count_words, tasks)) == len(words)
+
+        assert shared == Countem(words)
+
+
+    @mark.it('raises a ValueError once it is full')
+    def test_full(self):
+        with SharedCountem(capacity=2) as shared:
+            shared.update('ab')
+            with raises(ValueError):
+                shared.add('c')
+            shared.unlink()
+
+
+    @mark.it('returns None for max and multi_mode when empty')
+    def test_empty(self, shared):
+        assert shared.max() is None
+        assert shared.multi_mode() is None
+        assert shared.most_common() == []
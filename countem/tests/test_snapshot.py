@@ -0,0 +1,121 @@
+''' Test suite for saving and memory-mapping Countem snapshots '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from pytest import mark, raises
+from countem.src import Countem, SnapshotCountem
+from countem.src.internals import _snapshot
+
+
+VECTORISED_MODULE = _snapshot
+
+
+@mark.describe('Tests for Countem snapshots')
+class TestSnapshot:
+
+    @mark.it('round trips str, bytes and int keys through a snapshot file')
+    def test_round_trip(self, tmp_path):
+        for elements in ('mississippi', [b'ab', b'a', b'ab'], [10**12, -3, 7, -3]):
+            path = tmp_path / 'counts.cntm'
+            counted = Countem(elements)
+            counted.save(path)
+
+            assert Countem.open(path, mmap=False) == counted
+
+            with Countem.open(path) as snapshot:
+                assert isinstance(snapshot, SnapshotCountem)
+                assert snapshot == counted
+                assert len(snapshot) == len(counted)
+
+
+    @mark.it('serves lookups and most_common from the memory map')
+    @mark.usefixtures('vectorised')
+    def test_lookups(self, tmp_path):
+        path = tmp_path / 'counts.cntm'
+        counted = Countem('abracadabra')
+        counted.save(path)
+
+        with Countem.open(path) as snapshot:
+            assert snapshot['a'] == 5
+            assert snapshot.get('z') is None
+            assert 'r' in snapshot and 1 not in snapshot
+            assert snapshot.most_common(1) == [('a', 5)]
+            assert dict(snapshot.most_common(3)) == {'a': 5, 'b': 2, 'r': 2}
+            assert snapshot.most_common() == counted.most_common()
+            assert snapshot.max() == 5
+            assert snapshot.multi_mode() == ('a',)
+
+            with raises(KeyError):
+                _ = snapshot['z']
+
+        # ties at the n-th count go to the keys saved first, with or without NumPy
+        tied = Countem('zzz' + 'abcdefghijklmnopqrstuvwxy' + 'yxw')
+        tied.save(path)
+
+        with Countem.open(path) as snapshot:
+            assert snapshot.most_common(3) == [('z', 3), ('w', 2), ('x', 2)]
+            assert snapshot.most_common(6) == tied.most_common(6)
+            assert snapshot.most_common(6)[4:] == [('a', 1), ('b', 1)]
+
+
+    @mark.it('adds appended deltas to the saved counts')
+    @mark.usefixtures('vectorised')
+    def test_append(self, tmp_path):
+        path = tmp_path / 'counts.cntm'
+        Countem('aaabbc').save(path)
+        Countem('ccccd').save(path, append=True)
+        Countem('d').save(path, append=True)
+
+        expected = Countem('aaabbcccccdd')
+        assert Countem.open(path, mmap=False) == expected
+
+        with Countem.open(path) as snapshot:
+            assert snapshot == expected
+            assert len(snapshot) == 4
+            assert list(snapshot) == ['a', 'b', 'c', 'd']
+            assert snapshot.most_common(2) == [('c', 5), ('a', 3)]
+            assert snapshot.multi_mode() == ('c',)
+
+
+    @mark.it('rejects keys of mixed or unsupported types')
+    def test_key_types(self, tmp_path):
+        with raises(TypeError):
+            Countem(['a', 1]).save(tmp_path / 'mixed.cntm')
+
+        with raises(TypeError):
+            Countem([(1, 2)]).save(tmp_path / 'tuples.cntm')
+
+
+    @mark.it('saves and opens an empty counter')
+    def test_empty(self, tmp_path):
+        path = tmp_path / 'empty.cntm'
+        Countem().save(path)
+
+        with Countem.open(path) as snapshot:
+            assert not snapshot
+            assert snapshot.max() is None
+            assert snapshot.most_common() == []
+
+
+    @mark.it('returns no elements for most_common(0) or a negative n')
+    @mark.usefixtures('vectorised')
+    def test_most_common_none(self, tmp_path):
+        path = tmp_path / 'counts.cntm'
+        Countem('abracadabra').save(path)
+
+        with Countem.open(path) as snapshot:
+            assert snapshot.most_common(0) == []
+            assert snapshot.most_common(-2) == []
+
+
+    @mark.it('closes while a view over the counts is still alive')
+    def test_close_with_view(self, tmp_path):
+        path = tmp_path / 'counts.cntm'
+        Countem('abracadabra').save(path)
+
+        snapshot = Countem.open(path)
+        held = snapshot._SnapshotCountem__counts_array()  # pylint: disable=protected-access
+        snapshot.close()
+        snapshot.close()
+
+        assert sorted(held.tolist()) == [1, 1, 2, 2, 5]
@@ -0,0 +1,96 @@
+''' Test suite for counting the fields of JSON lines and CSV files '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import json
+from pathlib import Path
+from pytest import fixture, mark, raises
+from countem.src import Countem, count_file
+
+RECORDS = [
+    {'host': f'host{i % 3}', 'response': {'status': 200 if i % 4 else 500}}
+    for i in range(200)
+] + [{'host': 'host9'}]
+
+
+@fixture(name='jsonl_file')
+def fixture_jsonl_file(tmp_path: Path) -> Path:
+    path = tmp_path / 'access.jsonl'
+    lines = map(json.dumps, RECORDS)
+    path.write_text('\n'.join(lines) + '\n\n', encoding='utf-8')
+    return path
+
+
+@fixture(name='csv_file')
+def fixture_csv_file(tmp_path: Path) -> Path:
+    path = tmp_path / 'access.csv'
+    rows = (f'{record["host"]},"{record.get("response", {}).get("status", "")}"'
+            for record in RECORDS)
+    path.write_text('host,status\n' + '\n'.join(rows), encoding='utf-8')
+    return path
+
+
+@mark.describe('Tests for count_file')
+class TestCountFile:
+
+    @mark.it('counts several paths of a JSON lines file in one pass')
+    @mark.parametrize('workers, chunk_size', [(1, 1), (1, 100), (1, 1 << 22), (2, 512)])
+    def test_jsonl(self, jsonl_file, workers, chunk_size):
+        statuses, hosts = count_file(
+            jsonl_file, ('response', 'status'), 'host', workers=workers, chunk_size=chunk_size
+        )
+
+        assert statuses == Countem.count_by(RECORDS, 'response', 'status')
+        assert hosts == Countem.count_by(RECORDS, 'host')
+        assert statuses == {200: 150, 500: 50, None: 1}
+
+
+    @mark.it('counts the columns of a CSV file by name or index')
+    @mark.parametrize('chunk_size', [1, 64, 1 << 22])
+    def test_csv(self, csv_file, chunk_size):
+        hosts, statuses = count_file(csv_file, 'host', 1, chunk_size=chunk_size)
+
+        assert hosts == Countem.count_by(RECORDS, 'host')
+        assert statuses == {'200': 150, '500': 50, '': 1}
+
+
+    @mark.it('rejects unknown formats, CSV columns and malformed JSON lines')
+    def test_errors(self, jsonl_file, csv_file):
+        with raises(ValueError):
+            count_file(jsonl_file, 'host', fmt='xml')
+
+        with raises(KeyError):
+            count_file(csv_file, 'method')
+
+        with open(jsonl_file, 'a', encoding='utf-8') as file:
+            file.write('{"host": \n')
+
+        with raises(json.JSONDecodeError):
+            count_file(jsonl_file, 'host')
+
+
+    @mark.it('reads records holding raw line separators inside their strings')
+    @mark.parametrize('chunk_size', [1, 16, 1 << 22])
+    def test_raw_separators(self, tmp_path, chunk_size):
+        records = [{'host': 'a\u2028b'}, {'host': 'c\x85d\x0c'}, {'host': 'a\u2028b'}]
+        path = tmp_path / 'separators.jsonl'
+        lines = (json.dumps(record, ensure_ascii=False) for record in records)
+        path.write_text('\n'.join(lines) + '\n', encoding='utf-8', newline='')
+
+        hosts, = count_file(path, 'host', chunk_size=chunk_size)
+
+        assert hosts == {'a\u2028b': 2, 'c\x85d\x0c': 1}
+
+
+    @mark.it('rejects lines holding several records or part of one')
+    @mark.parametrize('lines', [
+        '{"host": "a"}, {"host": "b"}\n',
+        '{"host":\n"a"}\n',
+        '1, 2\n"x\ny"\n',
+    ])
+    def test_malformed_lines(self, tmp_path, lines):
+        path = tmp_path / 'malformed.jsonl'
+        path.write_text(lines, encoding='utf-8')
+
+        with raises(json.JSONDecodeError):
+            count_file(path, 'host')
@@ -0,0 +1,77 @@
+''' Test suite for counting numeric arrays with vectorised NumPy operations '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from array import array
+from pytest import importorskip, mark
+from countem.src import Countem, IndexedCountem
+from countem.src.find_most_repeated import find_most_repeated
+from countem.src.internals._vectorised import worth_vectorising
+
+np = importorskip('numpy')
+
+
+@mark.describe('Tests for counting numeric arrays')
+class TestVectorisedCounting:
+
+    @mark.it('counts NumPy arrays the same as counting element by element')
+    @mark.parametrize('values', [
+        np.array([3, 1, 3, 3, 7, 1], dtype=np.int64),
+        np.array([-5, 2, 10**12, -5, 2, -5], dtype=np.int64),
+        np.array([2, 2, 250, 9], dtype=np.uint8),
+        np.array([-128, 127] * 40, dtype=np.int8),
+        np.array([-32768, 32767, 0] * 6000, dtype=np.int16),
+        np.array([2**64 - 1, 2**64 - 3, 2**64 - 1], dtype=np.uint64),
+        np.array([0.5, 1.5, 0.5, -2.0]),
+        np.array([True, False, True]),
+        np.array([], dtype=np.int32)
+    ], ids=lambda values: str(values.dtype))
+    def test_numpy_arrays(self, values):
+        result = Countem(values)
+        assert result == Countem(iter(values))
+        assert all(type(key) in (int, float, bool) for key in result)
+
+
+    @mark.it('counts sparse integers which are nearly all distinct as a list')
+    def test_sparse_integers(self):
+        rng = np.random.default_rng(0)
+        sparse = rng.integers(0, 2**40, size=20_000, dtype=np.int64)
+        repeated = rng.choice(sparse[:500], size=20_000)
+
+        assert not worth_vectorising(sparse) and worth_vectorising(repeated)
+        assert worth_vectorising(sparse % 1000) and worth_vectorising(sparse[:100])
+        assert Countem(sparse) == Countem(sparse.tolist())
+        assert Countem(repeated) == Countem(repeated.tolist())
+
+
+    @mark.it('counts numeric array.array buffers')
+    @mark.parametrize('typecode', ['b', 'i', 'Q', 'd'])
+    def test_array_module(self, typecode):
+        values = array(typecode, [1, 2, 2, 3, 3, 3])
+        assert Countem(values) == {1: 1, 2: 2, 3: 3}
+
+
+    @mark.it('counts the full range of narrow signed array.array types')
+    @mark.parametrize('typecode, low, high', [('b', -128, 127), ('h', -32768, 32767)])
+    def test_narrow_array_module(self, typecode, low, high):
+        values = array(typecode, [low, high] * 20_000)
+        assert Countem(values) == {low: 20_000, high: 20_000}
+
+
+    @mark.it('merges array counts into a non-empty counter and subtracts them')
+    def test_update_and_subtract(self):
+        counted = Countem([1, 1, 'a'])
+        counted.update(np.array([1, 2, 2]))
+        assert counted == {1: 3, 'a': 1, 2: 2}
+
+        counted.subtract(array('i', [2, 2, 5]))
+        assert counted == {1: 3, 'a': 1, 2: 0, 5: -1}
+
+        indexed = IndexedCountem(np.array([4, 4, 9]))
+        assert indexed.multi_mode() == (4,)
+
+
+    @mark.it('finds the most repeated values of a numeric array')
+    def test_find_most_repeated(self):
+        values = np.array([5, 1, 5, 2, 1, 9])
+        assert find_most_repeated(values) == {'elements': [1, 5], 'repeats': 2}
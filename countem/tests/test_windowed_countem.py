@@ -0,0 +1,197 @@
+''' Test suite for the WindowedCountem and DecayingCountem modules '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+from pytest import approx, mark, raises
+from countem.src import Countem, DecayingCountem, WindowedCountem
+
+
+class FakeClock:
+    ''' a clock which only moves when told to '''
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TickingClock(FakeClock):
+    ''' a clock which moves on by step every time it is read '''
+    def __init__(self, step: float) -> None:
+        super().__init__()
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+@mark.describe('Tests for WindowedCountem class')
+class TestWindowedCountem:
+
+    @mark.it('counts only the last maxlen events, dropping elements with no events left')
+    def test_count_window(self):
+        counted = WindowedCountem('aabcab', maxlen=4)
+        assert counted == Countem('bcab')
+
+        counted.update('bbb')
+        assert counted == {'b': 4}
+        assert 'a' not in counted
+        assert counted.multi_mode() == ('b',)
+
+
+    @mark.it('matches a full recount of the window as it slides')
+    def test_slides_like_recount(self):
+        events = [i * 7 % 11 for i in range(300)]
+        counted = WindowedCountem(maxlen=25)
+
+        for i, event in enumerate(events):
+            counted.add(event)
+            window = Countem(events[max(0, i - 24):i + 1])
+            assert counted == window
+            assert counted.max() == window.max()
+            assert set(counted.multi_mode()) == set(window.multi_mode())
+
+
+    @mark.it('expires events older than a time window as the clock moves on')
+    def test_time_window(self):
+        clock = FakeClock()
+        counted = WindowedCountem(window=10, clock=clock)
+
+        counted.update('aab')
+        clock.now = 5
+        counted.update('bc')
+        assert counted.most_common() == [('a', 2), ('b', 2), ('c', 1)]
+
+        clock.now = 10
+        assert counted == {'b': 1, 'c': 1}
+        assert counted.keys_with_count(1) == ('c', 'b')
+
+        clock.now = 15
+        assert not counted
+        assert counted.max() is None
+
+
+    @mark.it('iterates a snapshot while the clock moves on during iteration')
+    def test_moving_clock(self):
+        counted = WindowedCountem(window=8, clock=TickingClock(1))
+        counted.update('abcdefghij')
+        counted.update('abcdefghij')
+
+        assert dict(counted.items()) == {key: 2 for key in 'abcdefghij'}
+        assert counted != {'z': 1}
+        assert all(counted.get(key) in (1, 2, None) for key in counted)
+        assert not counted.values()
+
+
+    @mark.it('merges into a Countem from one snapshot while the clock moves on')
+    def test_merge_moving_clock(self):
+        counts = {'a': 1, 'b': 2, 'c': 3, 'd': 4}
+        counted = WindowedCountem(window=4, clock=TickingClock(1))
+        for key, count in counts.items():
+            counted.update(key * count)
+
+        merged = Countem({'z': 1}).update(counted)
+
+        assert merged['z'] == 1
+        assert len(merged) > 1
+        assert all(merged[key] == counts[key] for key in merged if key != 'z')
+
+
+    @mark.it('raises a ValueError without a positive maxlen or window')
+    def test_validation(self):
+        with raises(ValueError):
+            WindowedCountem('abc')
+        with raises(ValueError):
+            WindowedCountem(maxlen=0)
+
+
+@mark.describe('Tests for DecayingCountem class')
+class TestDecayingCountem:
+
+    @mark.it('halves counts every half-life')
+    def test_decay(self):
+        clock = FakeClock()
+        counted = DecayingCountem('aaab', half_life=10, clock=clock)
+        assert counted == {'a': 3, 'b': 1}
+
+        clock.now = 10
+        assert counted['a'] == approx(1.5)
+        counted.add('b', timestamp=10)
+        assert counted['b'] == approx(1.5)
+        assert set(counted.multi_mode()) == {'a', 'b'}
+
+        clock.now = 20
+        counted.update({'b': 1.0})
+        assert counted.most_common() == [('b', approx(1.75)), ('a', approx(0.75))]
+        assert counted.max() == approx(1.75)
+
+
+    @mark.it('expires elements whose counts decay below min_count')
+    def test_expiry(self):
+        clock = FakeClock()
+        counted = DecayingCountem('ab', half_life=1, min_count=0.1, clock=clock)
+
+        clock.now = 3
+        counted.add('c')
+        assert list(counted) == ['a', 'b', 'c']
+
+        clock.now = 4
+        assert list(counted) == ['c']
+        assert counted.multi_mode() == ('c',)
+
+        clock.now = 100
+        assert not counted
+        assert counted.max() is None
+
+
+    @mark.it('keeps counts correct across a rescale of the landmark')
+    def test_rescale(self):
+        clock = FakeClock()
+        counted = DecayingCountem('a', half_life=1, min_count=1e-300, clock=clock)
+
+        clock.now = 600
+        counted.add('a')
+        counted.add('b', 4.0)
+        assert counted['a'] == approx(1.0)
+        assert counted.most_common(1) == [('b', approx(4.0))]
+
+
+    @mark.it('stays usable after idling for far more half-lives than a float can scale')
+    def test_long_idle(self):
+        clock = FakeClock()
+        counted = DecayingCountem('aab', half_life=60, clock=clock)
+
+        clock.now = 1100 * 60
+        assert not counted and counted.max() is None
+        counted.add('c')
+        assert counted == {'c': approx(1.0)}
+
+        clock.now += 1100 * 60
+        assert len(counted) == 0
+        counted.add('a', timestamp=clock.now)
+        clock.now += 60
+        assert counted.most_common() == [('a', approx(0.5))]
+
+
+    @mark.it('merges into a non-empty Countem with each count on its own element')
+    def test_merge(self):
+        counted = DecayingCountem('abbccc', clock=FakeClock())
+        expected = {'z': 1, 'a': 1.0, 'b': 2.0, 'c': 3.0}
+
+        assert list(counted.keys()) == ['a', 'b', 'c']
+        assert list(counted.values()) == [1.0, 2.0, 3.0]
+        assert Countem({'z': 1}).update(counted) == expected
+        assert Countem({'z': 1}) + counted == expected
+        assert Countem({'z': 1}) | counted == expected
+
+
+    @mark.it('iterates a snapshot while the clock moves on during iteration')
+    def test_moving_clock(self):
+        counted = DecayingCountem(half_life=1, min_count=0.4, clock=TickingClock(0.3))
+        counted.update('abcdef')
+
+        assert set(dict(counted.items())) <= set('abcdef')
+        assert len(counted.values()) <= 6
+        assert counted != {'z': 1.0}
+        assert set(counted) <= set('abcdef')
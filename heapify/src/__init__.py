@@ -1,2 +1,7 @@
 # pylint: disable=missing-module-docstring
-from .internals._heapify import heapify, heap_replace
+from .internals._heapify import (
+    heapify, heap_replace, heappush, heappop, heappushpop, nsmallest, nlargest, merge
+)
+from .internals._dary_heap import DaryHeap, choose_arity
+from .internals._indexed_heap import IndexedHeap
+from .internals._key_heap import KeyHeap
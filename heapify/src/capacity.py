@@ -0,0 +1,141 @@
+''' Find the fewest tills which serve a queue within a target time '''
+
+from typing import Dict, Iterable, List, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from .queue_time import queue_time
+
+
+class CapacityPlanner:
+    '''Find the fewest tills to serve a queue within target times
+
+        The queue time never grows as tills are added, so the fewest tills are found by
+        a binary search, between bounds from the longest customer and the total time.
+        Before simulating a number of tills:
+
+        - too few tills to share out the total time, or a customer longer than the
+          target, can never meet it
+        - enough tills that (total - longest) / tills + longest meets the target always
+          will, as the greedy schedule is within a customer of an even split
+
+        Every simulated queue time is cached, and narrows the search for later targets.
+
+        Args:
+            queue (Sequence): the time each customer takes to check out
+    '''
+    def __init__(self, queue: Sequence) -> None:
+        self.queue = list(queue)
+        self.total = sum(self.queue)
+        self.longest = max(self.queue, default=0)
+        self.__makespans: Dict[int, int] = {}
+
+
+    def queue_time(self, num_tills: int) -> int:
+        '''Return the queue time with num_tills tills, simulating it only once'''
+        makespan = self.__makespans.get(num_tills)
+
+        if makespan is None:
+            makespan = self.__makespans[num_tills] = queue_time(self.queue, num_tills)
+
+        return makespan
+
+
+    def min_tills(self, target: float) -> int|None:
+        '''Return the fewest tills which serve the queue within target, None if none can'''
+        if not self.queue:
+            return 0
+
+        if self.longest > target:
+            return None
+
+        low, high = self.__bounds(target)
+
+        for num_tills, makespan in self.__makespans.items():
+            if makespan <= target:
+                high = min(high, num_tills)
+            else:
+                low = max(low, num_tills + 1)
+
+        while low < high:
+            middle = (low + high) // 2
+            if self.__meets(middle, target):
+                high = middle
+            else:
+                low = middle + 1
+
+        return low
+
+
+    def __bounds(self, target: float) -> tuple:
+        '''return the fewest and the most tills the answer can be, for a feasible target'''
+        num_customers = len(self.queue)
+        # ceil(total / target) without floats, the fewest tills to share out the total
+        low = max(1, -(-self.total // target)) if target > 0 else 1
+        high = num_customers
+
+        if target > self.longest:
+            spare = target - self.longest
+            high = min(high, max(1, -(-(self.total - self.longest) // spare)))
+
+        return int(min(low, high)), int(high)
+
+
+    def __meets(self, num_tills: int, target: float) -> bool:
+        '''return True if num_tills serve the queue within target, simulating if need be'''
+        if self.total > target * num_tills:
+            return False
+
+        if (self.total - self.longest) / num_tills + self.longest <= target:
+            return True
+
+        return self.queue_time(num_tills) <= target
+
+
+def _min_tills_for_targets(job: tuple) -> List[int|None]:
+    '''return the fewest tills for each target of a (queue, targets) job'''
+    queue, targets = job
+    planner = CapacityPlanner(queue)
+    return [planner.min_tills(target) for target in targets]
+
+
+def min_tills(queue: Sequence, target: float) -> int|None:
+    """
+    Return the fewest tills which serve a queue within a target time
+
+    Args:
+        queue (Sequence): the time each customer takes to check out
+        target (float): the longest the queue should take
+    Returns:
+        int|None: the fewest tills, or None if a customer takes longer than the target
+
+        e.g.
+        print(min_tills([2, 3, 10, 4, 6], 13))
+        2
+    """
+    return CapacityPlanner(queue).min_tills(target)
+
+
+def min_tills_many(
+    queues: Iterable[Sequence],
+    targets: Sequence[float],
+    workers: int=1
+) -> List[List[int|None]]:
+    """
+    Return the fewest tills for every queue to meet every target
+
+    Each queue is planned once for all of the targets, sharing its simulations, and
+    with more than one worker the queues are planned in parallel in a process pool.
+
+    Args:
+        queues (Iterable): the queues, each a sequence of customer times
+        targets (Sequence): the target times
+        workers (int): the number of processes, 1 to plan in this process
+    Returns:
+        List[List]: for each queue, the fewest tills to meet each target
+    """
+    jobs = ((queue, targets) for queue in queues)
+
+    if workers <= 1:
+        return list(map(_min_tills_for_targets, jobs))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_min_tills_for_targets, jobs, chunksize=16))
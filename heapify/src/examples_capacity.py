@@ -0,0 +1,44 @@
+'''
+    time comparison of finding the fewest tills to meet a target queue time, calling
+    queue_time for 1, 2, 3... tills against the binary search of min_tills, and of
+    planning many queues in a process pool.
+
+    Run with: python -m heapify.src.examples_capacity
+'''
+
+import timeit
+import random
+from functools import partial
+from .queue_time import queue_time
+from .capacity import min_tills, min_tills_many
+
+
+def min_tills_by_scan(queue: list, target: float) -> int|None:
+    ''' the fewest tills to meet the target, trying each number of tills in turn '''
+    for num_tills in range(1, len(queue) + 1):
+        if queue_time(queue, num_tills) <= target:
+            return num_tills
+    return None
+
+
+def plan_by_scan(queues: list, targets: list) -> list:
+    ''' min_tills_by_scan for every queue and target '''
+    return [[min_tills_by_scan(queue, target) for target in targets] for queue in queues]
+
+
+if __name__ == '__main__':
+    day = [random.randint(1, 100) for _ in range(20_000)]
+    print(min_tills(day, 60_000) == min_tills_by_scan(day, 60_000))                 # True
+
+    print('scan:      ', timeit.timeit(partial(min_tills_by_scan, day, 60_000), number=1))
+    print('min_tills: ', timeit.timeit(partial(min_tills, day, 60_000), number=1))
+
+    stores = [[random.randint(1, 100) for _ in range(2_000)] for _ in range(200)]
+    slas = [5_000, 10_000, 20_000]
+    print(min_tills_many(stores, slas, workers=2) == plan_by_scan(stores, slas))  # True
+
+    print('scan, many queues:      ', timeit.timeit(partial(plan_by_scan, stores, slas), number=1))
+    for workers in (1, 4):
+        print(f'min_tills_many, {workers} workers:', timeit.timeit(
+            partial(min_tills_many, stores, slas, workers), number=1
+        ))
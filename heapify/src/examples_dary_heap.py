@@ -0,0 +1,52 @@
+'''
+    time comparison of DaryHeap at several arities against the binary min_heapify,
+    building a heap and then replacing its smallest item as the till queue does, to
+    show the sizes at which a wider heap pays off.
+
+    Run with: python -m heapify.src.examples_dary_heap
+'''
+
+import timeit
+import random
+from functools import partial
+from . import DaryHeap, choose_arity, heapify, heap_replace
+
+ARITIES = (2, 4, 8, 16)
+
+
+def replace_all(replace, peek, increments: list) -> None:
+    ''' replace the smallest item with itself plus each increment, as a till does '''
+    for increment in increments:
+        replace(peek() + increment)
+
+
+def time_arities(items: list, increments: list) -> tuple:
+    ''' returns the seconds to build a heap of the items and to replace_all, by arity '''
+    binary = heapify(items.copy())
+    build = {'min_heapify': timeit.timeit(partial(heapify, items.copy()), number=1)}
+    replace = {'min_heapify': timeit.timeit(partial(
+        replace_all, partial(heap_replace, binary), partial(binary.__getitem__, 0), increments
+    ), number=1)}
+
+    for arity in ARITIES:
+        dary = DaryHeap(items, arity)
+        build[f'{arity}-ary'] = timeit.timeit(partial(DaryHeap, items, arity), number=1)
+        replace[f'{arity}-ary'] = timeit.timeit(
+            partial(replace_all, dary.heap_replace, dary.peek, increments), number=1
+        )
+
+    return build, replace
+
+
+if __name__ == '__main__':
+    till_increments = [random.random() for _ in range(20_000)]
+
+    for size in (100, 10_000, 1_000_000):
+        rand_list = [random.random() for _ in range(size)]
+        build_times, replace_times = time_arities(rand_list, till_increments)
+
+        print(f'{size:,} items, choose_arity gives {choose_arity(size)}, '
+              f'{choose_arity(size, len(till_increments))} for these replaces, '
+              f'{choose_arity(size, 0)} for none')
+        print('    build:   ', '  '.join(f'{name} {t:.4f}s' for name, t in build_times.items()))
+        print('    replace: ', '  '.join(f'{name} {t:.4f}s' for name, t in replace_times.items()))
@@ -0,0 +1,64 @@
+'''
+    time comparison of the pure Python heap functions against the C versions
+    in the built-in heapq module.
+
+    Run with: python -m heapify.src.examples_heap
+'''
+
+import heapq
+import timeit
+import random
+from . import heapify, heappush, heappop, heappushpop, nsmallest, nlargest, merge
+
+
+def push_all(push, items: list) -> list:
+    ''' push every item onto a new heap '''
+    heap = []
+    for item in items:
+        push(heap, item)
+    return heap
+
+
+def pop_all(pop, heap: list) -> list:
+    ''' pop every item from a copy of the heap '''
+    heap = heap.copy()
+    return [pop(heap) for _ in range(len(heap))]
+
+
+def pushpop_all(pushpop, heap: list, items: list) -> None:
+    ''' pushpop every item on a copy of the heap '''
+    heap = heap.copy()
+    for item in items:
+        pushpop(heap, item)
+
+
+if __name__ == '__main__':
+    rand_list = [random.randint(1, 100_000) for _ in range(20_000)]
+    sorted_heap = sorted(rand_list)
+    runs = [sorted(rand_list[i::8]) for i in range(8)]
+
+    print(pop_all(heappop, sorted_heap) == pop_all(heapq.heappop, sorted_heap))    # True
+    print(list(merge(*runs)) == list(heapq.merge(*runs)))                           # True
+
+    comparisons = {
+        'heapify': (lambda: heapify(rand_list.copy()),
+                    lambda: heapq.heapify(rand_list.copy())),
+        'heappush': (lambda: push_all(heappush, rand_list),
+                     lambda: push_all(heapq.heappush, rand_list)),
+        'heappop': (lambda: pop_all(heappop, sorted_heap),
+                    lambda: pop_all(heapq.heappop, sorted_heap)),
+        'heappushpop': (lambda: pushpop_all(heappushpop, sorted_heap[:100], rand_list),
+                        lambda: pushpop_all(heapq.heappushpop, sorted_heap[:100], rand_list)),
+        'nsmallest(10)': (lambda: nsmallest(10, rand_list),
+                          lambda: heapq.nsmallest(10, rand_list)),
+        'nlargest(10)': (lambda: nlargest(10, rand_list),
+                         lambda: heapq.nlargest(10, rand_list)),
+        'merge(8 runs)': (lambda: list(merge(*runs)),
+                          lambda: list(heapq.merge(*runs))),
+    }
+
+    for name, (custom, builtin) in comparisons.items():
+        custom_time = timeit.timeit(custom, number=10)
+        builtin_time = timeit.timeit(builtin, number=10)
+        print(f'{name:<14} heapify: {custom_time:.4f}s  heapq: {builtin_time:.4f}s  '
+              f'{custom_time / builtin_time:.1f}x')
@@ -0,0 +1,41 @@
+'''
+    time comparison of cancelling entries in a heap, IndexedHeap removing a handle
+    by its indexed position against finding the entry in a list heap and heapifying.
+
+    Run with: python -m heapify.src.examples_indexed_heap
+'''
+
+import timeit
+import random
+from . import IndexedHeap, heapify
+
+
+def cancel_from_list(heap: list, cancelled: list) -> None:
+    ''' remove each (priority, handle) entry from a list heap, restoring the heap property '''
+    for entry in cancelled:
+        heap.remove(entry)
+        heapify(heap)
+
+
+def cancel_from_indexed(heap: IndexedHeap, cancelled: list) -> None:
+    ''' remove each handle from an indexed heap '''
+    for _, handle in cancelled:
+        heap.remove(handle)
+
+
+if __name__ == '__main__':
+    entries = [(random.random(), f'customer-{i}') for i in range(20_000)]
+    to_cancel = random.sample(entries, 200)
+
+    list_heap = heapify(entries.copy())
+    indexed_heap = IndexedHeap((handle, priority) for priority, handle in entries)
+    cancel_from_list(list_heap, to_cancel)
+    cancel_from_indexed(indexed_heap, to_cancel)
+    print(sorted(list_heap) == sorted((p, h) for h, p in indexed_heap.items()))    # True
+
+    print('list heap:   ', timeit.timeit(
+        lambda: cancel_from_list(heapify(entries.copy()), to_cancel), number=1
+    ))
+    print('IndexedHeap: ', timeit.timeit(lambda: cancel_from_indexed(
+        IndexedHeap((handle, priority) for priority, handle in entries), to_cancel
+    ), number=1))
@@ -0,0 +1,79 @@
+'''
+    comparison of KeyHeap against heap_replace and heapq with records wrapped in
+    (key, tiebreak, record) tuples, timing a till queue of records and tracing the
+    memory each one allocates.
+
+    Run with: python -m heapify.src.examples_key_heap
+'''
+
+import heapq
+import timeit
+import random
+import tracemalloc
+from functools import partial
+from itertools import count
+from operator import itemgetter
+from . import KeyHeap, heapify, heap_replace
+
+FREE_AT = itemgetter('free_at')
+
+
+def with_tuples(records: list, times: list, functions: tuple=(heapify, heap_replace)) -> list:
+    ''' serve each time at the till free first, with records wrapped in tuples '''
+    make_heap, replace = functions
+    tiebreak = count()
+    heap = make_heap([(FREE_AT(record), next(tiebreak), record) for record in records])
+
+    for time in times:
+        record = heap[0][2]
+        record = {'till': record['till'], 'free_at': record['free_at'] + time}
+        replace(heap, (FREE_AT(record), next(tiebreak), record))
+
+    return heap
+
+
+def with_heapq_tuples(records: list, times: list) -> list:
+    ''' with_tuples using the C heapq functions '''
+    def make_heap(heap: list) -> list:
+        heapq.heapify(heap)
+        return heap
+
+    return with_tuples(records, times, (make_heap, heapq.heapreplace))
+
+
+def with_key_heap(records: list, times: list) -> KeyHeap:
+    ''' serve each time at the till free first, with a KeyHeap of the records '''
+    heap = KeyHeap(records, key=FREE_AT)
+
+    for time in times:
+        record = heap.peek()
+        heap.heap_replace({'till': record['till'], 'free_at': record['free_at'] + time})
+
+    return heap
+
+
+def traced(func, *args) -> tuple:
+    ''' return the bytes held by the result of func and the peak bytes while it ran '''
+    tracemalloc.start()
+    result = func(*args)
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return held, peak
+
+
+if __name__ == '__main__':
+    tills = [{'till': i, 'free_at': 0} for i in range(10_000)]
+    customer_times = [random.randint(1, 100) for _ in range(100_000)]
+
+    tuple_heap = with_tuples(tills, customer_times)
+    print(max(map(FREE_AT, (record for *_, record in tuple_heap))) ==
+          max(map(FREE_AT, with_key_heap(tills, customer_times))))    # True
+
+    for name, serve in (('heap_replace tuples', with_tuples),
+                        ('heapq tuples', with_heapq_tuples),
+                        ('KeyHeap', with_key_heap)):
+        seconds = timeit.timeit(partial(serve, tills, customer_times), number=3) / 3
+        held_bytes, peak_bytes = traced(serve, tills, customer_times)
+        print(f'{name:<20} {seconds:.4f}s  held {held_bytes / 1e6:.2f}MB  '
+              f'peak {peak_bytes / 1e6:.2f}MB')
@@ -1,12 +1,16 @@
 ''' 
     time comparison between queue_time using a custom heap implementations and 
-    queue_time_index_min using the built-in min and max functions.
+    queue_time_index_min using the built-in min and max functions, and of the heap of
+    each backend, against the scan for the least loaded till.
 '''
+# pylint: disable=consider-using-max-builtin
 # pylint: disable=duplicate-code
 
 import timeit
 import random
-from .queue_time import queue_time
+from functools import partial
+from .queue_time import queue_time, backend_info
+from .internals._backends import BACKENDS
 
 def queue_time_index_min(queue: list, num_tills: int=2) -> int:
     ''' 
@@ -32,6 +36,22 @@ def queue_time_index_min(queue: list, num_tills: int=2) -> int:
 
     return max(tills)
 
+def queue_time_heap(queue: list, num_tills: int, heap_replace) -> int:
+    '''
+    Calculates the total queue time with a heap of tills whatever their number,
+    where queue_time would scan few tills, to find where a scan wins for a backend.
+    '''
+    tills = [0] * num_tills
+    max_value = 0
+
+    for t in queue:
+        t += tills[0]
+        if t > max_value:
+            max_value = t
+        heap_replace(tills, t)
+
+    return max_value
+
 if __name__ == '__main__':
     # create a random list
     rand_list = [random.randint(1, 100) for _ in range(1000)]
@@ -53,3 +73,18 @@ if __name__ == '__main__':
     print(timeit.timeit(time_test_queue_time_index_min, number=365))
     # Updated to use a custom heap implementation written in CPython
     print(timeit.timeit(time_test_queue_time, number=365))
+
+    print(backend_info(len(rand_list), 6))
+    # each backend's heap against the scan, which sets the backend's scan_below
+    for till_count in (2, 8, 16, 24, 32, 64):
+        times = {
+            name: timeit.timeit(
+                partial(queue_time_heap, rand_list, till_count, BACKENDS[name].heap_replace),
+                number=365
+            )
+            for name in sorted(BACKENDS)
+        }
+        times['scan'] = timeit.timeit(
+            partial(queue_time_index_min, rand_list, till_count), number=365
+        )
+        print(f'{till_count} tills:', '  '.join(f'{name} {t:.4f}s' for name, t in times.items()))
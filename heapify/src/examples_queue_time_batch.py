@@ -0,0 +1,31 @@
+'''
+    time comparison of a Monte Carlo run of random queues, calling queue_time on
+    each queue in turn against queue_time_batch advancing them all together.
+
+    Run with: python -m heapify.src.examples_queue_time_batch
+'''
+
+import timeit
+import random
+from functools import partial
+from .queue_time import queue_time
+from .queue_time_batch import queue_time_batch
+
+
+def queue_time_loop(queues: list, num_tills: int) -> list:
+    ''' the queue time of each queue, one call at a time '''
+    return [queue_time(queue, num_tills) for queue in queues]
+
+
+if __name__ == '__main__':
+    scenarios = [[random.randint(1, 100) for _ in range(200)] for _ in range(20_000)]
+
+    for tills in (2, 6, 20):
+        batch = queue_time_batch(scenarios, tills)
+        print(f'{tills} tills:', list(batch['makespans']) == queue_time_loop(scenarios, tills))
+        print('    percentiles:', batch['percentiles'])
+
+        loop_time = timeit.timeit(partial(queue_time_loop, scenarios, tills), number=1)
+        batch_time = timeit.timeit(partial(queue_time_batch, scenarios, tills), number=1)
+        print(f'    per-call loop: {loop_time:.3f}s  batch: {batch_time:.3f}s  '
+              f'{loop_time / batch_time:.1f}x')
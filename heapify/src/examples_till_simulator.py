@@ -0,0 +1,37 @@
+'''
+    a day of customers arriving at a store with fast, slow and part-time tills,
+    timing the simulation of a million customers and reporting their waits.
+
+    Run with: python -m heapify.src.examples_till_simulator
+'''
+
+import timeit
+import random
+from .till_simulator import Till, TillSimulator
+
+
+def arrivals(count: int, mean_gap: float, mean_work: float):
+    ''' yield (arrival, work) pairs, with exponential gaps between arrivals '''
+    rand = random.Random(0)
+    arrival = 0.0
+    for _ in range(count):
+        arrival += rand.expovariate(1 / mean_gap)
+        yield arrival, rand.expovariate(1 / mean_work)
+
+
+if __name__ == '__main__':
+    store = [Till(), Till(), Till(speed=1.5), Till(speed=0.75),
+             Till(opens=200_000, closes=600_000), Till(speed=2.0, opens=300_000)]
+    simulator = TillSimulator(store)
+    customers = 1_000_000
+
+    result = {}
+    seconds = timeit.timeit(
+        lambda: result.update(simulator.run(arrivals(customers, 1.0, 4.0))), number=1
+    )
+
+    print(f'{customers:,} customers in {seconds:.2f}s, {customers / seconds:,.0f} a second')
+    print('served:', result['served'], 'unserved:', result['unserved'])
+    print('makespan:', round(result['makespan']), 'mean wait:', round(result['mean_wait'], 2))
+    print('wait percentiles:', {p: round(w, 2) for p, w in result['percentiles'].items()})
+    print('utilisation:', [round(busy / result['makespan'], 2) for busy in result['busy']])
@@ -1,2 +1,7 @@
 # pylint: disable=missing-module-docstring
-from . _heapify import heapify, heap_replace
+from . _heapify import (
+    heapify, heap_replace, heappush, heappop, heappushpop, nsmallest, nlargest, merge
+)
+from ._dary_heap import DaryHeap, choose_arity
+from ._indexed_heap import IndexedHeap
+from ._key_heap import KeyHeap
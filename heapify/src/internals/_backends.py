@@ -0,0 +1,78 @@
+''' Internal module for the registry of heap_replace backends used by queue_time '''
+
+import os
+import heapq
+import warnings
+from typing import Callable, Dict, NamedTuple, Tuple
+from ._heapify import heap_replace as python_heap_replace
+
+__all__ = ['Backend', 'BACKENDS', 'register_backend', 'get_backend', 'DEFAULT_BACKEND',
+           'DEFAULT_SOURCE']
+
+# names a backend to use in place of the default, read once on import, a backend which
+# is not available is warned of and the default used, so the modules still import
+BACKEND_ENV_VAR = 'HEAPIFY_BACKEND'
+
+# the default is the first of these which is available
+PREFERENCE = ('native', 'heapq', 'python')
+
+
+class Backend(NamedTuple):
+    '''A heap_replace implementation, and the number of tills below which a linear
+    scan for the least loaded till beats its heap, 0 if it never does'''
+    name: str
+    heap_replace: Callable
+    scan_below: int = 0
+
+
+BACKENDS: Dict[str, Backend] = {}
+
+
+def register_backend(name: str, heap_replace: Callable, scan_below: int = 0) -> Backend:
+    '''Register a heap_replace function under a name, replacing any of that name'''
+    backend = BACKENDS[name] = Backend(name, heap_replace, scan_below)
+    return backend
+
+
+def get_backend(name: str) -> Backend:
+    '''Return the backend of a name, raising ValueError if it is not available'''
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f'heap backend {name!r} is not available, choose from {sorted(BACKENDS)}'
+        ) from None
+
+
+def _select_default() -> Tuple[Backend, str]:
+    '''return the backend named by the environment, or the first available by preference,
+    with the source of the choice, environment or default'''
+    name = os.environ.get(BACKEND_ENV_VAR)
+
+    if name:
+        if name in BACKENDS:
+            return BACKENDS[name], 'environment'
+
+        warnings.warn(
+            f'{BACKEND_ENV_VAR}={name!r} is not available, choose from {sorted(BACKENDS)}, '
+            'using the default backend',
+            RuntimeWarning, stacklevel=2
+        )
+
+    return next(BACKENDS[name] for name in PREFERENCE if name in BACKENDS), 'default'
+
+
+# the pure Python heap is beaten by min and list.index below about 16 tills, and
+# beats them from about 24, the C heaps never are, see examples_queue_time.py
+register_backend('python', python_heap_replace, scan_below=16)
+register_backend('heapq', heapq.heapreplace)
+
+# the optional C extension, installed from heapify/src/dist
+try:
+    from heap import heap_replace as native_heap_replace
+except ImportError:
+    pass
+else:
+    register_backend('native', native_heap_replace)
+
+DEFAULT_BACKEND, DEFAULT_SOURCE = _select_default()
@@ -0,0 +1,168 @@
+''' Internal module for a d-ary min-heap, sifting down to a leaf then bubbling up '''
+# pylint: disable=duplicate-code
+
+from typing import Iterable, List
+
+__all__ = ['DaryHeap', 'choose_arity']
+
+# heaps built from at least LARGE_HEAP_SIZE items, with fewer than one sift down (a pop or
+# a replace) expected for every SIFT_DOWN_COST items, default to LARGE_HEAP_ARITY children
+# a node and all other heaps to two, the costs are timed in examples_dary_heap.py
+LARGE_HEAP_SIZE = 1 << 19
+LARGE_HEAP_ARITY = 16
+SIFT_DOWN_COST = 5
+
+
+def choose_arity(size: int, sift_downs: int = None) -> int:
+    '''
+    returns the number of children a node for a heap of size items, expecting sift_downs
+    pops and replaces once it is built, or any number of them if not given
+
+    Wider nodes only pay off in heapify on very large heaps, in Python the interpreter
+    costs more than the comparisons, so a binary heap is the fastest to sift. A 16-ary
+    heapify saves about the cost a sift down adds for every five items, so a wide heap
+    is only chosen when it is known to be sifted down less often than that.
+    '''
+    if size >= LARGE_HEAP_SIZE and sift_downs is not None \
+            and sift_downs * SIFT_DOWN_COST < size:
+        return LARGE_HEAP_ARITY
+
+    return 2
+
+
+def _sift_up(heap: list, pos: int, arity: int, start: int = 0) -> None:
+    ''' moves the node at pos up, no further than start, until no smaller than its parent '''
+    item = heap[pos]
+
+    while pos > start:
+        parent = (pos - 1) // arity
+        if item < heap[parent]:
+            heap[pos] = heap[parent]
+            pos = parent
+            continue
+        break
+
+    heap[pos] = item
+
+
+def _sift_down(heap: list, pos: int, arity: int) -> None:
+    '''
+    moves the node at pos down to maintain the heap property
+
+    The smallest child is moved up into the gap at every level, down to a leaf, and the
+    node bubbled up from there, as it usually belongs near the bottom. The smallest of
+    the children is found by min on a slice, so a wider node costs no more Python steps.
+    '''
+    size, start, item = len(heap), pos, heap[pos]
+    child = arity * pos + 1
+
+    while child < size:
+        children = heap[child:child + arity]
+        smallest = min(children)
+        heap[pos] = smallest
+        pos = child + children.index(smallest)
+        child = arity * pos + 1
+
+    heap[pos] = item
+    _sift_up(heap, pos, arity, start)
+
+
+def _sift_down_binary(heap: list, pos: int, arity: int = 2) -> None:  # pylint: disable=unused-argument
+    ''' _sift_down for two children a node, comparing them rather than slicing '''
+    size, start, item = len(heap), pos, heap[pos]
+    child = (pos << 1) + 1
+
+    while child < size:
+        right = child + 1
+        if right < size and not heap[child] < heap[right]:
+            child = right
+        heap[pos] = heap[child]
+        pos = child
+        child = (pos << 1) + 1
+
+    heap[pos] = item
+    _sift_up(heap, pos, 2, start)
+
+
+class DaryHeap:
+    '''A min-heap held in a list, with a configurable number of children a node
+
+        Sifting down follows the smallest children to a leaf before bubbling the item
+        back up, as heapq does, which takes fewer comparisons than a textbook sift-down.
+
+        Args:
+            iterable (Iterable): the initial items of the heap
+            arity (int): the number of children a node, at least two, chosen from the
+                initial number of items and sift_downs if not given
+            sift_downs (int): the number of pops and replaces expected, see choose_arity
+    '''
+    def __init__(self, iterable: Iterable=None, arity: int=None, sift_downs: int=None) -> None:
+        self.heap: List = [] if iterable is None else list(iterable)
+        self.arity = choose_arity(len(self.heap), sift_downs) if arity is None else arity
+
+        if self.arity < 2:
+            raise ValueError('arity must be at least 2')
+
+        self.__sift_down = _sift_down_binary if self.arity == 2 else _sift_down
+        self.heapify()
+
+
+    def heapify(self) -> 'DaryHeap':
+        '''Reorganise the items so that they maintain the heap property'''
+        heap, arity, sift_down = self.heap, self.arity, self.__sift_down
+
+        for pos in range((len(heap) - 2) // arity, -1, -1):
+            sift_down(heap, pos, arity)
+
+        return self
+
+
+    def push(self, item) -> None:
+        '''Push an item onto the heap'''
+        self.heap.append(item)
+        _sift_up(self.heap, len(self.heap) - 1, self.arity)
+
+
+    def pop(self):
+        '''Pop and return the smallest item, raising IndexError if the heap is empty'''
+        heap = self.heap
+        last = heap.pop()
+
+        if not heap:
+            return last
+
+        smallest = heap[0]
+        heap[0] = last
+        self.__sift_down(heap, 0, self.arity)
+        return smallest
+
+
+    def heap_replace(self, item):
+        '''Return the smallest item, replacing it with a given item'''
+        heap = self.heap
+        smallest = heap[0]
+        heap[0] = item
+        self.__sift_down(heap, 0, self.arity)
+        return smallest
+
+
+    def pushpop(self, item):
+        '''Push an item then pop and return the smallest item'''
+        heap = self.heap
+        if heap and heap[0] < item:
+            item, heap[0] = heap[0], item
+            self.__sift_down(heap, 0, self.arity)
+        return item
+
+
+    def peek(self):
+        '''Return the smallest item without removing it'''
+        return self.heap[0]
+
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+    def __repr__(self) -> str:
+        return f'DaryHeap({self.heap!r}, arity={self.arity})'
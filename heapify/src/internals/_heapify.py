@@ -2,6 +2,14 @@
 currently a work in progress adjusted for zero indexed arrays:
 '''
 
+from bisect import insort
+from collections.abc import Sized
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List
+
+# nsmallest and nlargest sort every item when n is at least 1 / SORT_ALL_RATIO of them
+SORT_ALL_RATIO = 4
+
 def left_child(i:int) -> int:
     ''' returns the index of the left child of the node '''
     return (i << 1) + 1
@@ -51,3 +59,157 @@ def heap_replace(lst: list, val: int) -> int:
     lst[0] = val
     min_heapify(lst, 0)
     return smallest
+
+
+def sift_up(heap: list, pos: int) -> None:
+    ''' moves the node at a given index up until it is no smaller than its parent '''
+    item = heap[pos]
+
+    while pos > 0:
+        parent = get_parent(pos)
+        if item < heap[parent]:
+            # move the parent down into the gap, rather than swapping at every level
+            heap[pos] = heap[parent]
+            pos = parent
+            continue
+        break
+
+    heap[pos] = item
+
+
+def heappush(heap: list, item) -> None:
+    ''' pushes an item onto the heap, maintaining the heap property '''
+    heap.append(item)
+    sift_up(heap, len(heap) - 1)
+
+
+def heappop(heap: list):
+    ''' pops and returns the smallest item from the heap, raising IndexError if empty '''
+    last = heap.pop()
+
+    if not heap:
+        return last
+
+    smallest = heap[0]
+    heap[0] = last
+    min_heapify(heap, 0)
+    return smallest
+
+
+def heappushpop(heap: list, item):
+    '''
+    pushes an item onto the heap then pops and returns the smallest item, faster than
+    a heappush followed by a heappop as the heap is only reorganised once, if at all
+    '''
+    if heap and heap[0] < item:
+        item, heap[0] = heap[0], item
+        min_heapify(heap, 0)
+    return item
+
+
+def _decorated(iterable: Iterable, key: Callable, ascending: bool) -> Iterator:
+    '''
+    returns (key, index, item) for each item, the index rising or falling to break ties
+    so that equal keys keep their order and the items are never compared
+    '''
+    sign = 1 if ascending else -1
+    return ((key(item), sign * i, item) for i, item in enumerate(iterable))
+
+
+def _mostly_kept(n: int, iterable: Iterable) -> bool:
+    ''' returns True if n is a large part of a sized iterable, so sorting it all is faster '''
+    return isinstance(iterable, Sized) and n * SORT_ALL_RATIO >= len(iterable)
+
+
+def nsmallest(n: int, iterable: Iterable, key: Callable=None) -> list:
+    '''
+    returns a list of the n smallest items, equivalent to sorted(iterable, key=key)[:n]
+
+    Without a max-heap to hold the n smallest so far, they are held in a sorted list,
+    and only items smaller than its largest are inserted, with bisect.
+    '''
+    if n <= 0:
+        return []
+
+    if _mostly_kept(n, iterable):
+        return sorted(iterable, key=key)[:n]
+
+    items = iter(iterable) if key is None else _decorated(iterable, key, True)
+    smallest = sorted(islice(items, n))
+
+    if smallest:
+        largest = smallest[-1]
+        for item in items:
+            if item < largest:
+                insort(smallest, item)
+                smallest.pop()
+                largest = smallest[-1]
+
+    return smallest if key is None else [item for *_, item in smallest]
+
+
+def nlargest(n: int, iterable: Iterable, key: Callable=None) -> list:
+    '''
+    returns a list of the n largest items, equivalent to
+    sorted(iterable, key=key, reverse=True)[:n]
+
+    The n largest so far are held in a heap of n items, the smallest of them at the
+    root, and each further item larger than the root replaces it.
+    '''
+    if n <= 0:
+        return []
+
+    if _mostly_kept(n, iterable):
+        return sorted(iterable, key=key, reverse=True)[:n]
+
+    # a falling index means the first of equal keys is the last to be replaced
+    items = iter(iterable) if key is None else _decorated(iterable, key, False)
+    heap = heapify(list(islice(items, n)))
+
+    if heap:
+        root = heap[0]
+        for item in items:
+            if root < item:
+                heap_replace(heap, item)
+                root = heap[0]
+
+    heap.sort(reverse=True)
+    return heap if key is None else [item for *_, item in heap]
+
+
+def merge(*iterables: Iterable, key: Callable=None) -> Iterator:
+    '''
+    lazily merges sorted iterables into a single sorted iterator, equal items in the
+    order of their iterables
+
+    A heap holds one [key, order, item, iterator] entry for each iterable not yet exhausted,
+    so only the next item of each iterable is held in memory.
+    '''
+    heap: List[list] = []
+
+    for order, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for item in iterator:
+            heap.append([item if key is None else key(item), order, item, iterator])
+            break
+
+    heapify(heap)
+
+    while len(heap) > 1:
+        entry = heap[0]
+        yield entry[2]
+
+        try:
+            item = entry[2] = next(entry[3])
+        except StopIteration:
+            heappop(heap)
+            continue
+
+        # the order is unique, so entries are never compared beyond it
+        entry[0] = item if key is None else key(item)
+        min_heapify(heap, 0)
+
+    if heap:
+        _, _, item, iterator = heap[0]
+        yield item
+        yield from iterator
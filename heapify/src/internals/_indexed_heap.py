@@ -0,0 +1,194 @@
+''' Internal module for a min-heap of handles which can be reprioritised or removed '''
+
+from typing import Dict, Hashable, Iterable, Iterator, List, Tuple
+from collections.abc import Mapping
+
+__all__ = ['IndexedHeap']
+
+
+class IndexedHeap:
+    '''A min-heap of handles by priority, with the position of every handle indexed
+
+        Priorities and handles are held in parallel lists, and a handle's position is
+        updated on every move in the sift routines, so a handle is found in O(1) and
+        can be reprioritised or removed in O(log n).
+
+        e.g. tills by the time they are next free, where a till can go offline
+
+        Args:
+            items (Iterable): (handle, priority) pairs, or a mapping of handles to
+                priorities, to heapify in O(n)
+    '''
+    def __init__(self, items: Iterable[Tuple]|Mapping=None) -> None:
+        self.__priorities: List = []
+        self.__handles: List = []
+        self.__positions: Dict[Hashable, int] = {}
+
+        if items is not None:
+            for handle, priority in (items.items() if isinstance(items, Mapping) else items):
+                self.__append(handle, priority)
+
+            for pos in range((len(self.__priorities) - 2) >> 1, -1, -1):
+                self.__sift_down(pos)
+
+
+    def push(self, handle: Hashable, priority) -> None:
+        '''Push a handle with a priority, raising ValueError if it is already held'''
+        self.__append(handle, priority)
+        self.__sift_up(len(self.__priorities) - 1)
+
+
+    def pop(self) -> Tuple:
+        '''Pop the handle with the smallest priority, raising IndexError if empty
+
+            Returns: the (handle, priority) pair
+        '''
+        if not self.__priorities:
+            raise IndexError('pop from an empty heap')
+
+        return self.__remove_at(0)
+
+
+    def peek(self) -> Tuple:
+        '''Return the (handle, priority) pair with the smallest priority without removing it'''
+        if not self.__priorities:
+            raise IndexError('peek at an empty heap')
+
+        return self.__handles[0], self.__priorities[0]
+
+
+    def decrease_key(self, handle: Hashable, priority) -> None:
+        '''Lower the priority of a handle, raising ValueError if it would be raised'''
+        pos = self.__positions[handle]
+
+        if self.__priorities[pos] < priority:
+            raise ValueError(f'{priority!r} is greater than the priority of {handle!r}')
+
+        self.__priorities[pos] = priority
+        self.__sift_up(pos)
+
+
+    def increase_key(self, handle: Hashable, priority) -> None:
+        '''Raise the priority of a handle, raising ValueError if it would be lowered'''
+        pos = self.__positions[handle]
+
+        if priority < self.__priorities[pos]:
+            raise ValueError(f'{priority!r} is less than the priority of {handle!r}')
+
+        self.__priorities[pos] = priority
+        self.__sift_down(pos)
+
+
+    def update(self, handle: Hashable, priority) -> None:
+        '''Set the priority of a handle, pushing it if it is not already held'''
+        pos = self.__positions.get(handle)
+
+        if pos is None:
+            self.push(handle, priority)
+            return
+
+        self.__priorities[pos] = priority
+        self.__sift_up(pos)
+        self.__sift_down(self.__positions[handle])
+
+
+    def remove(self, handle: Hashable):
+        '''Remove a handle, raising KeyError if it is not held
+
+            Returns: the priority of the handle
+        '''
+        return self.__remove_at(self.__positions[handle])[1]
+
+
+    def items(self) -> Iterator[Tuple]:
+        '''Return an iterator of the (handle, priority) pairs in heap order'''
+        return zip(self.__handles, self.__priorities)
+
+
+    def __append(self, handle: Hashable, priority) -> None:
+        '''add a handle to the end of the heap, without restoring the heap property'''
+        if handle in self.__positions:
+            raise ValueError(f'{handle!r} is already in the heap')
+
+        self.__positions[handle] = len(self.__priorities)
+        self.__priorities.append(priority)
+        self.__handles.append(handle)
+
+
+    def __remove_at(self, pos: int) -> Tuple:
+        '''remove the handle at pos, filling its place with the last handle'''
+        priorities, handles = self.__priorities, self.__handles
+        priority, handle = priorities.pop(), handles.pop()
+        del self.__positions[handle]
+
+        if pos == len(priorities):
+            return handle, priority
+
+        removed = handles[pos], priorities[pos]
+        del self.__positions[removed[0]]
+        priorities[pos], handles[pos] = priority, handle
+        self.__positions[handle] = pos
+
+        self.__sift_up(pos)
+        self.__sift_down(self.__positions[handle])
+        return removed
+
+
+    def __sift_up(self, pos: int) -> None:
+        '''move the handle at pos up until its priority is no smaller than its parent's'''
+        priorities, handles, positions = self.__priorities, self.__handles, self.__positions
+        priority, handle = priorities[pos], handles[pos]
+
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if priority < priorities[parent]:
+                priorities[pos] = priorities[parent]
+                handles[pos] = handles[parent]
+                positions[handles[pos]] = pos
+                pos = parent
+                continue
+            break
+
+        priorities[pos], handles[pos] = priority, handle
+        positions[handle] = pos
+
+
+    def __sift_down(self, pos: int) -> None:
+        '''move the handle at pos down until its priority is no larger than its children's'''
+        priorities, handles, positions = self.__priorities, self.__handles, self.__positions
+        priority, handle = priorities[pos], handles[pos]
+        size = len(priorities)
+        child = (pos << 1) + 1
+
+        while child < size:
+            right = child + 1
+            if right < size and priorities[right] < priorities[child]:
+                child = right
+
+            if not priorities[child] < priority:
+                break
+
+            priorities[pos] = priorities[child]
+            handles[pos] = handles[child]
+            positions[handles[pos]] = pos
+            pos = child
+            child = (pos << 1) + 1
+
+        priorities[pos], handles[pos] = priority, handle
+        positions[handle] = pos
+
+
+    def __repr__(self) -> str:
+        return f'IndexedHeap({dict(self.items())!r})'
+
+
+    def __len__(self) -> int:
+        return len(self.__priorities)
+
+
+    def __contains__(self, handle: Hashable) -> bool:
+        return handle in self.__positions
+
+
+    def __getitem__(self, handle: Hashable):
+        return self.__priorities[self.__positions[handle]]
@@ -0,0 +1,161 @@
+''' Internal module for a heap ordered by a key function, as a min-heap or a max-heap '''
+# pylint: disable=duplicate-code
+
+from typing import Callable, Iterable, Iterator, List
+
+__all__ = ['KeyHeap']
+
+
+def _identity(item):
+    '''return the item as its own key'''
+    return item
+
+
+def _sift_up_min(keys: list, items: list, pos: int, start: int = 0) -> None:
+    '''move the item at pos up, no further than start, until its key is no less than its parent's'''
+    key, item = keys[pos], items[pos]
+
+    while pos > start:
+        parent = (pos - 1) >> 1
+        if key < keys[parent]:
+            keys[pos], items[pos] = keys[parent], items[parent]
+            pos = parent
+            continue
+        break
+
+    keys[pos], items[pos] = key, item
+
+
+def _sift_up_max(keys: list, items: list, pos: int, start: int = 0) -> None:
+    '''_sift_up_min for a max-heap, moving up items with a greater key'''
+    key, item = keys[pos], items[pos]
+
+    while pos > start:
+        parent = (pos - 1) >> 1
+        if keys[parent] < key:
+            keys[pos], items[pos] = keys[parent], items[parent]
+            pos = parent
+            continue
+        break
+
+    keys[pos], items[pos] = key, item
+
+
+def _sift_down_min(keys: list, items: list, pos: int) -> None:
+    '''move the item at pos down, following the least keys to a leaf then bubbling it up'''
+    size, start, key, item = len(keys), pos, keys[pos], items[pos]
+    child = (pos << 1) + 1
+
+    while child < size:
+        right = child + 1
+        if right < size and not keys[child] < keys[right]:
+            child = right
+        keys[pos], items[pos] = keys[child], items[child]
+        pos = child
+        child = (pos << 1) + 1
+
+    keys[pos], items[pos] = key, item
+    _sift_up_min(keys, items, pos, start)
+
+
+def _sift_down_max(keys: list, items: list, pos: int) -> None:
+    '''_sift_down_min for a max-heap, following the greatest keys'''
+    size, start, key, item = len(keys), pos, keys[pos], items[pos]
+    child = (pos << 1) + 1
+
+    while child < size:
+        right = child + 1
+        if right < size and not keys[right] < keys[child]:
+            child = right
+        keys[pos], items[pos] = keys[child], items[child]
+        pos = child
+        child = (pos << 1) + 1
+
+    keys[pos], items[pos] = key, item
+    _sift_up_max(keys, items, pos, start)
+
+
+class KeyHeap:
+    '''A heap of items ordered by a key function, smallest first or, reversed, largest
+
+        The key of each item is computed once and cached in a list parallel to the items,
+        so sifting compares only the cached keys, and items are never wrapped in tuples
+        or compared themselves. Items with equal keys are popped in no particular order.
+
+        Args:
+            iterable (Iterable): the initial items of the heap
+            key (Callable): a function of one argument returning the key of an item,
+                the item itself if not given
+            reverse (bool): pop the item with the largest key first, a max-heap
+    '''
+    def __init__(self, iterable: Iterable=None, key: Callable=None, reverse: bool=False) -> None:
+        self.key = _identity if key is None else key
+        self.reverse = reverse
+        self.__items: List = [] if iterable is None else list(iterable)
+        self.__keys: List = list(map(self.key, self.__items))
+
+        self.__sift_up = _sift_up_max if reverse else _sift_up_min
+        self.__sift_down = _sift_down_max if reverse else _sift_down_min
+
+        for pos in range((len(self.__items) - 2) >> 1, -1, -1):
+            self.__sift_down(self.__keys, self.__items, pos)
+
+
+    def push(self, item) -> None:
+        '''Push an item onto the heap'''
+        self.__keys.append(self.key(item))
+        self.__items.append(item)
+        self.__sift_up(self.__keys, self.__items, len(self.__items) - 1)
+
+
+    def pop(self):
+        '''Pop and return the first item, raising IndexError if the heap is empty'''
+        keys, items = self.__keys, self.__items
+        last_key, last = keys.pop(), items.pop()
+
+        if not items:
+            return last
+
+        first = items[0]
+        keys[0], items[0] = last_key, last
+        self.__sift_down(keys, items, 0)
+        return first
+
+
+    def heap_replace(self, item):
+        '''Return the first item, replacing it with a given item'''
+        keys, items = self.__keys, self.__items
+        first = items[0]
+        keys[0], items[0] = self.key(item), item
+        self.__sift_down(keys, items, 0)
+        return first
+
+
+    def pushpop(self, item):
+        '''Push an item then pop and return the first item'''
+        keys, items = self.__keys, self.__items
+        key = self.key(item)
+
+        if items and (key < keys[0] if self.reverse else keys[0] < key):
+            item, items[0] = items[0], item
+            keys[0] = key
+            self.__sift_down(keys, items, 0)
+
+        return item
+
+
+    def peek(self):
+        '''Return the first item without removing it'''
+        return self.__items[0]
+
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+
+    def __iter__(self) -> Iterator:
+        return iter(self.__items)
+
+
+    def __repr__(self) -> str:
+        return f'KeyHeap({self.__items!r}, key={self.key!r}, reverse={self.reverse!r})'
@@ -2,35 +2,166 @@
 # pylint: disable=consider-using-max-builtin
 # pylint: disable=duplicate-code
 
-from . import heap_replace
+from typing import Dict, Iterable, Iterator, List, Tuple
+from .internals._backends import (
+    BACKENDS, DEFAULT_BACKEND, DEFAULT_SOURCE, Backend, get_backend
+)
 
-# try to import the heap_replace function from the C version of heap module
-try:
-    from heap import heap_replace
-except ImportError:
-    pass
+# the heap_replace of the backend selected on import, see backend_info
+heap_replace = DEFAULT_BACKEND.heap_replace
 
-def queue_time(queue: list, num_tills: int=2) -> int:
-    ''' calculates the total queue time for a queue with a given number of tills '''
-    if not queue:
-        return 0
 
-    if len(queue) < 2:
-        return queue[0]
+def select_strategy(num_customers: int, num_tills: int, backend: Backend) -> str:
+    ''' returns the name of the fastest way to calculate a queue time of this shape '''
+    if not num_customers:
+        return 'empty'
 
-    if len(queue) == num_tills:
-        return max(queue)
+    if num_tills >= num_customers:
+        return 'max'
 
     if num_tills == 1:
+        return 'sum'
+
+    if num_tills < backend.scan_below:
+        return 'scan'
+
+    return 'heap'
+
+
+def backend_info(num_customers: int=None, num_tills: int=None, backend: str=None) -> Dict:
+    '''
+    returns the heap backend queue_time uses, where it was chosen, the backends available
+    and, given the shape of a queue, the strategy used for it
+
+    e.g.
+    print(backend_info(1000, 6))
+    {'backend': 'heapq', 'source': 'default', 'available': ['heapq', 'python'],
+     'scan_below': 0, 'strategy': 'heap'}
+    '''
+    if backend is not None:
+        selected, source = get_backend(backend), 'argument'
+    else:
+        selected, source = DEFAULT_BACKEND, DEFAULT_SOURCE
+
+    info = {
+        'backend': selected.name,
+        'source': source,
+        'available': sorted(BACKENDS),
+        'scan_below': selected.scan_below,
+    }
+
+    if num_customers is not None and num_tills is not None:
+        info['strategy'] = select_strategy(num_customers, num_tills, selected)
+
+    return info
+
+
+def queue_time(queue: list, num_tills: int=2, backend: str=None) -> int:
+    '''
+    calculates the total queue time for a queue with a given number of tills
+
+    The heap backend is the one selected on import, from the HEAPIFY_BACKEND environment
+    variable or the fastest available, unless one is named. Few tills are scanned for
+    the least loaded rather than heaped where that is faster for the backend.
+    '''
+    selected = DEFAULT_BACKEND if backend is None else get_backend(backend)
+    strategy = select_strategy(len(queue), num_tills, selected)
+
+    if strategy == 'empty':
+        return 0
+
+    if strategy == 'max':
+        return max(queue)
+
+    if strategy == 'sum':
         return sum(queue)
 
     tills = [0] * num_tills
+
+    if strategy == 'scan':
+        for t in queue:
+            tills[tills.index(min(tills))] += t
+        return max(tills)
+
+    replace = selected.heap_replace
     max_value = 0
 
     for t in queue:
         t += tills[0]
         if t > max_value:
             max_value = t
-        heap_replace(tills, t)
+        replace(tills, t)
 
     return max_value
+
+
+def queue_events(queue: Iterable, num_tills: int=2) -> Iterator[Tuple]:
+    '''
+    lazily serves each customer of a queue at the first free till, yielding a
+    (customer_index, till, start, finish) event for each, tills numbered from zero
+
+    Only the till heap is held in memory, so the queue can be any iterable, even an
+    endless stream. Tills free at the same time are used in order of their number.
+    '''
+    tills = [(0, till) for till in range(num_tills)]
+
+    for customer_index, t in enumerate(queue):
+        start, till = tills[0]
+        finish = start + t
+        heap_replace(tills, (finish, till))
+        yield customer_index, till, start, finish
+
+
+class QueueReplay:
+    '''Replay a queue customer by customer, keeping running statistics of the tills
+
+        A replay is an iterator of the events of queue_events, updating the makespan
+        so far and the time each till has been busy as it goes, in memory proportional
+        to the number of tills.
+
+        e.g.
+        replay = QueueReplay([2, 3, 10], 2)
+        for customer_index, till, start, finish in replay:
+            print(customer_index, till, start, finish, replay.makespan)
+
+        Args:
+            queue (Iterable): the time each customer takes to check out
+            num_tills (int): the number of checkout tills
+    '''
+    def __init__(self, queue: Iterable, num_tills: int=2) -> None:
+        self.num_tills = num_tills
+        self.customers = 0
+        self.makespan = 0
+        self.busy: List = [0] * num_tills
+        self.__events = queue_events(queue, num_tills)
+
+
+    def __iter__(self) -> 'QueueReplay':
+        return self
+
+
+    def __next__(self) -> Tuple:
+        event = next(self.__events)
+        _, till, start, finish = event
+
+        self.busy[till] += finish - start
+        self.customers += 1
+        if finish > self.makespan:
+            self.makespan = finish
+
+        return event
+
+
+    def run(self) -> int:
+        '''Replay the rest of the queue, returning the makespan'''
+        for _ in self:
+            pass
+        return self.makespan
+
+
+    def utilisation(self) -> List[float]:
+        '''Return the fraction of the makespan so far each till has been busy'''
+        if not self.makespan:
+            return [0.0] * self.num_tills
+
+        return [busy / self.makespan for busy in self.busy]
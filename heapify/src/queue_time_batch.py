@@ -0,0 +1,85 @@
+''' Calculate the total queue time of many queues at once, vectorised across them '''
+
+from typing import Dict, Iterable, List, Sequence
+from .queue_time import queue_time
+
+# NumPy is optional, without it each queue is calculated in turn with queue_time
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
+
+def _percentile(ordered: List, percentile: float) -> float:
+    ''' returns a percentile of ordered values, interpolating linearly as NumPy does '''
+    position = (len(ordered) - 1) * percentile / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _makespans(queues, num_tills: int):
+    ''' returns the queue time of every row of a 2-D array, advancing all rows together '''
+    if isinstance(queues, np.ndarray):
+        scenarios = queues
+    else:
+        # shorter queues are padded with zeros, which never change a queue time
+        rows = [list(queue) for queue in queues]
+        width = max(map(len, rows), default=0)
+        scenarios = np.array([row + [0] * (width - len(row)) for row in rows])
+        scenarios = scenarios.reshape(len(rows), width)
+
+    if scenarios.ndim != 2:
+        raise ValueError('queues must be a 2-D array, one queue a row')
+
+    tills = np.zeros((len(scenarios), num_tills), dtype=scenarios.dtype)
+    rows = np.arange(len(scenarios))
+
+    # each customer goes to the least loaded till of their row, a zero pads a short queue
+    for customers in scenarios.T:
+        tills[rows, tills.argmin(axis=1)] += customers
+
+    return tills.max(axis=1)
+
+
+def queue_time_batch(
+    queues: Iterable[Sequence],
+    num_tills: int=2,
+    percentiles: Iterable[float]=DEFAULT_PERCENTILES
+) -> Dict:
+    """
+    Calculate the total queue time of many queues with the same number of tills
+
+    With NumPy, the queues become the rows of a 2-D array, shorter queues padded with
+    zeros, and each step serves the next customer of every queue at once, at the
+    least loaded till of its row. Without NumPy, each queue is passed to queue_time.
+    Queue times of integers match queue_time exactly, those of floats to rounding, as
+    queue_time sums the customers of a single till with sum(), which compensates for
+    rounding from Python 3.12.
+
+    Args:
+        queues (Iterable): the queues, each a sequence of customer times, or a 2-D
+            NumPy array of them padded with zeros
+        num_tills (int): the number of checkout tills
+        percentiles (Iterable): the percentiles of the queue times to report
+    Returns:
+        Dict: the queue time of each queue, a NumPy array with NumPy, and the
+        requested percentiles of them
+
+        e.g.
+        print(queue_time_batch([[2, 3, 10], [2, 2, 2]], 2, percentiles=[50]))
+        {'makespans': array([12,  4]), 'percentiles': {50: 8.0}}
+    """
+    points = list(percentiles)
+
+    if np is not None:
+        makespans = _makespans(queues, num_tills)
+        values = np.percentile(makespans, points).tolist() if len(makespans) else []
+    else:
+        makespans = [queue_time(list(queue), num_tills) for queue in queues]
+        ordered = sorted(makespans)
+        values = [_percentile(ordered, point) for point in points] if ordered else []
+
+    return {'makespans': makespans, 'percentiles': dict(zip(points, values))}
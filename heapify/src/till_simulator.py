@@ -0,0 +1,157 @@
+''' Simulate tills serving customers who arrive over time, event by event '''
+# pylint: disable=consider-using-max-builtin
+
+from array import array
+from collections import deque
+from math import inf
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+from . import heappush, heappop, IndexedHeap
+from .queue_time_batch import DEFAULT_PERCENTILES, _percentile
+
+# events at the same time are handled in this order, so a till closing as it finishes a
+# customer takes no more, and tills free at the same time are all free to choose from
+_CLOSE, _FINISH, _OPEN = range(3)
+
+
+class Till(NamedTuple):
+    '''A till, serving work at speed per unit of time between its opening and closing'''
+    speed: float = 1.0
+    opens: float = 0.0
+    closes: float = inf
+
+
+class TillSimulator:  # pylint: disable=too-few-public-methods
+    '''A discrete-event simulation of customers in one queue served by tills
+
+        Customers join the back of the queue as they arrive, and the front customer is
+        served by the fastest free till, the first of equally fast tills. A till which
+        closes finishes its customer first.
+
+        Two heaps drive the simulation, an IndexedHeap of the free tills by speed and a
+        heap of pending till events, finishing a customer, opening and closing. Arrivals
+        are read from the customers in order rather than pushed as events, so both heaps
+        hold at most a few events a till and a run takes O(n log k) time for n customers
+        and k tills.
+
+        e.g.
+        simulator = TillSimulator([Till(), Till(speed=2.0, opens=5.0)])
+        result = simulator.run([(0, 4), (1, 6), (6, 2)])
+
+        Args:
+            tills (Iterable[Till]): the tills, numbered from zero in order
+    '''
+    def __init__(self, tills: Iterable[Till]) -> None:
+        self.tills: List[Till] = [Till(*till) for till in tills]
+
+
+    def run(
+        self,
+        customers: Iterable[Tuple],
+        percentiles: Iterable[float]=DEFAULT_PERCENTILES
+    ) -> Dict:
+        """
+        Run the simulation to the last event
+
+        Args:
+            customers (Iterable): (arrival, work) pairs in order of arrival, the work
+                taking work / speed to serve at a till
+            percentiles (Iterable): the percentiles of the wait times to report
+        Returns:
+            Dict: the number of customers served, those left unserved when every till
+            has closed, the time the last customer finished, the wait of every served
+            customer in order of arrival, their mean and percentiles, and the time each
+            till was busy and the number of customers it served
+        """
+        run = _Run(self.tills)
+        last_arrival = -inf
+
+        for arrival, work in customers:
+            if arrival < last_arrival:
+                raise ValueError(f'customer arriving at {arrival!r} is out of order')
+            last_arrival = arrival
+            run.advance(arrival)
+            run.waiting.append((arrival, work))
+            run.dispatch()
+
+        run.advance(inf)
+
+        waits = run.waits
+        ordered = sorted(waits)
+        points = list(percentiles)
+
+        return {
+            'served': len(waits),
+            'unserved': len(run.waiting),
+            'makespan': run.makespan,
+            'waits': waits,
+            'mean_wait': sum(waits) / len(waits) if waits else None,
+            'percentiles': {
+                point: _percentile(ordered, point) for point in points
+            } if ordered else {},
+            'busy': run.busy,
+            'customers_served': run.customers_served,
+        }
+
+
+class _Run:  # pylint: disable=too-many-instance-attributes
+    '''the state of one run of a TillSimulator'''
+
+    def __init__(self, tills: List[Till]) -> None:
+        self.tills = tills
+        self.now = -inf
+        self.makespan = 0
+        self.waiting: deque = deque()
+        self.waits = array('d')
+        self.busy: List = [0] * len(tills)
+        self.customers_served: List = [0] * len(tills)
+        self.closed: List = [False] * len(tills)
+        self.free = IndexedHeap()
+        self.events: List = []
+
+        for till, (_, opens, closes) in enumerate(tills):
+            if opens < closes:
+                heappush(self.events, (opens, _OPEN, till))
+                if closes < inf:
+                    heappush(self.events, (closes, _CLOSE, till))
+
+
+    def advance(self, until: float) -> None:
+        '''handle every event up to and including until, serving customers as tills free'''
+        events = self.events
+
+        while events and events[0][0] <= until:
+            self.now = now = events[0][0]
+
+            while events and events[0][0] == now:
+                _, kind, till = heappop(events)
+
+                if kind == _CLOSE:
+                    self.closed[till] = True
+                    if till in self.free:
+                        self.free.remove(till)
+                elif not self.closed[till]:
+                    self.free.push(till, (-self.tills[till].speed, till))
+
+            self.dispatch()
+
+        if until < inf:
+            self.now = until
+
+
+    def dispatch(self) -> None:
+        '''serve waiting customers at the fastest free tills'''
+        waiting, free, now = self.waiting, self.free, self.now
+
+        while waiting and free:
+            till, _ = free.pop()
+            arrival, work = waiting.popleft()
+            duration = work / self.tills[till].speed
+            finish = now + duration
+
+            self.waits.append(now - arrival)
+            self.busy[till] += duration
+            self.customers_served[till] += 1
+            if finish > self.makespan:
+                self.makespan = finish
+
+            heappush(self.events, (finish, _FINISH, till))
@@ -0,0 +1,59 @@
+import random
+from pytest import mark
+from heapify.src.capacity import CapacityPlanner, min_tills, min_tills_many
+from heapify.src.queue_time import queue_time
+
+RANDOM = random.Random(0)
+QUEUES = [[RANDOM.randint(1, 30) for _ in range(RANDOM.randint(1, 60))] for _ in range(100)]
+
+
+def min_tills_by_scan(queue: list, target: float):
+    for num_tills in range(1, len(queue) + 1):
+        if queue_time(queue, num_tills) <= target:
+            return num_tills
+    return None
+
+
+@mark.describe('tests for min_tills and CapacityPlanner')
+class TestCapacity():
+
+    @mark.it('finds the fewest tills, matching a scan of every number of tills')
+    def test_matches_scan(self):
+        for queue in QUEUES:
+            for target in (max(queue) - 1, max(queue), sum(queue) / 3, sum(queue) / 2 + 0.5):
+                assert min_tills(queue, target) == min_tills_by_scan(queue, target)
+
+    @mark.it('passes the examples, an empty queue needing no tills')
+    def test_examples(self):
+        assert min_tills([2, 3, 10, 4, 6], 13) == 2
+        assert min_tills([2, 3, 10], 9) is None
+        assert min_tills([], 5) == 0
+        assert min_tills([0, 0], 0) == 1
+
+    @mark.it('reuses its simulations across targets, skipping those the bounds decide')
+    def test_reuses_probes(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            'heapify.src.capacity.queue_time',
+            lambda queue, num_tills: calls.append(num_tills) or queue_time(queue, num_tills)
+        )
+        queue = [RANDOM.randint(1, 100) for _ in range(500)]
+        planner = CapacityPlanner(queue)
+        targets = sorted({queue_time(queue, num_tills) for num_tills in range(1, 40)})
+
+        answers = [planner.min_tills(target) for target in targets]
+        assert answers == [min_tills_by_scan(queue, target) for target in targets]
+        assert len(calls) == len(set(calls))
+        assert planner.queue_time(1) == sum(queue)
+
+
+@mark.describe('tests for min_tills_many')
+class TestCapacityMany():
+
+    @mark.it('plans every queue for every target, in this process or a process pool')
+    @mark.parametrize('workers', [1, 2])
+    def test_many(self, workers):
+        targets = [30, 100, 400]
+        expected = [[min_tills(queue, target) for target in targets] for queue in QUEUES]
+
+        assert min_tills_many(QUEUES, targets, workers) == expected
@@ -0,0 +1,74 @@
+''' Test suite for DaryHeap '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import heapq
+import random
+from pytest import mark, raises
+from heapify.src import DaryHeap, choose_arity
+from heapify.src.internals import _dary_heap
+
+RANDOM = random.Random(0)
+ITEMS = [RANDOM.randint(0, 50) for _ in range(300)]
+
+
+def is_heap(heap: DaryHeap) -> bool:
+    items, arity = heap.heap, heap.arity
+    return all(items[(i - 1) // arity] <= items[i] for i in range(1, len(items)))
+
+
+@mark.describe('Tests for DaryHeap')
+class TestDaryHeap:
+
+    @mark.it('heapifies the initial items for any arity')
+    @mark.parametrize('arity', [2, 3, 4, 8, 16])
+    def test_heapify(self, arity):
+        heap = DaryHeap(ITEMS, arity)
+
+        assert is_heap(heap) and len(heap) == len(ITEMS)
+        assert heap.peek() == min(ITEMS)
+
+
+    @mark.it('pushes and pops items in order, matching heapq')
+    @mark.parametrize('arity', [2, 3, 4, 8])
+    def test_push_pop(self, arity):
+        heap, expected = DaryHeap(arity=arity), []
+        for item in ITEMS:
+            heap.push(item)
+            heapq.heappush(expected, item)
+            assert is_heap(heap) and heap.peek() == expected[0]
+
+        assert [heap.pop() for _ in ITEMS] == [heapq.heappop(expected) for _ in ITEMS]
+        assert not expected
+        with raises(IndexError):
+            heap.pop()
+
+
+    @mark.it('replaces and pushpops the smallest item, matching heapq')
+    @mark.parametrize('arity', [2, 4])
+    def test_replace(self, arity):
+        heap, expected = DaryHeap(ITEMS[:50], arity), ITEMS[:50]
+        heapq.heapify(expected)
+
+        for item in ITEMS[50:150]:
+            assert heap.heap_replace(item) == heapq.heapreplace(expected, item)
+        for item in ITEMS[150:]:
+            assert heap.pushpop(item) == heapq.heappushpop(expected, item)
+            assert is_heap(heap)
+
+        assert DaryHeap().pushpop(1) == 1
+
+
+    @mark.it('chooses a wide arity only for large heaps rarely sifted down')
+    def test_arity(self, monkeypatch):
+        monkeypatch.setattr(_dary_heap, 'LARGE_HEAP_SIZE', 100)
+        wide = _dary_heap.LARGE_HEAP_ARITY
+
+        assert choose_arity(99, 0) == 2 and choose_arity(100, 0) == wide
+        assert choose_arity(100, 19) == wide and choose_arity(100, 20) == 2
+        assert choose_arity(10**9) == 2
+        assert DaryHeap(range(10), sift_downs=0).arity == 2
+        assert DaryHeap(ITEMS).arity == 2
+        assert DaryHeap(ITEMS, sift_downs=len(ITEMS) // 10).arity == wide
+        with raises(ValueError):
+            DaryHeap(ITEMS, arity=1)
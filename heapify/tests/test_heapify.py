@@ -0,0 +1,108 @@
+''' Test suite for the heap functions '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import heapq
+import random
+from pytest import mark, raises
+from heapify.src import (
+    heapify, heap_replace, heappush, heappop, heappushpop, nsmallest, nlargest, merge
+)
+
+RANDOM = random.Random(0)
+ITEMS = [RANDOM.randint(0, 50) for _ in range(200)]
+
+
+def is_heap(heap: list) -> bool:
+    return all(heap[(i - 1) >> 1] <= heap[i] for i in range(1, len(heap)))
+
+
+@mark.describe('Tests for heapify and heap_replace')
+class TestHeapify:
+
+    @mark.it('reorganises a list in place to maintain the heap property')
+    def test_heapify(self):
+        heap = ITEMS.copy()
+        assert heapify(heap) is heap
+        assert is_heap(heap) and sorted(heap) == sorted(ITEMS)
+
+
+    @mark.it('returns the smallest item, replacing it with a given value')
+    def test_heap_replace(self):
+        heap = heapify(ITEMS.copy())
+        assert heap_replace(heap, 25) == min(ITEMS)
+        assert is_heap(heap)
+
+
+@mark.describe('Tests for heappush, heappop and heappushpop')
+class TestPushPop:
+
+    @mark.it('pushes items maintaining the heap property, and pops them in order')
+    def test_push_pop(self):
+        heap = []
+        for item in ITEMS:
+            heappush(heap, item)
+            assert is_heap(heap)
+
+        assert [heappop(heap) for _ in ITEMS] == sorted(ITEMS)
+        with raises(IndexError):
+            heappop(heap)
+
+
+    @mark.it('pushes then pops, matching heapq.heappushpop')
+    def test_heappushpop(self):
+        heap, expected = [], []
+        assert heappushpop(heap, 5) == heapq.heappushpop(expected, 5)
+
+        heap, expected = heapify(ITEMS[:20]), ITEMS[:20]
+        heapq.heapify(expected)
+        for item in ITEMS[20:]:
+            assert heappushpop(heap, item) == heapq.heappushpop(expected, item)
+            assert is_heap(heap)
+
+
+@mark.describe('Tests for nsmallest and nlargest')
+class TestNSmallestLargest:
+
+    @mark.it('matches heapq with and without a key, including ties and out of range n')
+    @mark.parametrize('n', [-1, 0, 1, 5, 199, 200, 500])
+    def test_matches_heapq(self, n):
+        pairs = [(item, i) for i, item in enumerate(ITEMS)]
+        by_first = lambda pair: pair[0]  # pylint: disable=unnecessary-lambda-assignment
+
+        assert nsmallest(n, ITEMS) == heapq.nsmallest(n, ITEMS)
+        assert nsmallest(n, iter(ITEMS)) == heapq.nsmallest(n, ITEMS)
+        assert nlargest(n, iter(ITEMS)) == heapq.nlargest(n, ITEMS)
+        assert nsmallest(n, pairs, key=by_first) == heapq.nsmallest(n, pairs, key=by_first)
+        assert nlargest(n, pairs, key=by_first) == heapq.nlargest(n, pairs, key=by_first)
+
+
+    @mark.it('never compares the items when given a key')
+    def test_key_only(self):
+        items = [{'time': time} for time in ITEMS]
+        time = lambda item: item['time']  # pylint: disable=unnecessary-lambda-assignment
+
+        assert nsmallest(3, items, key=time) == sorted(items, key=time)[:3]
+        assert nlargest(3, items, key=time) == sorted(items, key=time, reverse=True)[:3]
+
+
+@mark.describe('Tests for merge')
+class TestMerge:
+
+    @mark.it('lazily merges sorted iterables, matching heapq.merge')
+    def test_merge(self):
+        runs = [sorted(ITEMS[i::3]) for i in range(3)] + [[], [7]]
+
+        merged = merge(*map(iter, runs))
+        assert next(merged) == min(ITEMS)
+        assert [min(ITEMS), *merged] == list(heapq.merge(*runs))
+        assert not list(merge()) and list(merge([], [1, 2])) == [1, 2]
+
+
+    @mark.it('merges by key, equal keys in the order of their iterables')
+    def test_merge_key(self):
+        runs = [[(1, 'a'), (3, 'a')], [(1, 'b'), (2, 'b')], [(1, 'c')]]
+        first = lambda pair: pair[0]  # pylint: disable=unnecessary-lambda-assignment
+
+        assert list(merge(*runs, key=first)) == list(heapq.merge(*runs, key=first))
+        assert [pair[1] for pair in merge(*runs, key=first)][:3] == ['a', 'b', 'c']
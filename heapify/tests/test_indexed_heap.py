@@ -0,0 +1,108 @@
+''' Test suite for IndexedHeap '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import random
+from pytest import mark, raises
+from heapify.src import IndexedHeap
+
+RANDOM = random.Random(0)
+PRIORITIES = {f'till-{i}': RANDOM.randint(0, 100) for i in range(200)}
+
+
+def is_valid(heap: IndexedHeap) -> bool:
+    pairs = list(heap.items())
+    return all(pairs[(i - 1) >> 1][1] <= pairs[i][1] for i in range(1, len(pairs))) \
+        and all(heap[handle] == priority for handle, priority in pairs)
+
+
+def pop_all(heap: IndexedHeap) -> list:
+    return [heap.pop()[1] for _ in range(len(heap))]
+
+
+@mark.describe('Tests for IndexedHeap')
+class TestIndexedHeap:
+
+    @mark.it('heapifies a mapping or pairs, and pops the handles in priority order')
+    def test_heapify_pop(self):
+        heap = IndexedHeap(PRIORITIES)
+
+        assert is_valid(heap) and len(heap) == len(PRIORITIES)
+        assert heap.peek()[1] == min(PRIORITIES.values())
+        assert pop_all(heap) == sorted(PRIORITIES.values())
+        assert pop_all(IndexedHeap(PRIORITIES.items())) == sorted(PRIORITIES.values())
+
+        with raises(IndexError):
+            heap.pop()
+        with raises(IndexError):
+            heap.peek()
+
+
+    @mark.it('pushes handles, rejecting one already held')
+    def test_push(self):
+        heap = IndexedHeap()
+        for handle, priority in PRIORITIES.items():
+            heap.push(handle, priority)
+            assert is_valid(heap)
+
+        assert 'till-0' in heap and 'till-x' not in heap
+        with raises(ValueError):
+            heap.push('till-0', 1)
+
+
+    @mark.it('decreases and increases the priority of a handle')
+    def test_change_key(self):
+        heap, expected = IndexedHeap(PRIORITIES), dict(PRIORITIES)
+
+        for handle in list(PRIORITIES)[::3]:
+            expected[handle] -= 50
+            heap.decrease_key(handle, expected[handle])
+            assert is_valid(heap)
+        for handle in list(PRIORITIES)[1::3]:
+            expected[handle] += 50
+            heap.increase_key(handle, expected[handle])
+            assert is_valid(heap)
+
+        assert heap.peek()[1] == min(expected.values())
+        assert pop_all(heap) == sorted(expected.values())
+
+
+    @mark.it('rejects a change of priority in the wrong direction or of an unknown handle')
+    def test_change_key_errors(self):
+        heap = IndexedHeap({'a': 5})
+
+        with raises(ValueError):
+            heap.decrease_key('a', 6)
+        with raises(ValueError):
+            heap.increase_key('a', 4)
+        with raises(KeyError):
+            heap.decrease_key('b', 1)
+
+
+    @mark.it('sets the priority of a handle with update, pushing it if not held')
+    def test_update(self):
+        heap, expected = IndexedHeap(PRIORITIES), dict(PRIORITIES)
+
+        for handle in PRIORITIES:
+            expected[handle] = RANDOM.randint(0, 100)
+            heap.update(handle, expected[handle])
+            assert is_valid(heap)
+
+        heap.update('new', -1)
+        assert heap.peek() == ('new', -1)
+
+
+    @mark.it('removes any handle, returning its priority')
+    def test_remove(self):
+        heap, expected = IndexedHeap(PRIORITIES), dict(PRIORITIES)
+
+        for handle in list(PRIORITIES)[::2]:
+            assert heap.remove(handle) == expected.pop(handle)
+            assert handle not in heap and is_valid(heap)
+
+        last_handle = list(heap.items())[-1][0]
+        assert heap.remove(last_handle) == expected.pop(last_handle)
+        assert pop_all(heap) == sorted(expected.values())
+
+        with raises(KeyError):
+            heap.remove('till-0')
@@ -0,0 +1,72 @@
+''' Test suite for KeyHeap '''
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import random
+from operator import itemgetter
+from pytest import mark, raises
+from heapify.src import KeyHeap
+
+RANDOM = random.Random(0)
+RECORDS = [{'till': i, 'free_at': RANDOM.randint(0, 50)} for i in range(200)]
+FREE_AT = itemgetter('free_at')
+
+
+class Uncomparable:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __lt__(self, other):
+        raise TypeError('items should never be compared')
+
+
+def pop_keys(heap: KeyHeap) -> list:
+    return [FREE_AT(heap.pop()) for _ in range(len(heap))]
+
+
+@mark.describe('Tests for KeyHeap')
+class TestKeyHeap:
+
+    @mark.it('heapifies and pops items by key, smallest first or largest if reversed')
+    @mark.parametrize('reverse', [False, True])
+    def test_heapify_pop(self, reverse):
+        heap = KeyHeap(RECORDS, key=FREE_AT, reverse=reverse)
+        expected = sorted(map(FREE_AT, RECORDS), reverse=reverse)
+
+        assert len(heap) == len(RECORDS) and FREE_AT(heap.peek()) == expected[0]
+        assert pop_keys(heap) == expected
+        with raises(IndexError):
+            heap.pop()
+
+
+    @mark.it('pushes, replaces and pushpops items by key')
+    @mark.parametrize('reverse', [False, True])
+    def test_push_replace(self, reverse):
+        heap, expected = KeyHeap(key=FREE_AT, reverse=reverse), []
+        for record in RECORDS[:100]:
+            heap.push(record)
+            expected.append(FREE_AT(record))
+
+        first = max if reverse else min
+        for record in RECORDS[100:150]:
+            assert FREE_AT(heap.heap_replace(record)) == first(expected)
+            expected.remove(first(expected))
+            expected.append(FREE_AT(record))
+        for record in RECORDS[150:]:
+            expected.append(FREE_AT(record))
+            assert FREE_AT(heap.pushpop(record)) == first(expected)
+            expected.remove(first(expected))
+
+        assert pop_keys(heap) == sorted(expected, reverse=reverse)
+
+
+    @mark.it('orders items by themselves without a key, and never compares items with one')
+    def test_key(self):
+        values = [record['free_at'] for record in RECORDS]
+        heap = KeyHeap(values)
+        assert [heap.pop() for _ in values] == sorted(values)
+
+        heap = KeyHeap(map(Uncomparable, values), key=lambda item: item.value)
+        heap.push(Uncomparable(-1))
+        assert heap.pushpop(Uncomparable(-2)).value == -2
+        assert [heap.pop().value for _ in range(len(heap))] == sorted(values + [-1])
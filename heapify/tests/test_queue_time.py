@@ -1,5 +1,12 @@
-from pytest import mark
-from heapify.src.queue_time import queue_time
+import os
+import random
+import subprocess
+import sys
+from pytest import mark, raises, warns
+from heapify.src.internals import _backends
+from heapify.src.queue_time import (
+    queue_time, queue_events, QueueReplay, backend_info, select_strategy
+)
 
 @mark.describe('various tests for queue_time')
 class TestQueueTime():
@@ -36,3 +43,101 @@ class TestQueueTime():
         assert queue_time([2, 3, 10], 2) == 12
         assert queue_time([2, 2, 2], 2) == 4
         assert queue_time([6, 2, 4, 5, 3, 2], 3) == 8
+
+
+@mark.describe('tests for queue_events and QueueReplay')
+class TestQueueReplay():
+
+    @mark.it('yields an event for each customer at the first free till, lowest number first')
+    def test_queue_events(self):
+        assert list(queue_events([2, 3, 10], 2)) == [
+            (0, 0, 0, 2), (1, 1, 0, 3), (2, 0, 2, 12)
+        ]
+        assert not list(queue_events([], 3))
+
+    @mark.it('consumes any iterable lazily, the last finish matching queue_time')
+    def test_lazy(self):
+        rand = random.Random(0)
+        queue = [rand.randint(1, 100) for _ in range(1000)]
+        events = queue_events(iter(queue), 6)
+
+        assert next(events) == (0, 0, 0, queue[0])
+        assert max(finish for *_, finish in events) == queue_time(queue, 6)
+
+        endless = queue_events(iter(lambda: 1, None), 2)
+        assert [next(endless)[3] for _ in range(4)] == [1, 1, 2, 2]
+
+    @mark.it('keeps the running makespan and utilisation of each till')
+    def test_replay(self):
+        replay = QueueReplay(iter([2, 3, 10]), 2)
+        assert replay.utilisation() == [0.0, 0.0]
+
+        next(replay)
+        assert replay.makespan == 2 and replay.utilisation() == [1.0, 0.0]
+
+        assert replay.run() == 12 and replay.customers == 3
+        assert replay.busy == [12, 3] and replay.utilisation() == [1.0, 0.25]
+
+
+@mark.describe('tests for the heap backends of queue_time')
+class TestBackends():
+
+    @mark.it('gives the same queue time with every backend and number of tills')
+    @mark.parametrize('backend', sorted(_backends.BACKENDS))
+    def test_backends_agree(self, backend):
+        rand = random.Random(0)
+        queue = [rand.randint(1, 100) for _ in range(300)]
+
+        for num_tills in (1, 2, 5, 15, 16, 40, 300, 301):
+            assert queue_time(queue, num_tills, backend) == queue_time(queue, num_tills)
+
+    @mark.it('returns the longest customer when there are more tills than customers')
+    def test_more_tills_than_customers(self):
+        assert queue_time([2, 9, 4], 10) == 9
+        assert select_strategy(3, 10, _backends.get_backend('python')) == 'max'
+
+    @mark.it('selects a strategy by the shape of the queue and the backend')
+    def test_select_strategy(self):
+        python, heapq = _backends.get_backend('python'), _backends.get_backend('heapq')
+
+        assert select_strategy(0, 2, heapq) == 'empty'
+        assert select_strategy(10, 1, heapq) == 'sum'
+        assert select_strategy(100, 6, python) == 'scan'
+        assert select_strategy(100, 6, heapq) == 'heap'
+        assert select_strategy(100, python.scan_below, python) == 'heap'
+
+    @mark.it('reports the backend, where it was chosen and the strategy for a queue')
+    def test_backend_info(self):
+        info = backend_info(100, 6, backend='python')
+        assert info['backend'] == 'python' and info['source'] == 'argument'
+        assert info['strategy'] == 'scan' and 'heapq' in info['available']
+        assert 'strategy' not in backend_info()
+
+    @mark.it('selects a backend named in the environment, warning of one not available')
+    def test_environment(self, monkeypatch):
+        monkeypatch.setenv(_backends.BACKEND_ENV_VAR, 'python')
+        selected, source = _backends._select_default()  # pylint: disable=protected-access
+        assert selected.name == 'python' and source == 'environment'
+
+        # the default was chosen on import, so a later change to the environment is not it
+        info = backend_info()
+        assert info['backend'] == _backends.DEFAULT_BACKEND.name
+        assert info['source'] == _backends.DEFAULT_SOURCE
+
+        monkeypatch.setenv(_backends.BACKEND_ENV_VAR, 'missing')
+        with warns(RuntimeWarning, match='missing'):
+            selected, source = _backends._select_default()  # pylint: disable=protected-access
+        assert selected.name in ('native', 'heapq') and source == 'default'
+        with raises(ValueError):
+            queue_time([1, 2, 3], 2, backend='missing')
+
+    @mark.it('imports with a backend in the environment which is not available')
+    def test_environment_import(self):
+        env = {**os.environ, _backends.BACKEND_ENV_VAR: 'missing'}
+        script = 'from heapify.src.queue_time import queue_time; print(queue_time([1, 2, 3], 2))'
+        result = subprocess.run(
+            [sys.executable, '-c', script], env=env, capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == '4'
+        assert 'RuntimeWarning' in result.stderr
@@ -0,0 +1,62 @@
+import random
+from pytest import fixture, mark, raises, approx
+from heapify.src import queue_time_batch as batch_module
+from heapify.src.queue_time import queue_time
+from heapify.src.queue_time_batch import queue_time_batch
+
+RANDOM = random.Random(0)
+QUEUES = [[RANDOM.randint(1, 100) for _ in range(40)] for _ in range(300)]
+
+
+@fixture(name='with_numpy', params=[True, False], ids=['numpy', 'pure python'])
+def fixture_with_numpy(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(batch_module, 'np', None)
+    elif batch_module.np is None:
+        request.applymarker(mark.skip(reason='NumPy is not installed'))
+    return request.param
+
+
+@mark.describe('tests for queue_time_batch')
+class TestQueueTimeBatch():
+
+    @mark.it('matches queue_time exactly for integers, and to rounding for floats')
+    @mark.parametrize('num_tills', [1, 2, 6, 40, 50])
+    def test_matches_queue_time(self, with_numpy, num_tills):  # pylint: disable=unused-argument
+        result = queue_time_batch(QUEUES, num_tills)
+        assert list(result['makespans']) == [queue_time(queue, num_tills) for queue in QUEUES]
+
+        floats = [[t / 7 for t in queue] for queue in QUEUES]
+        expected = [queue_time(queue, num_tills) for queue in floats]
+        assert list(queue_time_batch(floats, num_tills)['makespans']) == approx(expected)
+
+    @mark.it('accepts queues of different lengths, or rows padded with zeros')
+    def test_padding(self, with_numpy):  # pylint: disable=unused-argument
+        result = queue_time_batch([[2, 3, 10, 0, 0], [2, 2, 2, 0, 0], [5, 0, 0, 0, 0]], 2)
+        assert list(result['makespans']) == [12, 4, 5]
+
+        result = queue_time_batch([[2, 3, 10], [2, 2, 2, 4, 1], [5], []], 2)
+        assert list(result['makespans']) == [12, 6, 5, 0]
+
+    @mark.it('reports percentiles of the queue times, as numpy.percentile does')
+    def test_percentiles(self, with_numpy):  # pylint: disable=unused-argument
+        makespans = sorted(queue_time(queue, 3) for queue in QUEUES)
+        result = queue_time_batch(iter(QUEUES), 3, percentiles=[0, 12.5, 50, 100])
+
+        assert result['percentiles'][0] == makespans[0]
+        assert result['percentiles'][100] == makespans[-1]
+        assert result['percentiles'][50] == approx((makespans[149] + makespans[150]) / 2)
+        assert result['percentiles'][12.5] == approx(
+            makespans[37] + (makespans[38] - makespans[37]) * 0.375
+        )
+
+    @mark.it('returns no percentiles for no queues, and rejects queues not in rows')
+    def test_edge_cases(self, with_numpy):
+        assert not queue_time_batch([], 2)['percentiles']
+
+        with raises(TypeError):
+            queue_time_batch([1, 2, 3], 2)
+
+        if with_numpy:
+            with raises(ValueError):
+                queue_time_batch(batch_module.np.array([1, 2, 3]), 2)
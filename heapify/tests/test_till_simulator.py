@@ -0,0 +1,52 @@
+import random
+from pytest import mark, raises
+from heapify.src.queue_time import queue_time
+from heapify.src.till_simulator import Till, TillSimulator
+
+
+@mark.describe('tests for TillSimulator')
+class TestTillSimulator():
+
+    @mark.it('matches queue_time when every customer is present at the start')
+    @mark.parametrize('num_tills', [1, 2, 6])
+    def test_matches_queue_time(self, num_tills):
+        rand = random.Random(num_tills)
+        queue = [rand.randint(1, 100) for _ in range(500)]
+        result = TillSimulator([Till()] * num_tills).run((0, t) for t in queue)
+
+        assert result['makespan'] == queue_time(queue, num_tills)
+        assert result['served'] == 500 and result['unserved'] == 0
+        assert sum(result['customers_served']) == 500
+
+    @mark.it('serves arrivals at the fastest free till, tills opening late')
+    def test_arrivals_and_speeds(self):
+        simulator = TillSimulator([Till(), Till(speed=2.0, opens=5.0)])
+        result = simulator.run([(0, 4), (1, 6), (6, 2)])
+
+        assert list(result['waits']) == [0.0, 3.0, 0.0]
+        assert result['makespan'] == 10.0 and result['mean_wait'] == 1.0
+        assert result['busy'] == [10.0, 1.0] and result['customers_served'] == [2, 1]
+
+        result = TillSimulator([Till(), Till(speed=4.0)]).run([(0, 8), (0, 8)])
+        assert result['customers_served'] == [1, 1] and result['makespan'] == 8.0
+
+    @mark.it('lets a closing till finish its customer, leaving the rest unserved')
+    def test_closing(self):
+        simulator = TillSimulator([Till(closes=3.0), Till(opens=2.0, closes=2.0)])
+        result = simulator.run([(0, 5), (1, 1), (4, 1)])
+
+        assert result['served'] == 1 and result['unserved'] == 2
+        assert result['makespan'] == 5.0 and result['busy'] == [5.0, 0]
+
+    @mark.it('reports percentiles of the waits, and none without customers')
+    def test_percentiles(self):
+        result = TillSimulator([Till()]).run([(0, 1)] * 5, percentiles=[0, 50, 100])
+        assert result['percentiles'] == {0: 0.0, 50: 2.0, 100: 4.0}
+
+        result = TillSimulator([Till()]).run([])
+        assert result['percentiles'] == {} and result['mean_wait'] is None
+
+    @mark.it('rejects customers out of order of arrival')
+    def test_out_of_order(self):
+        with raises(ValueError):
+            TillSimulator([Till()]).run([(2, 1), (1, 1)])